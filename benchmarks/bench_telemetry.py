@@ -0,0 +1,313 @@
+"""End-to-end telemetry benchmark against simulated grills.
+
+Sets up one config entry per grill the way Home Assistant does, through
+the integration's own setup and entity platforms, with
+``SimulatedCampChefClient`` standing in for the Bluetooth link, and
+measures, for 1, 10 and 50 grills:
+
+* notification-to-state-written latency,
+* state writes per second,
+* event-loop time spent per notification.
+
+Run from the repository root with Home Assistant and pycampchef installed::
+
+    python -m benchmarks.bench_telemetry --save
+
+Results are written to ``benchmarks/results/<time>-<commit>.json``, named
+after the UTC start time and the short git commit (``-dirty`` with local
+changes); ``--label`` replaces the commit part. Each run is compared
+against the newest earlier result from the same environment (host,
+Python, Home Assistant and pycampchef versions), or against
+``--baseline``. Regressions beyond ``--tolerance`` are reported, and the
+exit status is 1 if any were found.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+from homeassistant import bootstrap, config_entries, loader
+from homeassistant.const import EVENT_STATE_CHANGED, __version__ as HA_VERSION
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.camp_chef.const import CONF_ADDRESS, CONF_NAME, CONF_VENDOR, DOMAIN
+from custom_components.camp_chef.coordinator import CampChefCoordinator
+
+from .simulator import GrillScript, SimulatedCampChefClient, simulated_bluetooth
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+GRILL_COUNTS = (1, 10, 50)
+# Metrics where a larger value is a regression.
+LOWER_IS_BETTER = ("latency_p50_ms", "latency_p95_ms", "loop_ms_per_notification")
+# Set up by Home Assistant in a real install; the simulator replaces what
+# the integration uses of them.
+PROVIDED_DEPENDENCIES = ("bluetooth", "websocket_api")
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(percent / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def grill_address(index: int) -> str:
+    return f"AA:BB:CC:00:{index // 256:02X}:{index % 256:02X}"
+
+
+async def async_start_hass(config_dir: str) -> HomeAssistant:
+    """A Home Assistant core with registries and config entries loaded."""
+    hass = HomeAssistant(config_dir)
+    loader.async_setup(hass)
+    hass.config.skip_pip = True
+    hass.config.components.update(PROVIDED_DEPENDENCIES)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    return hass
+
+
+async def async_add_grill(
+    hass: HomeAssistant, address: str, name: str, options: Mapping[str, Any] | None = None
+) -> CampChefCoordinator:
+    """Add and set up a config entry for a grill; returns its coordinator."""
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title=name,
+        data={CONF_ADDRESS: address, CONF_NAME: name, CONF_VENDOR: "campchef"},
+        source=config_entries.SOURCE_USER,
+        options=options,
+        unique_id=address,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    if entry.state is not config_entries.ConfigEntryState.LOADED:
+        raise RuntimeError(f"{name} did not set up: {entry.state} {entry.reason or ''}")
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+def entity_entries(hass: HomeAssistant) -> dict[str, str]:
+    """Enabled entity ids of the integration, mapped to their config entry."""
+    return {
+        entity.entity_id: entity.config_entry_id
+        for entity in er.async_get(hass).entities.values()
+        if entity.platform == DOMAIN and not entity.disabled
+    }
+
+
+async def async_stop_hass(hass: HomeAssistant) -> None:
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_stop(force=True)
+
+
+async def _async_run(grills: int, duration: float, script: GrillScript) -> dict[str, Any]:
+    scripts = {
+        grill_address(index): GrillScript(**{**vars(script), "seed": index})
+        for index in range(grills)
+    }
+    with tempfile.TemporaryDirectory() as config_dir, simulated_bluetooth(scripts) as bluetooth:
+        hass = await async_start_hass(config_dir)
+        clients = bluetooth.clients
+        # Map each entity back to the grill whose notification caused the write.
+        by_entry: dict[str, SimulatedCampChefClient] = {}
+        for index, address in enumerate(scripts):
+            coordinator = await async_add_grill(hass, address, f"Grill {index}")
+            by_entry[coordinator.config_entry.entry_id] = clients[address]
+        owners = {
+            entity_id: by_entry[entry_id]
+            for entity_id, entry_id in entity_entries(hass).items()
+        }
+
+        latencies: list[float] = []
+        writes = 0
+
+        @callback
+        def _state_written(event: Event) -> None:
+            nonlocal writes
+            writes += 1
+            client = owners.get(event.data["entity_id"])
+            if client is not None and client.stats.last_notify_at:
+                latencies.append(time.perf_counter() - client.stats.last_notify_at)
+
+        # Setup connected every grill; let the notification loops settle.
+        await asyncio.sleep(script.notify_interval)
+        for client in clients.values():
+            client.stats.callback_times.clear()
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_written)
+        start = time.perf_counter()
+        await asyncio.sleep(duration)
+        elapsed = time.perf_counter() - start
+        unsub()
+        await async_stop_hass(hass)
+
+    callback_times = [t for client in clients.values() for t in client.stats.callback_times]
+    notifications = len(callback_times)
+    return {
+        "grills": grills,
+        "entities": len(owners),
+        "duration_s": round(elapsed, 2),
+        "notifications": notifications,
+        "state_writes": writes,
+        "writes_per_second": round(writes / elapsed, 1),
+        "latency_p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+        "latency_p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+        "latency_max_ms": round(max(latencies, default=0.0) * 1000, 3),
+        "loop_ms_per_notification": round(
+            statistics.fmean(callback_times) * 1000 if callback_times else 0.0, 4
+        ),
+        "loop_p95_ms": round(_percentile(callback_times, 95) * 1000, 4),
+    }
+
+
+def _git_commit() -> str | None:
+    """Short hash of HEAD, with ``-dirty`` if the tree has local changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{commit}-dirty" if status else commit
+
+
+def _environment() -> dict[str, Any]:
+    """What the timings depend on besides the code under test."""
+
+    def _version(package: str) -> str | None:
+        try:
+            return metadata.version(package)
+        except metadata.PackageNotFoundError:
+            return None
+
+    return {
+        "host": platform.node(),
+        "machine": platform.machine(),
+        "python": platform.python_version(),
+        "homeassistant": HA_VERSION,
+        "pycampchef": _version("pycampchef"),
+    }
+
+
+def _previous_result(current: Path, environment: dict[str, Any]) -> Path | None:
+    """The newest result saved before ``current`` in the same environment.
+
+    Timings from another machine or library version would only report
+    noise as regressions. File names start with the run's UTC time, so
+    they sort in run order; modification times do not survive a checkout.
+    """
+    for path in sorted(RESULTS_DIR.glob("*.json"), reverse=True):
+        if path.name < current.name and (
+            json.loads(path.read_text()).get("environment") == environment
+        ):
+            return path
+    return None
+
+
+def _compare(
+    baseline: dict[str, Any], results: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Describe every metric that got worse by more than ``tolerance``."""
+    previous = {run["grills"]: run for run in baseline.get("runs", [])}
+    regressions: list[str] = []
+    for run in results:
+        old = previous.get(run["grills"])
+        if old is None:
+            continue
+        for metric in LOWER_IS_BETTER:
+            before, after = old.get(metric), run[metric]
+            if before and after > before * (1 + tolerance):
+                regressions.append(
+                    f"{run['grills']} grills: {metric} {before} -> {after}"
+                    f" (+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--grills", type=int, nargs="+", default=list(GRILL_COUNTS))
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per run")
+    parser.add_argument("--notify-interval", type=float, default=0.5)
+    parser.add_argument("--probes", type=int, default=4)
+    parser.add_argument(
+        "--label", help="replaces the git commit in the result name and metadata"
+    )
+    parser.add_argument("--save", action="store_true", help="write the result file")
+    parser.add_argument("--baseline", type=Path, help="result file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    # Keep the output to results; setup warnings are not what is measured.
+    logging.basicConfig(level=logging.ERROR)
+
+    script = GrillScript(probe_count=args.probes, notify_interval=args.notify_interval)
+    started = datetime.now(timezone.utc).replace(microsecond=0)
+    results = []
+    for grills in args.grills:
+        run = asyncio.run(_async_run(grills, args.duration, script))
+        results.append(run)
+        print(json.dumps(run))
+
+    label = args.label or _git_commit() or "unknown"
+    output = RESULTS_DIR / f"{started:%Y%m%dT%H%M%SZ}-{label}.json"
+    environment = _environment()
+    baseline_path = args.baseline or _previous_result(output, environment)
+    status = 0
+    if baseline_path is None:
+        print("no earlier result from this environment; pass --baseline to compare")
+    elif baseline_path.exists():
+        regressions = _compare(json.loads(baseline_path.read_text()), results, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION vs {baseline_path.name}: {line}")
+        status = 1 if regressions else 0
+
+    if args.save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output.write_text(
+            json.dumps(
+                {
+                    "label": label,
+                    "started": started.isoformat(),
+                    "environment": environment,
+                    "notify_interval": args.notify_interval,
+                    "probes": args.probes,
+                    "runs": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"saved {output.relative_to(ROOT)}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
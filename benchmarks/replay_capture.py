@@ -0,0 +1,91 @@
+"""Replay a recorded grill session through a coordinator and its entities.
+
+Captures come from the ``camp_chef.start_capture`` service. Run from the
+repository root with Home Assistant and pycampchef installed::
+
+    python -m benchmarks.replay_capture camp_chef_captures/brisket.jsonl.gz --speed 0
+
+``--speed 0`` replays as fast as possible, ``1`` in real time. The run
+reports how many updates were delivered, how many entity states were
+written and the coordinator's own hot-path timings.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback
+
+from custom_components.camp_chef.capture import async_replay
+from custom_components.camp_chef.const import CONF_PASSIVE
+
+from .bench_telemetry import (
+    async_add_grill,
+    async_start_hass,
+    async_stop_hass,
+    entity_entries,
+)
+from .simulator import GrillScript, simulated_bluetooth
+
+
+async def _async_run(path: Path, speed: float) -> dict[str, Any]:
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+    address = header.get("address", "AA:BB:CC:DD:EE:FF")
+    name = header.get("name", "Replay")
+
+    # The simulated grill only answers setup's snapshot; passive mode keeps
+    # it from polling, so every update after that comes from the capture.
+    scripts = {address: GrillScript(notify_interval=0)}
+    with tempfile.TemporaryDirectory() as config_dir, simulated_bluetooth(scripts):
+        hass = await async_start_hass(config_dir)
+        coordinator = await async_add_grill(hass, address, name, {CONF_PASSIVE: True})
+        entities = len(entity_entries(hass))
+
+        writes = 0
+
+        @callback
+        def _state_written(event: Event) -> None:
+            nonlocal writes
+            writes += 1
+
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_written)
+        start = time.perf_counter()
+        delivered = await async_replay(hass, coordinator, path, speed)
+        # Let a pending coalesce window or throttle flush land.
+        await asyncio.sleep(0)
+        elapsed = time.perf_counter() - start
+        unsub()
+        await async_stop_hass(hass)
+
+    return {
+        "capture": path.name,
+        "entities": entities,
+        "updates": delivered,
+        "state_writes": writes,
+        "wall_time_s": round(elapsed, 3),
+        "metrics": coordinator.metrics.as_dict(time.monotonic()),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("capture", type=Path)
+    parser.add_argument("--speed", type=float, default=0.0, help="0 = as fast as possible")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.ERROR)
+    print(json.dumps(asyncio.run(_async_run(args.capture, args.speed)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
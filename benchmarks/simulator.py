@@ -0,0 +1,354 @@
+"""Simulated grill standing in for pycampchef's CampChefBleClient.
+
+The client exposes the surface the coordinator uses (``ensure_connected``,
+``disconnect``, ``is_notifying``, ``state``, ``get_state_snapshot``,
+``commands.*`` and the ``on_update`` callback), so a coordinator and its
+entities can be driven without hardware. Latency, failures and the
+notification rate are set per grill through ``GrillScript``.
+``simulated_bluetooth`` points the coordinator's Bluetooth lookups at
+simulated grills, so config entries set up the normal way.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
+from unittest.mock import patch
+
+from homeassistant.components.bluetooth import BluetoothChange
+from pycampchef.const import ModeName
+from pycampchef.models import GrillMode, GrillState
+
+from custom_components.camp_chef.state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_ESP_FW,
+    FIELD_FAN_LEVEL,
+    FIELD_FAULT,
+    FIELD_MODE,
+    FIELD_MODEL_FW,
+    FIELD_MODEL_ID,
+    FIELD_PELLET_LEVEL,
+    FIELD_PROBE_COUNT,
+    FIELD_SET_TEMP,
+    FIELD_SMOKE_LEVEL,
+    FIELD_TRANSITIONING,
+    FIELD_WIFI_RSSI,
+    FIELD_WIFI_SSID,
+    FIELD_WIFI_STATUS,
+    probe_connected_field,
+    probe_temp_field,
+    restore_state,
+)
+
+
+@dataclass
+class GrillScript:
+    """How a simulated grill behaves."""
+
+    probe_count: int = 4
+    # Seconds between notifications while connected; 0 disables them.
+    notify_interval: float = 0.5
+    # Probability that a notification carries no change at all.
+    idle_ratio: float = 0.0
+    connect_latency: float = 0.05
+    command_latency: float = 0.02
+    read_latency: float = 0.02
+    # Probability that a connect or a command raises.
+    connect_failure_rate: float = 0.0
+    command_failure_rate: float = 0.0
+    # Connects that fail before any succeed, regardless of the rate.
+    fail_first_connects: int = 0
+    seed: int | None = None
+
+
+class SimulatedGrillError(Exception):
+    """Raised for scripted connect and command failures."""
+
+
+@dataclass
+class SimulatedStats:
+    connects: int = 0
+    connect_failures: int = 0
+    notifications: int = 0
+    commands: int = 0
+    command_failures: int = 0
+    # perf_counter() of the latest notification, for latency measurements.
+    last_notify_at: float = 0.0
+    # Seconds spent inside on_update, one entry per notification.
+    callback_times: list[float] = field(default_factory=list)
+
+
+class SimulatedCommands:
+    """The ``client.commands`` namespace of a simulated grill."""
+
+    def __init__(self, client: SimulatedCampChefClient) -> None:
+        self._client = client
+
+    async def set_mode(self, mode: Any) -> None:
+        await self._client._async_command()
+        self._client.fields[FIELD_MODE] = mode
+        if mode == ModeName.STANDBY:
+            self._client.fields[FIELD_SET_TEMP] = None
+        await self._client.async_notify()
+
+    async def set_temp_smoke(self, temp: int, smoke: int) -> None:
+        await self._client._async_command()
+        self._client.fields[FIELD_MODE] = ModeName.RUN
+        self._client.fields[FIELD_SET_TEMP] = temp
+        self._client.fields[FIELD_SMOKE_LEVEL] = smoke
+        await self._client.async_notify()
+
+    async def read_mode(self) -> GrillMode:
+        return await self._client._async_read("mode")
+
+    async def read_status(self) -> Any:
+        return await self._client._async_read("status")
+
+    async def read_chamber(self) -> Any:
+        return await self._client._async_read("chamber")
+
+    async def read_probes(self) -> Any:
+        return await self._client._async_read("probes")
+
+    async def read_wifi(self) -> Any:
+        return await self._client._async_read("wifi")
+
+    async def read_ota(self) -> Any:
+        return await self._client._async_read("ota")
+
+    async def read_device(self) -> Any:
+        return await self._client._async_read("device")
+
+
+class SimulatedCampChefClient:
+    """Drop-in replacement for ``CampChefBleClient``."""
+
+    def __init__(
+        self,
+        ble_device: Any,
+        vendor: Any = None,
+        on_update: Callable[[GrillState], Awaitable[None]] | None = None,
+        script: GrillScript | None = None,
+    ) -> None:
+        self.ble_device = ble_device
+        self.vendor = vendor
+        self.on_update = on_update
+        self.script = script or GrillScript()
+        self.stats = SimulatedStats()
+        self.commands = SimulatedCommands(self)
+        self.fields: dict[str, Any] = _initial_fields(self.script.probe_count)
+        self._random = random.Random(self.script.seed)
+        self._connected = False
+        self._notify_task: asyncio.Task[None] | None = None
+        self._state: GrillState | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def is_notifying(self) -> bool:
+        return self._connected and self.script.notify_interval > 0
+
+    @property
+    def state(self) -> GrillState:
+        if self._state is None:
+            self._state = restore_state(self.fields)
+        return self._state
+
+    async def ensure_connected(self) -> None:
+        if self._connected:
+            return
+        await asyncio.sleep(self.script.connect_latency)
+        self.stats.connects += 1
+        if self.stats.connects <= self.script.fail_first_connects or (
+            self._random.random() < self.script.connect_failure_rate
+        ):
+            self.stats.connect_failures += 1
+            raise SimulatedGrillError("simulated connect failure")
+        self._connected = True
+        if self.script.notify_interval > 0:
+            self._notify_task = asyncio.get_running_loop().create_task(
+                self._async_notify_loop()
+            )
+
+    async def disconnect(self) -> None:
+        self._connected = False
+        if self._notify_task is not None:
+            self._notify_task.cancel()
+            self._notify_task = None
+
+    async def get_state_snapshot(self) -> GrillState:
+        await asyncio.sleep(self.script.read_latency)
+        return restore_state(self.fields)
+
+    def step(self) -> None:
+        """Advance the simulated cook by one notification's worth."""
+        if self._random.random() < self.script.idle_ratio:
+            return
+        fields = self.fields
+        target = fields[FIELD_SET_TEMP] or 70
+        chamber = fields[FIELD_CHAMBER_TEMP]
+        fields[FIELD_CHAMBER_TEMP] = round(
+            chamber + (target - chamber) * 0.05 + self._random.uniform(-2, 2), 1
+        )
+        for index in range(self.script.probe_count):
+            key = probe_temp_field(index)
+            fields[key] = round(fields[key] + self._random.uniform(0, 0.6), 1)
+        if self._random.random() < 0.05:
+            fields[FIELD_FAN_LEVEL] = self._random.randint(0, 5)
+        if self._random.random() < 0.01:
+            fields[FIELD_PELLET_LEVEL] = max(0, fields[FIELD_PELLET_LEVEL] - 1)
+
+    async def async_notify(self) -> None:
+        """Deliver the current state through ``on_update`` and time it."""
+        self._state = restore_state(self.fields)
+        self.stats.notifications += 1
+        if self.on_update is None:
+            return
+        start = self.stats.last_notify_at = time.perf_counter()
+        await self.on_update(self._state)
+        self.stats.callback_times.append(time.perf_counter() - start)
+
+    async def _async_notify_loop(self) -> None:
+        interval = self.script.notify_interval
+        # Spread grills out so they do not all notify on the same tick.
+        await asyncio.sleep(self._random.uniform(0, interval))
+        while self._connected:
+            self.step()
+            await self.async_notify()
+            await asyncio.sleep(interval)
+
+    async def _async_command(self) -> None:
+        if not self._connected:
+            raise SimulatedGrillError("not connected")
+        await asyncio.sleep(self.script.command_latency)
+        self.stats.commands += 1
+        if self._random.random() < self.script.command_failure_rate:
+            self.stats.command_failures += 1
+            raise SimulatedGrillError("simulated command failure")
+
+    async def _async_read(self, group: str) -> Any:
+        if not self._connected:
+            raise SimulatedGrillError("not connected")
+        await asyncio.sleep(self.script.read_latency)
+        return getattr(restore_state(self.fields), group)
+
+
+class SimulatedBluetooth:
+    """Home Assistant's Bluetooth lookups, answered for simulated grills.
+
+    Keeps the clients the coordinators create and the advertisement and
+    unavailable callbacks they still have registered, both keyed by
+    address. Every grill is heard by its own adapter, so connection slots
+    never hold a grill back.
+    """
+
+    def __init__(self, scripts: dict[str, GrillScript]) -> None:
+        self.scripts = scripts
+        self.clients: dict[str, SimulatedCampChefClient] = {}
+        self.advertisement_callbacks: dict[str, list[Callable[..., None]]] = {}
+        self.unavailable_callbacks: dict[str, list[Callable[..., None]]] = {}
+        self._sources = {address: f"sim{index}" for index, address in enumerate(scripts)}
+
+    @property
+    def registered(self) -> int:
+        """Callbacks that have not been unregistered yet."""
+        return sum(
+            len(callbacks)
+            for registry in (self.advertisement_callbacks, self.unavailable_callbacks)
+            for callbacks in registry.values()
+        )
+
+    def service_info(self, address: str, rssi: int = -60) -> Any:
+        return SimpleNamespace(address=address, rssi=rssi, source=self._sources.get(address))
+
+    def advertise(self, address: str, rssi: int = -60) -> None:
+        """Deliver an advertisement from ``address`` to its callbacks."""
+        service_info = self.service_info(address, rssi)
+        for handler in list(self.advertisement_callbacks.get(address, ())):
+            handler(service_info, BluetoothChange.ADVERTISEMENT)
+
+    def client(self, ble_device: Any, **kwargs: Any) -> SimulatedCampChefClient:
+        client = SimulatedCampChefClient(
+            ble_device, script=self.scripts[ble_device.address], **kwargs
+        )
+        self.clients[ble_device.address] = client
+        return client
+
+    def ble_device(self, _hass: Any, address: str, connectable: bool = True) -> Any:
+        if address not in self.scripts:
+            return None
+        return SimpleNamespace(address=address, name=f"CampChef:{address[-5:]}")
+
+    def last_service_info(self, _hass: Any, address: str, connectable: bool = True) -> Any:
+        source = self._sources.get(address)
+        return SimpleNamespace(source=source) if source is not None else None
+
+    def register_callback(
+        self, _hass: Any, handler: Callable[..., None], matcher: Any, _mode: Any
+    ) -> Callable[[], None]:
+        return self._register(self.advertisement_callbacks, matcher["address"], handler)
+
+    def track_unavailable(
+        self, _hass: Any, handler: Callable[..., None], address: str, connectable: bool = True
+    ) -> Callable[[], None]:
+        return self._register(self.unavailable_callbacks, address, handler)
+
+    @staticmethod
+    def _register(
+        registry: dict[str, list[Callable[..., None]]],
+        address: str,
+        handler: Callable[..., None],
+    ) -> Callable[[], None]:
+        registry.setdefault(address, []).append(handler)
+
+        def _unregister() -> None:
+            registry[address].remove(handler)
+
+        return _unregister
+
+
+@contextmanager
+def simulated_bluetooth(scripts: dict[str, GrillScript]) -> Iterator[SimulatedBluetooth]:
+    """Make the grills in ``scripts`` (keyed by address) look in range."""
+    bluetooth = SimulatedBluetooth(scripts)
+    with patch.multiple(
+        "custom_components.camp_chef.coordinator",
+        CampChefBleClient=bluetooth.client,
+        async_ble_device_from_address=bluetooth.ble_device,
+        async_last_service_info=bluetooth.last_service_info,
+        async_scanner_devices_by_address=lambda *args, **kwargs: [],
+        async_register_callback=bluetooth.register_callback,
+        async_track_unavailable=bluetooth.track_unavailable,
+    ):
+        yield bluetooth
+
+
+def _initial_fields(probe_count: int) -> dict[str, Any]:
+    fields: dict[str, Any] = {
+        FIELD_MODE: ModeName.RUN,
+        FIELD_SET_TEMP: 225,
+        FIELD_SMOKE_LEVEL: 5,
+        FIELD_FAN_LEVEL: 2,
+        FIELD_PELLET_LEVEL: 80,
+        FIELD_TRANSITIONING: False,
+        FIELD_FAULT: False,
+        FIELD_CHAMBER_TEMP: 70.0,
+        FIELD_WIFI_RSSI: -60,
+        FIELD_WIFI_SSID: "grill",
+        FIELD_WIFI_STATUS: None,
+        FIELD_MODEL_FW: "sim-1.0",
+        FIELD_ESP_FW: "sim-1.0",
+        FIELD_MODEL_ID: 0,
+        FIELD_PROBE_COUNT: probe_count,
+    }
+    for index in range(probe_count):
+        fields[probe_connected_field(index)] = True
+        fields[probe_temp_field(index)] = 40.0
+    return fields
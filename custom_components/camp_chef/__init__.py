@@ -8,14 +8,21 @@ from .const import (
     CONF_ADDRESS,
     CONF_NAME,
     CONF_VENDOR,
+    DATA_CONNECTIONS,
     DOMAIN,
     PLATFORMS,
 )
-from .coordinator import CampChefCoordinator
+from .connection import ConnectionManager
+from .coordinator import CampChefCoordinator, cache_store
+from .services import async_setup_services
+from .websocket import async_setup_websocket
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the Camp Chef integration."""
     hass.data.setdefault(DOMAIN, {})
+    hass.data[DOMAIN][DATA_CONNECTIONS] = ConnectionManager()
+    async_setup_services(hass)
+    async_setup_websocket(hass)
     return True
 
 
@@ -27,16 +34,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         vendor_key=entry.data.get(CONF_VENDOR, "campchef"),
         name=entry.data.get(CONF_NAME, entry.title),
         entry_id=entry.entry_id,
+        options=entry.options,
+        connections=hass.data[DOMAIN][DATA_CONNECTIONS],
     )
-    await coordinator.async_start()
-    await coordinator.async_config_entry_first_refresh()
+    if await coordinator.async_load_cache():
+        # Entities come up from the last known state; the grill may be off or
+        # out of range, so connect in the background instead of blocking.
+        await coordinator.async_start()
+        if not coordinator.passive:
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{entry.title} initial refresh"
+            )
+    else:
+        await coordinator.async_start()
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new coordinator; drop this one's timers,
+            # Bluetooth callbacks and connection slot.
+            await coordinator.async_stop()
+            raise
     hass.data[DOMAIN][entry.entry_id] = coordinator
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so the coordinator picks up new options."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator: CampChefCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
     await coordinator.async_stop()
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the cached state of a removed entry."""
+    await cache_store(hass, entry.entry_id).async_remove()
@@ -0,0 +1,342 @@
+"""Edge-triggered grill alarms and transition events evaluated on every state change."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Any, Mapping
+
+from homeassistant.util import dt as dt_util
+
+from pycampchef.const import ModeName
+
+from .state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_FAULT,
+    FIELD_MODE,
+    FIELD_OTA_STATE,
+    FIELD_SET_TEMP,
+    FIELD_TRANSITIONING,
+    probe_connected_field,
+    probe_temp_field,
+)
+
+EVENT_PROBE_TARGET_REACHED = "camp_chef_probe_target_reached"
+EVENT_CHAMBER_OUT_OF_BAND = "camp_chef_chamber_out_of_band"
+EVENT_CHAMBER_IN_BAND = "camp_chef_chamber_in_band"
+EVENT_FAULT = "camp_chef_fault"
+EVENT_FAULT_CLEARED = "camp_chef_fault_cleared"
+
+# Fired with the old and new value whenever one of these fields transitions.
+# The fault flag is left to the fault rule's own two events.
+TRANSITION_EVENTS = {
+    FIELD_MODE: "camp_chef_mode_changed",
+    FIELD_TRANSITIONING: "camp_chef_transitioning_changed",
+    FIELD_OTA_STATE: "camp_chef_ota_state_changed",
+}
+
+# A probe must drop this far below its target before it can alarm again.
+PROBE_HYSTERESIS = 2.0
+# The chamber must come this far back inside the band to count as in band.
+CHAMBER_HYSTERESIS = 5.0
+
+Alarm = tuple[str, dict[str, Any]]
+
+
+class _Rule(ABC):
+    fields: frozenset[str] = frozenset()
+    # When the rule has to be evaluated again even if nothing changes.
+    due: float | None = None
+
+    @abstractmethod
+    def evaluate(self, now: float, fields: Mapping[str, Any]) -> Alarm | None:
+        """Return the alarm raised by this update, if any."""
+
+    @abstractmethod
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the rule's state for diagnostics."""
+
+    def seed(self, fields: Mapping[str, Any]) -> None:
+        """Take a restored state as the baseline."""
+
+
+def _event_value(value: Any) -> Any:
+    # Enums are reported by name, as the entities show them.
+    return value.name if isinstance(value, Enum) else value
+
+
+class _TransitionRule(_Rule):
+    def __init__(self, field: str, event_type: str) -> None:
+        self.fields = frozenset({field})
+        self._field = field
+        self._event_type = event_type
+        self._value: Any = None
+        self._since: str | None = None
+
+    def seed(self, fields: Mapping[str, Any]) -> None:
+        self._value = _event_value(fields.get(self._field))
+
+    def evaluate(self, now: float, fields: Mapping[str, Any]) -> Alarm | None:
+        value = _event_value(fields.get(self._field))
+        if value is None or value == self._value:
+            return None
+        old_value, old_since = self._value, self._since
+        self._value = value
+        self._since = dt_util.utcnow().isoformat()
+        # The first reading only sets the baseline.
+        if old_value is None:
+            return None
+        return self._event_type, {
+            "field": self._field,
+            "old_value": old_value,
+            "new_value": value,
+            "old_since": old_since,
+            "changed_at": self._since,
+        }
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "rule": "transition",
+            "field": self._field,
+            "value": self._value,
+            "since": self._since,
+        }
+
+
+class _FaultRule(_Rule):
+    fields = frozenset({FIELD_FAULT})
+
+    def __init__(self) -> None:
+        self._fault: bool | None = None
+
+    def seed(self, fields: Mapping[str, Any]) -> None:
+        # A fault still present after a restart is not a new fault.
+        if (fault := fields.get(FIELD_FAULT)) is not None:
+            self._fault = bool(fault)
+
+    def evaluate(self, now: float, fields: Mapping[str, Any]) -> Alarm | None:
+        fault = fields.get(FIELD_FAULT)
+        if fault is None:
+            return None
+        previous, self._fault = self._fault, bool(fault)
+        # The first reading only sets the baseline.
+        if previous is None or previous == self._fault:
+            return None
+        return (EVENT_FAULT if self._fault else EVENT_FAULT_CLEARED), {}
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {"rule": "fault", "fault": self._fault}
+
+
+class _ProbeTargetRule(_Rule):
+    def __init__(self, index: int, targets: Mapping[int, float]) -> None:
+        self.index = index
+        self._targets = targets
+        self._temp_field = probe_temp_field(index)
+        self._connected_field = probe_connected_field(index)
+        self.fields = frozenset({self._temp_field, self._connected_field})
+        self._reached: bool | None = None
+
+    def evaluate(self, now: float, fields: Mapping[str, Any]) -> Alarm | None:
+        target = self._targets.get(self.index)
+        temp = fields.get(self._temp_field)
+        if target is None or temp is None or not fields.get(self._connected_field):
+            self._reached = None
+            return None
+        if self._reached is None:
+            self._reached = temp >= target
+            return None
+        if self._reached:
+            if temp < target - PROBE_HYSTERESIS:
+                self._reached = False
+            return None
+        if temp < target:
+            return None
+        self._reached = True
+        return EVENT_PROBE_TARGET_REACHED, {
+            "probe": self.index + 1,
+            "temperature": temp,
+            "target": target,
+        }
+
+    def rearm(self) -> None:
+        """Forget whether the target was reached, e.g. after a new target."""
+        self._reached = None
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "rule": "probe_target",
+            "probe": self.index + 1,
+            "target": self._targets.get(self.index),
+            "reached": self._reached,
+        }
+
+
+class _ChamberBandRule(_Rule):
+    """Chamber more than ``band`` from the set temperature for ``duration``.
+
+    Only armed in RUN once the chamber has been inside the band for the
+    current set temperature, so preheat and set-point changes do not alarm.
+    """
+
+    fields = frozenset({FIELD_CHAMBER_TEMP, FIELD_SET_TEMP, FIELD_MODE})
+
+    def __init__(self, band: float, duration: float) -> None:
+        self._band = band
+        self._duration = duration
+        self._set_temp: Any = None
+        self._armed = False
+        self._outside_since: float | None = None
+        self._alarmed = False
+
+    def evaluate(self, now: float, fields: Mapping[str, Any]) -> Alarm | None:
+        chamber = fields.get(FIELD_CHAMBER_TEMP)
+        set_temp = fields.get(FIELD_SET_TEMP)
+        if fields.get(FIELD_MODE) != ModeName.RUN or chamber is None or set_temp is None:
+            return self._disarm(chamber, set_temp)
+        if set_temp != self._set_temp:
+            alarm = self._disarm(chamber, set_temp)
+            self._set_temp = set_temp
+            if alarm is not None:
+                return alarm
+        deviation = chamber - set_temp
+        if abs(deviation) <= self._band - CHAMBER_HYSTERESIS or (
+            not self._alarmed and abs(deviation) <= self._band
+        ):
+            self._outside_since = None
+            if not self._armed:
+                self._armed = True
+                return None
+            if self._alarmed:
+                self._alarmed = False
+                return EVENT_CHAMBER_IN_BAND, self._data(chamber, set_temp)
+            return None
+        if not self._armed or self._alarmed or abs(deviation) <= self._band:
+            return None
+        if self._outside_since is None:
+            self._outside_since = now
+        if now - self._outside_since < self._duration:
+            return None
+        self._alarmed = True
+        return EVENT_CHAMBER_OUT_OF_BAND, {
+            **self._data(chamber, set_temp),
+            "minutes": round((now - self._outside_since) / 60, 1),
+        }
+
+    @property
+    def due(self) -> float | None:
+        if self._outside_since is None or self._alarmed:
+            return None
+        return self._outside_since + self._duration
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "rule": "chamber_band",
+            "band": self._band,
+            "duration": self._duration,
+            "armed": self._armed,
+            "alarmed": self._alarmed,
+            "outside_for": None
+            if self._outside_since is None
+            else round(now - self._outside_since, 1),
+        }
+
+    def _disarm(self, chamber: Any, set_temp: Any) -> Alarm | None:
+        alarmed = self._alarmed
+        self._armed = self._alarmed = False
+        self._outside_since = None
+        self._set_temp = None
+        if alarmed:
+            return EVENT_CHAMBER_IN_BAND, self._data(chamber, set_temp)
+        return None
+
+    @staticmethod
+    def _data(chamber: Any, set_temp: Any) -> dict[str, Any]:
+        return {
+            "temperature": chamber,
+            "set_temp": set_temp,
+            "deviation": None if chamber is None or set_temp is None else chamber - set_temp,
+        }
+
+
+class AlarmEngine:
+    """Rules compiled from the options, indexed by the fields they read.
+
+    ``evaluate`` only runs the rules whose fields changed, so an update
+    that moves one probe costs one rule check. Rules that alarm on time
+    rather than on a change expose ``due``; the owner calls
+    ``evaluate_due`` then, so the alarm does not wait for the next update.
+    """
+
+    def __init__(
+        self, targets: Mapping[int, float], chamber_band: float, chamber_minutes: float
+    ) -> None:
+        self._targets = targets
+        self._static: list[_Rule] = [_FaultRule()]
+        self._static.extend(
+            _TransitionRule(field, event_type)
+            for field, event_type in TRANSITION_EVENTS.items()
+        )
+        if chamber_band > 0:
+            self._static.append(_ChamberBandRule(chamber_band, chamber_minutes * 60))
+        self._probe_count = 0
+        self._rules: list[_Rule] = []
+        self._by_field: dict[str, tuple[_Rule, ...]] = {}
+        self.compile(0)
+
+    def compile(self, probe_count: int) -> None:
+        """Rebuild the field index for ``probe_count`` probes."""
+        self._probe_count = probe_count
+        self._rules = rules = self._static + [
+            _ProbeTargetRule(index, self._targets) for index in range(probe_count)
+        ]
+        by_field: dict[str, list[_Rule]] = {}
+        for rule in rules:
+            for field in rule.fields:
+                by_field.setdefault(field, []).append(rule)
+        self._by_field = {field: tuple(rules) for field, rules in by_field.items()}
+
+    def evaluate(
+        self, now: float, fields: Mapping[str, Any], changed: set[str], probe_count: int
+    ) -> list[Alarm]:
+        if probe_count != self._probe_count:
+            self.compile(probe_count)
+        by_field = self._by_field
+        rules: list[_Rule] = []
+        for field in changed:
+            for rule in by_field.get(field, ()):
+                if rule not in rules:
+                    rules.append(rule)
+        alarms = []
+        for rule in rules:
+            if (alarm := rule.evaluate(now, fields)) is not None:
+                alarms.append(alarm)
+        return alarms
+
+    @property
+    def due(self) -> float | None:
+        """The earliest time a rule needs evaluating without an update."""
+        return min(
+            (due for rule in self._rules if (due := rule.due) is not None), default=None
+        )
+
+    def evaluate_due(self, now: float, fields: Mapping[str, Any]) -> list[Alarm]:
+        alarms = []
+        for rule in self._rules:
+            if (due := rule.due) is not None and due <= now:
+                if (alarm := rule.evaluate(now, fields)) is not None:
+                    alarms.append(alarm)
+        return alarms
+
+    def seed(self, fields: Mapping[str, Any]) -> None:
+        """Take a restored state as the baseline for transitions and faults."""
+        for rule in self._static:
+            rule.seed(fields)
+
+    def rearm_probe(self, index: int) -> None:
+        """Forget whether a probe reached its target, e.g. after a new target."""
+        for rule in self._rules:
+            if isinstance(rule, _ProbeTargetRule) and rule.index == index:
+                rule.rearm()
+
+    def as_dict(self, now: float) -> list[dict[str, Any]]:
+        return [rule.as_dict(now) for rule in self._rules]
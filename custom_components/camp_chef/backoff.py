@@ -0,0 +1,80 @@
+"""Reconnect backoff and circuit breaker."""
+from __future__ import annotations
+
+import random
+from typing import Any
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 300.0
+BACKOFF_JITTER = 0.2
+# Consecutive failures before the breaker opens.
+BREAKER_THRESHOLD = 5
+# While open, a single probe connect is allowed this often.
+BREAKER_PROBE_INTERVAL = 900.0
+# Advertisements re-arm the breaker at most this often, so a grill that
+# advertises but refuses connections is not hammered.
+REARM_MIN_INTERVAL = 60.0
+
+
+class ReconnectBreaker:
+    """Space out connect attempts to a grill that keeps failing.
+
+    Failures back off exponentially (with jitter) from ``BACKOFF_BASE`` up to
+    ``BACKOFF_MAX``. After ``BREAKER_THRESHOLD`` consecutive failures the
+    breaker opens and only lets a half-open probe through every
+    ``BREAKER_PROBE_INTERVAL``. A success closes it again; an advertisement
+    from the grill re-arms it so the next attempt may happen right away.
+    """
+
+    def __init__(self) -> None:
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.last_error: str | None = None
+        self._last_rearm = float("-inf")
+
+    def allow(self, now: float) -> bool:
+        if now < self.next_attempt:
+            return False
+        if self.state == STATE_OPEN:
+            self.state = STATE_HALF_OPEN
+        return True
+
+    def retry_in(self, now: float) -> float:
+        return max(0.0, self.next_attempt - now)
+
+    def record_success(self) -> None:
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.next_attempt = 0.0
+        self.last_error = None
+
+    def record_failure(self, now: float, error: str) -> None:
+        self.failures += 1
+        self.last_error = error
+        if self.failures >= BREAKER_THRESHOLD:
+            self.state = STATE_OPEN
+            delay = BREAKER_PROBE_INTERVAL
+        else:
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (self.failures - 1))
+        self.next_attempt = now + delay * random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)
+
+    def rearm(self, now: float) -> bool:
+        """Allow an immediate attempt; returns True if it was waiting."""
+        if self.next_attempt <= now or now - self._last_rearm < REARM_MIN_INTERVAL:
+            return False
+        self._last_rearm = now
+        self.next_attempt = now
+        return True
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in": round(self.retry_in(now), 1),
+            "last_error": self.last_error,
+        }
@@ -6,62 +6,71 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.entity import EntityCategory
 
-from pycampchef.const import VENDOR_CONFIGS, WifiStatus
+from pycampchef.const import WifiStatus
 
-from .const import CONF_ADDRESS, CONF_NAME, CONF_VENDOR, DOMAIN
+from .const import CONF_NAME, DOMAIN
 from .coordinator import CampChefCoordinator
+from .entity import CampChefEntity
+from .state import FIELD_BLE_PRESENT, FIELD_WIFI_STATUS
 
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     coordinator: CampChefCoordinator = hass.data[DOMAIN][entry.entry_id]
     name = entry.data.get(CONF_NAME, entry.title)
-    async_add_entities([CampChefWifiStatusBinarySensor(coordinator, entry, name)])
+    async_add_entities(
+        [
+            CampChefWifiStatusBinarySensor(coordinator, entry, name),
+            CampChefPresenceBinarySensor(coordinator, entry, name),
+        ]
+    )
 
 
-class CampChefBaseBinarySensor(CoordinatorEntity[CampChefCoordinator], BinarySensorEntity):
+class CampChefBaseBinarySensor(CampChefEntity, BinarySensorEntity):
     _attr_device_class = None
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_entity_registry_enabled_default = False
+    _fields: frozenset[str] | None = None
 
     def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self._base_name = name
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        vendor_key = self._entry.data.get(CONF_VENDOR, "campchef")
-        vendor = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"]).name
-        address = self._entry.data[CONF_ADDRESS]
-        return DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            connections={(CONNECTION_BLUETOOTH, address)},
-            name=self._base_name,
-            manufacturer=vendor,
-            sw_version=self.coordinator._device_info.get("sw_version"),
-            hw_version=self.coordinator._device_info.get("hw_version"),
-        )
+        super().__init__(coordinator, entry, name, self._fields)
 
 
 class CampChefWifiStatusBinarySensor(CampChefBaseBinarySensor):
     _attr_name = "Wi-Fi status"
+    _fields = frozenset({FIELD_WIFI_STATUS})
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
     def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
         super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_wifi_status"
+        self._attr_unique_id = f"{self._address}_wifi_status"
 
     @property
     def is_on(self) -> Optional[bool]:
-        wifi = self.coordinator.data.wifi if self.coordinator.data else None
-        status = getattr(wifi, "status", None)
+        status = self.coordinator.value(FIELD_WIFI_STATUS)
         if status is None:
             return None
         try:
             return WifiStatus(status) == WifiStatus.CONNECTED
         except Exception:
             return None
+
+
+class CampChefPresenceBinarySensor(CampChefBaseBinarySensor):
+    _attr_name = "In range"
+    _attr_device_class = BinarySensorDeviceClass.PRESENCE
+    _fields = frozenset({FIELD_BLE_PRESENT})
+
+    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
+        super().__init__(coordinator, entry, name)
+        self._attr_unique_id = f"{self._address}_presence"
+
+    @property
+    def available(self) -> bool:
+        # Presence comes from advertisements, not from the GATT connection.
+        return True
+
+    @property
+    def is_on(self) -> Optional[bool]:
+        return self.coordinator.present
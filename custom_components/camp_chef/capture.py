@@ -0,0 +1,210 @@
+"""Record a grill's telemetry stream to disk and replay it.
+
+A capture is gzip-compressed JSON lines. The first line is a header; every
+following line is ``[seconds since start, kind, payload]`` where kind is
+``k`` (keyframe of every field), ``n`` (notification delta), ``p`` (poll
+delta), ``w`` (optimistic write) or ``c`` (command and its arguments).
+Both writing and replaying stream, so a capture is never held in memory.
+"""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from datetime import timedelta
+from functools import partial
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Iterable
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .history import SOURCE_NOTIFICATION, SOURCE_POLL, SOURCE_WRITE
+from .state import encode_value, restore_state
+
+if TYPE_CHECKING:
+    from .coordinator import CampChefCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_VERSION = 1
+KIND_KEYFRAME = "k"
+KIND_COMMAND = "c"
+SOURCE_KINDS = {SOURCE_NOTIFICATION: "n", SOURCE_POLL: "p", SOURCE_WRITE: "w"}
+# Kinds replayed into the coordinator as telemetry.
+REPLAYED_KINDS = frozenset({KIND_KEYFRAME, "n", "p"})
+FLUSH_INTERVAL = timedelta(seconds=10)
+FLUSH_LINES = 500
+REPLAY_CHUNK_LINES = 1000
+
+
+def _encode(values: dict[str, Any]) -> dict[str, Any]:
+    return {key: encode_value(value) for key, value in values.items()}
+
+
+class TelemetryCapture:
+    """Append a coordinator's updates to a capture file.
+
+    Lines are buffered and written from the executor every
+    ``FLUSH_INTERVAL`` or ``FLUSH_LINES``, whichever comes first. The file
+    is closed when Home Assistant stops, so it keeps its gzip trailer.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path) -> None:
+        self._hass = hass
+        self.path = path
+        self._start = time.monotonic()
+        self._buffer: list[str] = []
+        self._file: IO[str] | None = None
+        self._lock = asyncio.Lock()
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._unsub_stop: CALLBACK_TYPE | None = None
+        self.lines = 0
+
+    async def async_open(self, header: dict[str, Any], fields: dict[str, Any]) -> None:
+        def _open() -> IO[str]:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return gzip.open(self.path, "wt", encoding="utf-8")
+
+        self._file = await self._hass.async_add_executor_job(_open)
+        self._write_line(
+            {
+                "version": CAPTURE_VERSION,
+                "started": dt_util.utcnow().isoformat(),
+                **header,
+            }
+        )
+        self._append(KIND_KEYFRAME, _encode(fields))
+        self._unsub_flush = async_track_time_interval(
+            self._hass, self._async_flush_interval, FLUSH_INTERVAL
+        )
+        self._unsub_stop = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, self._async_stop
+        )
+
+    async def _async_stop(self, _event: Event) -> None:
+        self._unsub_stop = None
+        await self.async_close()
+
+    @callback
+    def record(self, source: str, fields: dict[str, Any], changed: Iterable[str]) -> None:
+        delta = {key: encode_value(fields.get(key)) for key in changed}
+        if delta:
+            self._append(SOURCE_KINDS[source], delta)
+
+    @callback
+    def record_command(self, kind: str, args: dict[str, Any]) -> None:
+        self._append(KIND_COMMAND, {"kind": kind, "args": _encode(args)})
+
+    def _append(self, kind: str, payload: dict[str, Any]) -> None:
+        self._write_line([round(time.monotonic() - self._start, 3), kind, payload])
+
+    def _write_line(self, line: Any) -> None:
+        self._buffer.append(json.dumps(line, separators=(",", ":")))
+        self.lines += 1
+        if len(self._buffer) >= FLUSH_LINES:
+            self._hass.async_create_task(self._async_flush())
+
+    @callback
+    def _async_flush_interval(self, _now: Any) -> None:
+        if self._buffer:
+            self._hass.async_create_task(self._async_flush())
+
+    async def _async_flush(self) -> None:
+        # The lock keeps executor writes in order.
+        async with self._lock:
+            if not self._buffer or self._file is None:
+                return
+            lines, self._buffer = self._buffer, []
+            file = self._file
+            await self._hass.async_add_executor_job(
+                file.write, "".join(f"{line}\n" for line in lines)
+            )
+
+    async def async_close(self) -> None:
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._unsub_flush is not None:
+            self._unsub_flush()
+            self._unsub_flush = None
+        await self._async_flush()
+        async with self._lock:
+            if self._file is not None:
+                await self._hass.async_add_executor_job(self._file.close)
+                self._file = None
+
+
+def _read_lines(file: IO[str], count: int) -> tuple[list[str], bool]:
+    """Read up to ``count`` lines; also return whether the file was cut off.
+
+    A capture that was not closed (power loss, a crash) ends without its
+    gzip trailer, possibly mid-line. Everything up to the last whole line
+    is still good.
+    """
+    lines = []
+    try:
+        for line in file:
+            lines.append(line)
+            if len(lines) >= count:
+                break
+    except EOFError:
+        if lines and not lines[-1].endswith("\n"):
+            lines.pop()
+        return lines, True
+    return lines, False
+
+
+async def async_replay(
+    hass: HomeAssistant,
+    coordinator: CampChefCoordinator,
+    path: Path,
+    speed: float = 1.0,
+) -> int:
+    """Feed a capture into ``coordinator`` as if the grill sent it.
+
+    ``speed`` scales the recorded timing (2.0 is twice as fast); 0 replays
+    as fast as possible. Writes and commands are skipped. Returns the number
+    of updates delivered.
+    """
+    file = await hass.async_add_executor_job(
+        partial(gzip.open, path, "rt", encoding="utf-8")
+    )
+    fields: dict[str, Any] = {}
+    delivered = 0
+    start = time.monotonic()
+    try:
+        header = json.loads(await hass.async_add_executor_job(file.readline))
+        if header.get("version") != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {header.get('version')}")
+        truncated = False
+        while not truncated:
+            lines, truncated = await hass.async_add_executor_job(
+                _read_lines, file, REPLAY_CHUNK_LINES
+            )
+            if not lines and not truncated:
+                break
+            for line in lines:
+                at, kind, payload = json.loads(line)
+                if kind not in REPLAYED_KINDS:
+                    continue
+                if kind == KIND_KEYFRAME:
+                    fields = dict(payload)
+                else:
+                    fields.update(payload)
+                if speed > 0:
+                    delay = at / speed - (time.monotonic() - start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                await coordinator._handle_telemetry(restore_state(fields))
+                delivered += 1
+    finally:
+        await hass.async_add_executor_job(file.close)
+    if truncated:
+        _LOGGER.warning("%s is truncated; replayed the %s updates before the cut", path, delivered)
+    _LOGGER.debug("Replayed %s updates from %s", delivered, path)
+    return delivered
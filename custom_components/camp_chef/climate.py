@@ -8,22 +8,19 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import UnitOfTemperature
-from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import callback
 
-from pycampchef.const import VENDOR_CONFIGS, ModeName
-from pycampchef.models import GrillMode, GrillState
+from pycampchef.const import ModeName
 
 from .const import (
-    CONF_ADDRESS,
     CONF_NAME,
-    CONF_VENDOR,
     DEFAULT_MAX_TEMP_F,
     DEFAULT_MIN_TEMP_F,
     DOMAIN,
 )
 from .coordinator import CampChefCoordinator
+from .entity import CampChefEntity
+from .state import FIELD_CHAMBER_TEMP, MODE_FIELDS
 
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
@@ -32,58 +29,58 @@ async def async_setup_entry(hass, entry, async_add_entities) -> None:
     async_add_entities([CampChefThermostat(coordinator, entry, name)])
 
 
-class CampChefThermostat(CoordinatorEntity[CampChefCoordinator], ClimateEntity):
+class CampChefThermostat(CampChefEntity, ClimateEntity):
     _attr_temperature_unit = UnitOfTemperature.FAHRENHEIT
     _attr_native_temperature_unit = UnitOfTemperature.FAHRENHEIT
     _attr_name = "Chamber"
 
     def __init__(self, coordinator: CampChefCoordinator, entry, base_name: str) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self._base_name = base_name
-        self._attr_unique_id = f"{entry.data[CONF_ADDRESS]}_climate"
+        super().__init__(coordinator, entry, base_name, MODE_FIELDS | {FIELD_CHAMBER_TEMP})
+        self._attr_unique_id = f"{self._address}_climate"
         self._attr_translation_key = "chamber"
-        vendor_key = entry.data.get(CONF_VENDOR, "campchef")
-        vendor_cfg = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"])
+        vendor_cfg = coordinator.vendor
         self._min_temp_f = getattr(vendor_cfg, "min_temp_f", DEFAULT_MIN_TEMP_F)
         self._max_temp_f = getattr(vendor_cfg, "max_temp_f", DEFAULT_MAX_TEMP_F)
+        self._throttle = coordinator.create_temperature_throttle()
+        self._throttle.offer(self._raw_current_temperature())
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        vendor_key = self._entry.data.get(CONF_VENDOR, "campchef")
-        vendor = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"]).name
-        address = self._entry.data[CONF_ADDRESS]
-        return DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            connections={(CONNECTION_BLUETOOTH, address)},
-            name=self._base_name,
-            manufacturer=vendor,
-            sw_version=self.coordinator._device_info.get("sw_version"),
-            hw_version=self.coordinator._device_info.get("hw_version"),
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            self._throttle.async_attach(self.hass, self.async_write_ha_state)
         )
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        published = self._throttle.offer(self._raw_current_temperature())
+        changed = self.coordinator.changed_fields
+        if published or changed is None or not MODE_FIELDS.isdisjoint(changed):
+            self.async_write_ha_state()
+
+    def _raw_current_temperature(self) -> Optional[float]:
+        return self.coordinator.value(FIELD_CHAMBER_TEMP)
 
     @property
     def hvac_mode(self) -> HVACMode:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         if mode and mode.mode == ModeName.RUN:
             return HVACMode.HEAT
         return HVACMode.OFF
 
     @property
     def hvac_modes(self) -> list[HVACMode]:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         if mode and mode.mode == ModeName.RUN:
             return [HVACMode.OFF, HVACMode.HEAT]
         return [HVACMode.OFF]
 
     @property
     def current_temperature(self) -> Optional[float]:
-        chamber = self.coordinator.data.chamber if self.coordinator.data else None
-        return chamber.temp_f if chamber and chamber.temp_f is not None else None
+        return self._throttle.value
 
     @property
     def target_temperature(self) -> Optional[float]:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         return float(mode.set_temp_f) if mode and mode.set_temp_f is not None else None
 
     @property
@@ -105,24 +102,14 @@ class CampChefThermostat(CoordinatorEntity[CampChefCoordinator], ClimateEntity):
         return ClimateEntityFeature(0)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
         if hvac_mode == HVACMode.OFF:
             # Setting OFF should drop the grill to standby
             if self.coordinator.client is None:
                 return
             try:
-                await self.coordinator.client.commands.set_mode(ModeName.STANDBY)
+                await self.coordinator.async_set_mode(ModeName.STANDBY)
             except Exception:
-                return
-            new_mode = GrillMode(
-                mode=ModeName.STANDBY,
-                set_temp_f=None,
-                smoke_level=None,
-                fan_level=None,
-            )
-            data = self.coordinator.data or GrillState()
-            data.mode = new_mode
-            self.coordinator.async_set_updated_data(data)
+                pass
             return
 
         if hvac_mode == HVACMode.HEAT and self.target_temperature is not None:
@@ -134,30 +121,10 @@ class CampChefThermostat(CoordinatorEntity[CampChefCoordinator], ClimateEntity):
             return
         if self.coordinator.client is None:
             return
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         if not mode or mode.mode != ModeName.RUN:
             # Ignore set attempts when not in RUN; UI should already hide controls
             return
-        smoke_level = mode.smoke_level if mode else None
-        if smoke_level is None:
-            try:
-                smoke_level = (await self.coordinator.client.commands.read_mode()).smoke_level
-            except Exception:
-                return
-        if smoke_level is None:
-            return
-        await self.coordinator.client.commands.set_temp_smoke(int(temperature), smoke_level)
-        # Optimistically update target temp so UI reflects the change immediately
-        if mode is None:
-            new_mode = GrillMode(set_temp_f=int(temperature), smoke_level=smoke_level)
-        else:
-            new_mode = GrillMode(
-                mode=mode.mode,
-                set_temp_f=int(temperature),
-                smoke_level=mode.smoke_level if mode.smoke_level is not None else smoke_level,
-                fan_level=mode.fan_level,
-            )
-        data = self.coordinator.data or GrillState()
-        data.mode = new_mode
-        self.coordinator.async_set_updated_data(data)
-        await self.coordinator.async_request_refresh()
+        # The target shows immediately through the coordinator's pending
+        # overlay and is confirmed by the next notification or poll.
+        await self.coordinator.async_set_temp_smoke(set_temp_f=int(temperature))
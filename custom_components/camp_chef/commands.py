@@ -0,0 +1,143 @@
+"""Per-grill queue that serializes BLE writes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+CommandExecutor = Callable[[dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class _QueuedCommand:
+    kind: str
+    args: dict[str, Any]
+    execute: CommandExecutor
+    coalesce: bool
+    futures: list[asyncio.Future] = field(default_factory=list)
+
+
+class CommandQueue:
+    """Run grill commands one at a time in submission order.
+
+    A coalescing command that is still waiting when another of the same kind
+    arrives is replaced in place: the two argument sets are merged (newer
+    non-None values win) and the merged command keeps the waiting one's
+    position in the queue. The superseded caller is released immediately
+    with ``False``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        on_change: Callable[[], None],
+        on_complete: Callable[[str, float, bool], None] | None = None,
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._on_change = on_change
+        self._on_complete = on_complete
+        self._pending: deque[_QueuedCommand] = deque()
+        self._worker: asyncio.Task | None = None
+        self._current: _QueuedCommand | None = None
+        self.last_latency: float | None = None
+        self.sent = 0
+        self.failed = 0
+        self.superseded = 0
+
+    @property
+    def depth(self) -> int:
+        """Commands waiting or in flight."""
+        return len(self._pending) + int(self._current is not None)
+
+    async def async_submit(
+        self,
+        kind: str,
+        args: dict[str, Any],
+        execute: CommandExecutor,
+        *,
+        coalesce: bool = True,
+    ) -> Any:
+        """Queue a command and wait for it to be written.
+
+        Returns the executor's result, or ``False`` if a later command of the
+        same kind superseded this one before it was sent.
+        """
+        future: asyncio.Future = self._hass.loop.create_future()
+        queued = self._find_coalescible(kind) if coalesce else None
+        if queued is not None:
+            queued.args.update((k, v) for k, v in args.items() if v is not None)
+            queued.execute = execute
+            for superseded in queued.futures:
+                if not superseded.done():
+                    superseded.set_result(False)
+            queued.futures = [future]
+            self.superseded += 1
+        else:
+            self._pending.append(_QueuedCommand(kind, dict(args), execute, coalesce, [future]))
+        if self._worker is None or self._worker.done():
+            self._worker = self._hass.async_create_background_task(
+                self._async_run(), f"{self._name} command queue"
+            )
+        self._on_change()
+        return await future
+
+    def _find_coalescible(self, kind: str) -> _QueuedCommand | None:
+        for queued in self._pending:
+            if queued.kind == kind and queued.coalesce:
+                return queued
+        return None
+
+    async def _async_run(self) -> None:
+        while self._pending:
+            command = self._current = self._pending.popleft()
+            start = time.monotonic()
+            # None if the worker is cancelled mid-command.
+            success: bool | None = None
+            try:
+                result = await command.execute(command.args)
+            except Exception as exc:  # noqa: BLE001 - surfaced to the caller
+                success = False
+                self.failed += 1
+                _LOGGER.debug("%s %s failed: %s", self._name, command.kind, exc)
+                for future in command.futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                success = True
+                self.sent += 1
+                for future in command.futures:
+                    if not future.done():
+                        future.set_result(result)
+            finally:
+                self.last_latency = time.monotonic() - start
+                self._current = None
+                if self._on_complete is not None and success is not None:
+                    self._on_complete(command.kind, self.last_latency, success)
+                self._on_change()
+
+    async def async_stop(self) -> None:
+        """Drop waiting commands and cancel the one in flight."""
+        commands = list(self._pending)
+        if self._current is not None:
+            commands.append(self._current)
+        self._pending.clear()
+        for command in commands:
+            for future in command.futures:
+                if not future.done():
+                    future.cancel()
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
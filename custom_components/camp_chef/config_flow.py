@@ -1,23 +1,40 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, Tuple
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
+    async_discovered_service_info,
 )
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
 
 from pycampchef import async_discover
-from pycampchef.const import VENDOR_CONFIGS
 
 from .const import (
     CONF_ADDRESS,
+    CONF_CHAMBER_BAND,
+    CONF_CHAMBER_BAND_MINUTES,
+    CONF_COALESCE_WINDOW,
     CONF_NAME,
+    CONF_PASSIVE,
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_MAX_INTERVAL,
+    CONF_TEMP_MIN_INTERVAL,
     CONF_VENDOR,
+    DEFAULT_CHAMBER_BAND,
+    DEFAULT_CHAMBER_BAND_MINUTES,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PASSIVE,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_MAX_INTERVAL,
+    DEFAULT_TEMP_MIN_INTERVAL,
     DOMAIN,
+    MAX_COALESCE_WINDOW,
 )
+from .vendors import DEFAULT_VENDOR, VENDORS
 
 
 class CampChefConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -27,16 +44,17 @@ class CampChefConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self._choices: Dict[str, Tuple[str, str]] = {}
         self._discovered: Dict[str, str] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> CampChefOptionsFlow:
+        return CampChefOptionsFlow(config_entry)
+
     def _vendor_from_discovery(self, discovery_info: BluetoothServiceInfoBleak) -> Tuple[str, Any]:
-        service_uuids = {uuid.lower() for uuid in discovery_info.service_uuids or []}
-        for key, cfg in VENDOR_CONFIGS.items():
-            if cfg.service_uuid.lower() in service_uuids:
-                return key, cfg
-        name = discovery_info.name or ""
-        for key, cfg in VENDOR_CONFIGS.items():
-            if name.startswith(cfg.adv_name_prefix):
-                return key, cfg
-        return "campchef", VENDOR_CONFIGS["campchef"]
+        key = VENDORS.match(discovery_info.service_uuids, discovery_info.name)
+        key = key or DEFAULT_VENDOR
+        return key, VENDORS.config(key)
 
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
@@ -74,21 +92,91 @@ class CampChefConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 },
             )
 
-        devices = await async_discover()
-        if not devices:
+        configured = self._async_current_ids()
+        candidates = self._cached_candidates(configured)
+        if not candidates:
+            # Nothing in Home Assistant's advertisement cache; scan ourselves.
+            candidates = [
+                (dev.address, name, VENDORS.key_for(vendor))
+                for dev, name, vendor in await async_discover()
+                if dev.address not in configured
+            ]
+        if not candidates:
             return self.async_abort(reason="no_devices_found")
 
         choices: Dict[str, str] = {}
         self._choices = {}
-        for dev, name, vendor in devices:
-            vendor_key = "campchef"
-            for key, cfg in VENDOR_CONFIGS.items():
-                if cfg == vendor:
-                    vendor_key = key
-                    break
-            title = name or f"{vendor.name} ({dev.address})"
-            choices[dev.address] = f"{title} ({vendor.name})"
-            self._choices[dev.address] = (title, vendor_key)
+        for address, name, vendor_key in candidates:
+            vendor = VENDORS.config(vendor_key)
+            title = name or f"{vendor.name} ({address})"
+            choices[address] = f"{title} ({vendor.name})"
+            self._choices[address] = (title, vendor_key)
 
         schema = vol.Schema({vol.Required(CONF_ADDRESS): vol.In(choices)})
         return self.async_show_form(step_id="user", data_schema=schema)
+
+    def _cached_candidates(
+        self, configured: Iterable[str | None]
+    ) -> list[Tuple[str, str | None, str]]:
+        """Grills Home Assistant has already heard, without scanning."""
+        candidates: list[Tuple[str, str | None, str]] = []
+        seen = set(configured)
+        for info in async_discovered_service_info(self.hass, connectable=False):
+            if info.address in seen:
+                continue
+            vendor_key = VENDORS.match(info.service_uuids, info.name)
+            if vendor_key is None:
+                continue
+            seen.add(info.address)
+            candidates.append((info.address, info.name, vendor_key))
+        return candidates
+
+
+class CampChefOptionsFlow(config_entries.OptionsFlow):
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_PASSIVE,
+                    default=options.get(CONF_PASSIVE, DEFAULT_PASSIVE),
+                ): bool,
+                vol.Required(
+                    CONF_COALESCE_WINDOW,
+                    default=options.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+                ): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+                ),
+                vol.Required(
+                    CONF_TEMP_DEADBAND,
+                    default=options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                vol.Required(
+                    CONF_TEMP_MIN_INTERVAL,
+                    default=options.get(CONF_TEMP_MIN_INTERVAL, DEFAULT_TEMP_MIN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_TEMP_MAX_INTERVAL,
+                    default=options.get(CONF_TEMP_MAX_INTERVAL, DEFAULT_TEMP_MAX_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_CHAMBER_BAND,
+                    default=options.get(CONF_CHAMBER_BAND, DEFAULT_CHAMBER_BAND),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=200)),
+                vol.Required(
+                    CONF_CHAMBER_BAND_MINUTES,
+                    default=options.get(
+                        CONF_CHAMBER_BAND_MINUTES, DEFAULT_CHAMBER_BAND_MINUTES
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=120)),
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
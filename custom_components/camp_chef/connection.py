@@ -0,0 +1,105 @@
+"""Connection slot budgeting for grills sharing Bluetooth adapters and proxies."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+# ESPHome Bluetooth proxies allow three active connections by default.
+DEFAULT_CONNECTION_SLOTS = 3
+
+
+@dataclass
+class _AdapterSlots:
+    slots: int
+    holders: set[Any] = field(default_factory=set)
+    waiters: deque[tuple[Any, asyncio.Future]] = field(default_factory=deque)
+
+
+class ConnectionManager:
+    """Hand out a fixed number of connection slots per adapter, first come first served.
+
+    One instance lives in ``hass.data[DOMAIN]`` and is shared by every
+    coordinator. A grill holds a slot while it is connected; polling grills
+    give theirs back between snapshots so more grills than slots can share a
+    proxy without starving each other.
+    """
+
+    def __init__(self, slots_per_adapter: int = DEFAULT_CONNECTION_SLOTS) -> None:
+        self._slots_per_adapter = slots_per_adapter
+        self._adapters: dict[str, _AdapterSlots] = {}
+
+    def _adapter(self, source: str) -> _AdapterSlots:
+        adapter = self._adapters.get(source)
+        if adapter is None:
+            adapter = self._adapters[source] = _AdapterSlots(self._slots_per_adapter)
+        return adapter
+
+    def holds(self, source: str, owner: Any) -> bool:
+        return owner in self._adapter(source).holders
+
+    def has_waiters(self, source: str) -> bool:
+        return bool(self._adapter(source).waiters)
+
+    async def async_acquire(self, source: str, owner: Any) -> bool:
+        """Wait for a slot on ``source``; returns False if already held."""
+        adapter = self._adapter(source)
+        if owner in adapter.holders:
+            return False
+        if len(adapter.holders) < adapter.slots and not adapter.waiters:
+            adapter.holders.add(owner)
+            return True
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        adapter.waiters.append((owner, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the waiter gave up; pass the slot on.
+                self.release(source, owner)
+            else:
+                adapter.waiters = deque(w for w in adapter.waiters if w[1] is not future)
+            raise
+        return True
+
+    def release(self, source: str, owner: Any) -> None:
+        adapter = self._adapter(source)
+        adapter.holders.discard(owner)
+        while adapter.waiters and len(adapter.holders) < adapter.slots:
+            waiter, future = adapter.waiters.popleft()
+            if future.done():
+                continue
+            adapter.holders.add(waiter)
+            future.set_result(None)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            source: {
+                "slots": adapter.slots,
+                "in_use": len(adapter.holders),
+                "waiting": len(adapter.waiters),
+            }
+            for source, adapter in self._adapters.items()
+        }
+
+
+@dataclass
+class ConnectStats:
+    """Connect attempts, outcomes and latency of one grill."""
+
+    attempts: int = 0
+    successes: int = 0
+    last_latency: float | None = None
+
+    @property
+    def success_rate(self) -> float | None:
+        if not self.attempts:
+            return None
+        return self.successes / self.attempts
+
+    def record(self, success: bool, latency: float) -> None:
+        self.attempts += 1
+        if success:
+            self.successes += 1
+            self.last_latency = latency
@@ -7,7 +7,32 @@ CONF_ADDRESS = "address"
 CONF_VENDOR = "vendor"
 CONF_NAME = "name"
 
+# Key in hass.data[DOMAIN] holding the shared ConnectionManager.
+DATA_CONNECTIONS = "connections"
+# Directory under the config dir that telemetry captures are written to.
+CAPTURE_DIR = "camp_chef_captures"
+
 DEFAULT_MIN_TEMP_F = 160
 DEFAULT_MAX_TEMP_F = 500
 SMOKE_MIN_DEFAULT = 1
 SMOKE_MAX_DEFAULT = 10
+PROBE_TARGET_MAX_F = 300
+
+CONF_COALESCE_WINDOW = "coalesce_window"
+DEFAULT_COALESCE_WINDOW = 0.0
+MAX_COALESCE_WINDOW = 5.0
+
+CONF_TEMP_DEADBAND = "temperature_deadband"
+CONF_TEMP_MIN_INTERVAL = "temperature_min_interval"
+CONF_TEMP_MAX_INTERVAL = "temperature_max_interval"
+DEFAULT_TEMP_DEADBAND = 0.0
+DEFAULT_TEMP_MIN_INTERVAL = 0
+DEFAULT_TEMP_MAX_INTERVAL = 0
+
+CONF_PASSIVE = "passive"
+DEFAULT_PASSIVE = False
+
+CONF_CHAMBER_BAND = "chamber_band"
+CONF_CHAMBER_BAND_MINUTES = "chamber_band_minutes"
+DEFAULT_CHAMBER_BAND = 25.0
+DEFAULT_CHAMBER_BAND_MINUTES = 10
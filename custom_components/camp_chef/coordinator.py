@@ -1,25 +1,156 @@
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from collections import Counter
+from collections.abc import Iterable, Mapping
 from typing import Any, Optional
 
-from homeassistant.components.bluetooth import async_ble_device_from_address
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.components.bluetooth import (
+    BluetoothCallbackMatcher,
+    BluetoothChange,
+    BluetoothScanningMode,
+    BluetoothServiceInfoBleak,
+    async_ble_device_from_address,
+    async_last_service_info,
+    async_register_callback,
+    async_scanner_devices_by_address,
+    async_track_unavailable,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from bleak.backends.device import BLEDevice
 from pycampchef.client import CampChefBleClient
-from pycampchef.const import ModeName, VENDOR_CONFIGS
+from pycampchef.const import ModeName
 from pycampchef.models import GrillChamber, GrillMode, GrillProbe, GrillState
 
-from .const import DOMAIN
+from .alarms import Alarm, AlarmEngine
+from .backoff import ReconnectBreaker
+from .commands import CommandQueue
+from .connection import ConnectionManager, ConnectStats
+from .const import (
+    CONF_CHAMBER_BAND,
+    CONF_CHAMBER_BAND_MINUTES,
+    CONF_COALESCE_WINDOW,
+    CONF_PASSIVE,
+    CONF_TEMP_DEADBAND,
+    CONF_TEMP_MAX_INTERVAL,
+    CONF_TEMP_MIN_INTERVAL,
+    DEFAULT_CHAMBER_BAND,
+    DEFAULT_CHAMBER_BAND_MINUTES,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_PASSIVE,
+    DEFAULT_TEMP_DEADBAND,
+    DEFAULT_TEMP_MAX_INTERVAL,
+    DEFAULT_TEMP_MIN_INTERVAL,
+    DOMAIN,
+)
+from .capture import TelemetryCapture
+from .eta import ProbeEstimator
+from .history import (
+    SOURCE_NOTIFICATION,
+    SOURCE_POLL,
+    SOURCE_WRITE,
+    TelemetryHistory,
+)
+from .metrics import GrillMetrics
+from .overlay import PendingOverlay
+from .pellets import PELLET_FIELDS, PelletEstimator
+from .programs import CookProgram, ProgramStep
+from .scheduler import POLL_INTERVAL_FAST, AdaptivePollScheduler
+from .sources import SourceSelector
+from .state import (
+    DEVICE_FIELDS,
+    FIELD_BLE_PRESENT,
+    FIELD_BLE_RSSI,
+    FIELD_COMMAND_LATENCY,
+    FIELD_COMMAND_QUEUE,
+    FIELD_CONNECT_LATENCY,
+    FIELD_CONNECT_SUCCESS,
+    FIELD_ESP_FW,
+    FIELD_FAN_LEVEL,
+    FIELD_FAULT,
+    FIELD_MODE,
+    FIELD_MODEL_FW,
+    FIELD_PROBE_COUNT,
+    FIELD_PROGRAM_STEP,
+    FIELD_SET_TEMP,
+    FIELD_SMOKE_LEVEL,
+    METRIC_FIELDS,
+    PELLET_ESTIMATE_FIELDS,
+    SLOW_GROUPS,
+    SNAPSHOT_GROUPS,
+    diff_fields,
+    encode_fields,
+    field_group,
+    flatten_state,
+    probe_connected_field,
+    probe_eta_field,
+    probe_target_field,
+    probe_temp_field,
+    restore_state,
+)
+from .stream import TelemetryStream
+from .throttle import TemperatureThrottle
+from .timeseries import CookSeries
+from .vendors import VENDORS
 
 POLL_INTERVAL_NOTIFY_BACKSTOP = timedelta(seconds=120)
-POLL_INTERVAL_POLLING = timedelta(seconds=20)
+# Changes to these fields bypass the coalescing window.
+URGENT_FIELDS = frozenset({FIELD_MODE, FIELD_FAULT})
+# How long a written value may go unconfirmed before entities fall back to
+# the reported one. Longer than the polling interval so a poll can confirm it.
+PENDING_COMMAND_TIMEOUT = 60
+# Polling grills keep their connection between snapshots closer than this
+# (unless another grill is waiting for the slot) to avoid reconnect churn.
+IDLE_DISCONNECT_MIN_INTERVAL = timedelta(seconds=20)
+# How long a poll waits for a connection slot before giving up this round.
+SLOT_WAIT_TIMEOUT = 30
+# Next poll after a failure the breaker does not count, such as no free slot.
+SLOT_RETRY_INTERVAL = timedelta(seconds=30)
+# Advertisement RSSI jitters by a dB or two; ignore moves smaller than this.
+RSSI_DEADBAND = 3
+# Metric sensors are refreshed on a timer rather than per notification.
+METRICS_PUBLISH_INTERVAL = timedelta(seconds=60)
+# Groups the coordinator itself needs (poll scheduling, control entities,
+# alarms, the pellet model and the cook series' chamber channel).
+ALWAYS_READ_GROUPS = frozenset({"mode", "status", "chamber"})
+# How often Wi-Fi, OTA and device info are re-read in polling mode.
+SLOW_GROUP_INTERVAL = 1800
+# Client command used to read a single snapshot group.
+GROUP_READERS = {
+    "mode": "read_mode",
+    "status": "read_status",
+    "chamber": "read_chamber",
+    "probes": "read_probes",
+    "wifi": "read_wifi",
+    "ota": "read_ota",
+    "device": "read_device",
+}
+STORAGE_VERSION = 1
+# At most one cache write per this many seconds while the grill reports.
+# Unload saves directly, and Store flushes a pending write on shutdown.
+CACHE_SAVE_DELAY = 60
 _LOGGER = logging.getLogger(__name__)
 
 
+def cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """The Store holding an entry's last known state."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
 class CampChefCoordinator(DataUpdateCoordinator[GrillState]):
     def __init__(
         self,
@@ -29,14 +160,81 @@ class CampChefCoordinator(DataUpdateCoordinator[GrillState]):
         vendor_key: str,
         name: str,
         entry_id: str,
+        options: Mapping[str, Any] | None = None,
+        connections: ConnectionManager | None = None,
     ) -> None:
-        vendor = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"])
+        vendor = VENDORS.config(vendor_key)
         self._address = address
         self._vendor = vendor
         self._name = name
         self._entry_id = entry_id
         self.client: Optional[CampChefBleClient] = None
-        self._device_info: dict[str, Any] = {}
+        self.device_info: DeviceInfo | None = None
+        self._fields: dict[str, Any] = {}
+        # Fields changed by the update being dispatched; None means "everything".
+        self.changed_fields: frozenset[str] | None = None
+        self._published_success = True
+        options = options or {}
+        self.options: Mapping[str, Any] = options
+        self._coalesce_window: float = options.get(
+            CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+        )
+        self._coalesced_fields: set[str] = set()
+        self._unsub_coalesce: CALLBACK_TYPE | None = None
+        self.metrics = GrillMetrics()
+        self.history = TelemetryHistory()
+        self.capture: TelemetryCapture | None = None
+        self.cook = CookSeries()
+        self.stream = TelemetryStream(hass)
+        # Snapshot groups held by non-entity consumers, with a count each.
+        self._consumer_groups: Counter[str] = Counter()
+        self.estimators: dict[int, ProbeEstimator] = {}
+        # Minute-rounded ETA and stall flag last published per probe.
+        self.probe_eta: dict[int, tuple[datetime | None, bool]] = {}
+        # When each probe at its target got there, held as its ETA.
+        self._probe_reached: dict[int, datetime] = {}
+        self._probe_targets: dict[int, float] = {}
+        self.pellets = PelletEstimator()
+        self.program = CookProgram(
+            hass,
+            name,
+            self._async_apply_program_step,
+            self._async_program_changed,
+            lambda: self._fields,
+        )
+        # Options changes reload the entry, so the rules are compiled once.
+        self.alarms = AlarmEngine(
+            self._probe_targets,
+            options.get(CONF_CHAMBER_BAND, DEFAULT_CHAMBER_BAND),
+            options.get(CONF_CHAMBER_BAND_MINUTES, DEFAULT_CHAMBER_BAND_MINUTES),
+        )
+        self._unsub_alarm_check: CALLBACK_TYPE | None = None
+        self._alarm_due: float | None = None
+        self.commands = CommandQueue(
+            hass, name, self._async_commands_changed, self._record_command
+        )
+        self.overlay = PendingOverlay(hass, PENDING_COMMAND_TIMEOUT, self._async_notify)
+        self.scheduler = AdaptivePollScheduler()
+        self._connections = connections or ConnectionManager()
+        self._slot_source: str | None = None
+        # Adapter or proxy the current client connects through.
+        self._source: str | None = None
+        self.sources = SourceSelector()
+        self.breaker = ReconnectBreaker()
+        self._full_snapshot_at: float | None = None
+        self._slow_groups_at = 0.0
+        self.connect_stats = ConnectStats()
+        self._store = cache_store(hass, entry_id)
+        self._save_pending = False
+        self.restored = False
+        # Passive grills are followed through advertisements only and are
+        # connected just long enough to send a command or take a snapshot.
+        self.passive: bool = options.get(CONF_PASSIVE, DEFAULT_PASSIVE)
+        self.rssi: int | None = None
+        self.present: bool | None = None
+        self.last_seen: float | None = None
+        # Timer and Bluetooth listeners held from async_start to async_stop.
+        self._unsubs: list[CALLBACK_TYPE] = []
         self.update_interval: timedelta | None = timedelta(seconds=15)
         self.data: GrillState | None = GrillState()
         self.last_update_success = True
@@ -46,73 +244,844 @@ class CampChefCoordinator(DataUpdateCoordinator[GrillState]):
             name=f"{name} BLE",
             update_interval=timedelta(seconds=15),
         )
+        if self.passive:
+            self.update_interval = None
+        self._update_device_info()
 
-    async def async_start(self) -> None:
-        ble_device = async_ble_device_from_address(self.hass, self._address)
-        if ble_device is None:
-            ble_device = async_ble_device_from_address(
-                self.hass, self._address, connectable=False
+    async def async_load_cache(self) -> bool:
+        """Seed data from the state persisted by a previous run.
+
+        Returns True if a cached state was found, in which case setup can
+        create entities without waiting for the grill.
+        """
+        cached = await self._store.async_load()
+        if cached:
+            self._probe_targets.update(
+                (int(index), target)
+                for index, target in cached.get("probe_targets", {}).items()
             )
-        if ble_device is None:
+            if "pellets" in cached:
+                self.pellets.load(cached["pellets"])
+            if cached.get("program"):
+                self.program.load(cached["program"])
+        if not cached or not cached.get("fields"):
+            return False
+        self.data = restore_state(cached["fields"])
+        self._fields = flatten_state(self.data)
+        self.history.base = encode_fields(self._fields)
+        self.alarms.seed(self._fields)
+        self._update_device_info()
+        self.restored = True
+        return True
+
+    @callback
+    def _cache_data(self) -> dict[str, Any]:
+        return {
+            "fields": encode_fields(self._fields),
+            "probe_targets": {
+                str(index): target for index, target in self._probe_targets.items()
+            },
+            "pellets": self.pellets.as_store(),
+            "program": self.program.as_store(),
+        }
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Write the cache within ``CACHE_SAVE_DELAY`` of a change.
+
+        ``async_delay_save`` restarts its delay on every call, so calling it
+        on every update would hold the write back for as long as the grill
+        keeps reporting. A save is only scheduled when none is pending; it
+        picks up whatever changed in the meantime when it runs.
+        """
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._pending_cache_data, CACHE_SAVE_DELAY)
+
+    def _pending_cache_data(self) -> dict[str, Any]:
+        self._save_pending = False
+        return self._cache_data()
+
+    @property
+    def probe_count(self) -> int:
+        return self._fields.get(FIELD_PROBE_COUNT) or 0
+
+    async def async_start(self) -> None:
+        if not self._async_create_client() and not self.restored:
             raise ConfigEntryNotReady("BLE device not yet available")
+        self._unsubs = [
+            async_track_time_interval(
+                self.hass, self._async_publish_metrics, METRICS_PUBLISH_INTERVAL
+            ),
+            async_register_callback(
+                self.hass,
+                self._async_handle_advertisement,
+                BluetoothCallbackMatcher(address=self._address, connectable=False),
+                BluetoothScanningMode.PASSIVE,
+            ),
+            async_track_unavailable(
+                self.hass, self._async_handle_unavailable, self._address, connectable=False
+            ),
+        ]
+        if self.config_entry is not None:
+            # Whatever happens to this coordinator, the listeners go with the
+            # entry: on unload and when its setup fails or is retried.
+            self.config_entry.async_on_unload(self._async_cancel_listeners)
+        self.program.async_resume()
+        # Client is ready (or will be created once the grill is in range).
+        # Without a cached state the caller should use
+        # async_config_entry_first_refresh() to guarantee real grill data
+        # exists before entity setup.
+
+    def _async_create_client(
+        self, ble_device: BLEDevice | None = None, source: str | None = None
+    ) -> bool:
+        if ble_device is None:
+            ble_device = async_ble_device_from_address(self.hass, self._address)
+            if ble_device is None:
+                ble_device = async_ble_device_from_address(
+                    self.hass, self._address, connectable=False
+                )
+            if ble_device is None:
+                return False
+            service_info = async_last_service_info(self.hass, self._address)
+            source = service_info.source if service_info is not None else None
 
+        self._source = source
         self.client = CampChefBleClient(
             ble_device,
             vendor=self._vendor,
             on_update=self._handle_telemetry,
         )
-        # Client is ready. Caller should use async_config_entry_first_refresh()
-        # to guarantee real grill data exists before entity setup.
+        return True
+
+    @callback
+    def _async_cancel_listeners(self) -> None:
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+
+    @property
+    def entry_loaded(self) -> bool:
+        """Whether this coordinator belongs to a loaded config entry."""
+        entry = self.config_entry
+        return entry is not None and entry.state is ConfigEntryState.LOADED
 
     async def async_stop(self) -> None:
-        if self.client is not None:
-            await self.client.disconnect()
+        self._async_cancel_listeners()
+        self._cancel_coalesce()
+        self._cancel_alarm_check()
+        self.stream.async_close()
+        self.program.async_shutdown()
+        await self.commands.async_stop()
+        self.overlay.async_clear()
+        await self._async_disconnect()
+        await self.async_stop_capture()
+        if self._fields:
+            self._save_pending = False
+            await self._store.async_save(self._cache_data())
+
+    async def async_start_capture(self, path: Path) -> None:
+        """Start recording every update and command to ``path``."""
+        await self.async_stop_capture()
+        capture = TelemetryCapture(self.hass, path)
+        await capture.async_open(
+            {"address": self._address, "name": self._name}, self._fields
+        )
+        self.capture = capture
+
+    async def async_stop_capture(self) -> Path | None:
+        """Finish the running capture and return its file, if any."""
+        capture, self.capture = self.capture, None
+        if capture is None:
+            return None
+        await capture.async_close()
+        return capture.path
 
     async def _async_update_data(self) -> GrillState:
-        if self.client is None:
-            raise ConfigEntryNotReady("BLE client not connected")
+        if self.client is None and not self._async_create_client():
+            raise UpdateFailed("BLE device not yet available")
 
+        now = time.monotonic()
+        if not self.breaker.allow(now):
+            self._async_schedule_retry(now)
+            raise UpdateFailed(
+                f"Waiting {self.breaker.retry_in(now):.0f}s before reconnecting"
+            )
         try:
-            await self.client.ensure_connected()
-        except Exception as exc:
-            raise ConfigEntryNotReady(f"Unable to connect: {exc}") from exc
+            await self._async_connect()
+        except UpdateFailed:
+            self._async_schedule_retry(time.monotonic())
+            raise
 
         notify_ok = self.client.is_notifying
 
-        # Adjust poll interval based on mode (optional but nice)
-        self.update_interval = POLL_INTERVAL_NOTIFY_BACKSTOP if notify_ok else POLL_INTERVAL_POLLING
-
         try:
             if notify_ok:
                 # Prefer cached state (from notifications). If none yet, do a snapshot once.
                 if self.data is not None:
                     data = self.client.state
                 else:
-                    data = await self.client.get_state_snapshot()
+                    data = await self._async_snapshot()
             else:
-                data = await self.client.get_state_snapshot()
+                data = await self._async_read_snapshot()
         except Exception as exc:
             raise UpdateFailed(str(exc)) from exc
 
-        self.data = data
-        self._update_device_info()
+        changed = self._track_fields(data, SOURCE_POLL)
+        changed |= self._coalesced_fields
+        self._cancel_coalesce()
+        self.changed_fields = frozenset(changed)
+
+        # Notifications carry the live data, so polling is only a backstop.
+        # Otherwise poll as fast as the grill's current situation warrants.
+        if self.passive:
+            self.update_interval = None
+            if not self.commands.depth:
+                await self._async_disconnect()
+        elif notify_ok:
+            self.update_interval = POLL_INTERVAL_NOTIFY_BACKSTOP
+        else:
+            self.update_interval = self.scheduler.interval(
+                self._fields, pending_write=bool(self.overlay)
+            )
+            if self._should_idle_disconnect():
+                await self._async_disconnect()
         return self.data
 
-    def _update_device_info(self) -> None:
-        """Update cached device info for entities."""
-        device = getattr(self.data, "device", None)
-        info = getattr(device, "info", None)
-        self._device_info = {
-            "sw_version": getattr(device, "model_fw", None),
-            "hw_version": getattr(device, "esp_fw", None),
-            "model": getattr(info, "model_id", None) if info else None,
+    @callback
+    def async_register_groups(self, groups: Iterable[str]) -> CALLBACK_TYPE:
+        """Keep ``groups`` read for a consumer that is not an entity.
+
+        Returns the callback that releases them again.
+        """
+        groups = frozenset(groups)
+        self._consumer_groups.update(groups)
+
+        @callback
+        def _release() -> None:
+            self._consumer_groups.subtract(groups)
+            for group in groups:
+                if self._consumer_groups[group] <= 0:
+                    del self._consumer_groups[group]
+
+        return _release
+
+    def _internal_groups(self) -> set[str]:
+        """Groups the coordinator's own consumers need beyond the always-read ones."""
+        groups = set(self._consumer_groups)
+        step = self.program.step
+        if (
+            # Probe ETAs and target alarms.
+            self._probe_targets
+            # The cook series records the probes while the grill runs.
+            or self._fields.get(FIELD_MODE) == ModeName.RUN
+            or (step is not None and step.probe is not None)
+        ):
+            groups.add("probes")
+        return groups
+
+    def _groups_to_read(self, now: float) -> set[str] | None:
+        """Snapshot groups somebody needs; None for a full read.
+
+        Disabled entities are never added to hass, so the contexts of the
+        registered listeners are exactly the fields on screen. The
+        coordinator's own consumers add theirs through ``_internal_groups``.
+        """
+        if self._full_snapshot_at is None:
+            return None
+        groups = set(ALWAYS_READ_GROUPS)
+        groups |= self._internal_groups()
+        for context in self.async_contexts():
+            groups.update(field_group(field) for field in context)
+        groups &= SNAPSHOT_GROUPS
+        if now - self._slow_groups_at >= SLOW_GROUP_INTERVAL:
+            # Device info is always refreshed so firmware updates show up.
+            groups.add("device")
+        else:
+            groups -= SLOW_GROUPS
+        if any(
+            getattr(self.client.commands, GROUP_READERS[group], None) is None
+            for group in groups
+        ):
+            return None
+        return groups
+
+    async def _async_read_snapshot(self) -> GrillState:
+        """Poll the grill, reading only the groups somebody looks at."""
+        now = time.monotonic()
+        groups = self._groups_to_read(now)
+        if groups is None:
+            data = await self._async_snapshot()
+            self._full_snapshot_at = self._slow_groups_at = now
+            return data
+        data = self.data
+        start = time.monotonic()
+        try:
+            for group in groups:
+                setattr(data, group, await getattr(self.client.commands, GROUP_READERS[group])())
+        except Exception:
+            self.metrics.snapshot_failures += 1
+            raise
+        self.metrics.snapshot.observe(time.monotonic() - start)
+        if not groups.isdisjoint(SLOW_GROUPS):
+            self._slow_groups_at = now
+        return data
+
+    def _async_select_source(self) -> None:
+        """Point the client at the connectable source hearing the grill best."""
+        devices = {
+            scanner_device.scanner.source: scanner_device
+            for scanner_device in async_scanner_devices_by_address(
+                self.hass, self._address, connectable=True
+            )
+        }
+        chosen = self.sources.select(
+            {source: device.advertisement.rssi for source, device in devices.items()}
+        )
+        if chosen is None or chosen not in devices:
+            return
+        if self.client is not None and chosen == self._source:
+            return
+        _LOGGER.debug("%s: connecting through %s", self._name, chosen)
+        self._async_create_client(devices[chosen].ble_device, chosen)
+
+    async def _async_connect(self) -> None:
+        """Take a connection slot on the grill's adapter and connect."""
+        if self._slot_source is None:
+            # Not holding a connection, so this is a (re)connect: take the
+            # opportunity to move to a better adapter or proxy.
+            self._async_select_source()
+        if self.client is None:
+            raise UpdateFailed("BLE device not yet available")
+        source = self._source or "default"
+        try:
+            fresh = await asyncio.wait_for(
+                self._connections.async_acquire(source, self), SLOT_WAIT_TIMEOUT
+            )
+        except asyncio.TimeoutError as exc:
+            raise UpdateFailed(f"No free connection slot on {source}") from exc
+        self._slot_source = source
+
+        start = time.monotonic()
+        try:
+            await self.client.ensure_connected()
+        except Exception as exc:
+            now = time.monotonic()
+            self.breaker.record_failure(now, str(exc))
+            if fresh:
+                self._record_connect(False, now - start)
+            self._connections.release(source, self)
+            self._slot_source = None
+            raise UpdateFailed(f"Unable to connect: {exc}") from exc
+        self.breaker.record_success()
+        if fresh:
+            self._record_connect(True, time.monotonic() - start)
+
+    def _async_schedule_retry(self, now: float) -> None:
+        """Line the next poll up with the breaker's next allowed attempt."""
+        if self.passive:
+            return
+        retry_in = self.breaker.retry_in(now)
+        self.update_interval = (
+            timedelta(seconds=max(1.0, retry_in)) if retry_in > 0 else SLOT_RETRY_INTERVAL
+        )
+
+    async def _async_disconnect(self) -> None:
+        """Drop the connection and hand the slot to the next grill."""
+        try:
+            if self.client is not None:
+                await self.client.disconnect()
+        finally:
+            if self._slot_source is not None:
+                self._connections.release(self._slot_source, self)
+                self._slot_source = None
+
+    def _should_idle_disconnect(self) -> bool:
+        if self._slot_source is None or self.commands.depth:
+            return False
+        if self._connections.has_waiters(self._slot_source):
+            return True
+        return (
+            self.update_interval is not None
+            and self.update_interval >= IDLE_DISCONNECT_MIN_INTERVAL
+        )
+
+    async def _async_snapshot(self) -> GrillState:
+        start = time.monotonic()
+        try:
+            data = await self.client.get_state_snapshot()
+        except Exception:
+            self.metrics.snapshot_failures += 1
+            raise
+        self.metrics.snapshot.observe(time.monotonic() - start)
+        return data
+
+    def _record_connect(self, success: bool, latency: float) -> None:
+        self.connect_stats.record(success, latency)
+        self.metrics.connect.observe(latency)
+        if not success:
+            self.metrics.connect_failures += 1
+        self._async_notify({FIELD_CONNECT_LATENCY, FIELD_CONNECT_SUCCESS})
+
+    def _track_fields(self, state: GrillState, source: str) -> set[str]:
+        """Store the new state and return the fields that moved."""
+        now = time.monotonic()
+        fields = flatten_state(state)
+        changed = diff_fields(self._fields, fields)
+        self.history.record(now, source, fields, changed)
+        wall_time = time.time()
+        self.cook.observe(now, wall_time, fields, changed)
+        if self.stream:
+            self.stream.publish(fields, changed)
+        if self.capture is not None:
+            self.capture.record(source, fields, changed)
+        if changed:
+            self._fire_alarms(now, fields, changed)
+        changed |= self._update_estimators(now, wall_time, fields, changed)
+        if not changed.isdisjoint(PELLET_FIELDS) and self.pellets.add(now, fields):
+            changed |= PELLET_ESTIMATE_FIELDS
+        if self.overlay:
+            changed |= self.overlay.confirm(fields)
+        self._fields = fields
+        self.data = state
+        self.scheduler.observe(fields, now)
+        if self.program.running:
+            self.program.observe(fields, changed)
+        if changed:
+            self._async_schedule_save()
+        if changed & DEVICE_FIELDS:
+            self._update_device_info()
+        return changed
+
+    def _fire_alarms(self, now: float, fields: dict[str, Any], changed: set[str]) -> None:
+        alarms = self.alarms.evaluate(
+            now, fields, changed, fields.get(FIELD_PROBE_COUNT) or 0
+        )
+        self._schedule_alarm_check(now)
+        if alarms:
+            self._dispatch_alarms(alarms)
+
+    def _schedule_alarm_check(self, now: float) -> None:
+        """Keep a timer on the next time-based alarm, e.g. the chamber band."""
+        due = self.alarms.due
+        if due == self._alarm_due:
+            return
+        self._cancel_alarm_check()
+        if due is not None:
+            self._alarm_due = due
+            self._unsub_alarm_check = async_call_later(
+                self.hass, max(due - now, 0.0), self._async_alarm_check
+            )
+
+    @callback
+    def _async_alarm_check(self, _now: Any) -> None:
+        self._unsub_alarm_check = None
+        self._alarm_due = None
+        now = time.monotonic()
+        alarms = self.alarms.evaluate_due(now, self._fields)
+        self._schedule_alarm_check(now)
+        if alarms:
+            self._dispatch_alarms(alarms)
+
+    def _cancel_alarm_check(self) -> None:
+        if self._unsub_alarm_check is not None:
+            self._unsub_alarm_check()
+            self._unsub_alarm_check = None
+        self._alarm_due = None
+
+    def _dispatch_alarms(self, alarms: list[Alarm]) -> None:
+        device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self._address)}
+        )
+        base = {
+            "device_id": device.id if device is not None else None,
+            "entry_id": self._entry_id,
+            "address": self._address,
+            "name": self._name,
         }
+        for event_type, data in alarms:
+            _LOGGER.debug("%s: %s %s", self._name, event_type, data)
+            self.hass.bus.async_fire(event_type, {**base, **data})
+
+    def _update_estimators(
+        self, now: float, wall_time: float, fields: dict[str, Any], changed: set[str]
+    ) -> set[str]:
+        """Feed changed probe readings to their estimators; O(1) per probe."""
+        eta_changed: set[str] = set()
+        for index in range(fields.get(FIELD_PROBE_COUNT) or 0):
+            temp_field = probe_temp_field(index)
+            connected_field = probe_connected_field(index)
+            if temp_field not in changed and connected_field not in changed:
+                continue
+            estimator = self.estimators.get(index)
+            if estimator is None:
+                estimator = self.estimators[index] = ProbeEstimator(
+                    self._probe_targets.get(index)
+                )
+            estimator.add(now, fields.get(temp_field) if fields.get(connected_field) else None)
+            if self._refresh_eta(index, wall_time):
+                eta_changed.add(probe_eta_field(index))
+        return eta_changed
+
+    def _refresh_eta(self, index: int, wall_time: float) -> bool:
+        """Recompute a probe's published ETA; True if it moved."""
+        estimator = self.estimators.get(index)
+        remaining = estimator.remaining() if estimator else None
+        eta = None
+        if remaining == 0:
+            # Reached: keep the time it happened instead of following the clock.
+            eta = self._probe_reached.setdefault(
+                index, dt_util.utc_from_timestamp(round(wall_time / 60) * 60)
+            )
+        else:
+            self._probe_reached.pop(index, None)
+            if remaining is not None:
+                # Whole minutes, so the sensor is not rewritten on every reading.
+                eta = dt_util.utc_from_timestamp(round((wall_time + remaining) / 60) * 60)
+        published = (eta, bool(estimator and estimator.stalled))
+        if self.probe_eta.get(index) == published:
+            return False
+        self.probe_eta[index] = published
+        return True
+
+    def probe_target(self, index: int) -> float | None:
+        return self._probe_targets.get(index)
+
+    @callback
+    def async_set_probe_target(self, index: int, target: float | None) -> None:
+        """Set (or with None or 0, clear) the temperature a probe cooks to."""
+        if target:
+            self._probe_targets[index] = float(target)
+        else:
+            self._probe_targets.pop(index, None)
+        if (estimator := self.estimators.get(index)) is not None:
+            estimator.target = self._probe_targets.get(index)
+        self.alarms.rearm_probe(index)
+        self._probe_reached.pop(index, None)
+        self._async_schedule_save()
+        self._refresh_eta(index, time.time())
+        self._async_notify({probe_target_field(index), probe_eta_field(index)})
+
+    async def _async_apply_program_step(self, step: ProgramStep) -> bool:
+        """Write only the settings of ``step`` the grill is not already at.
+
+        Like the climate and smoke entities, this never lights the grill:
+        the only mode a step can set is standby, and the temperature and
+        smoke level are only written while the grill reports RUN. Returns
+        False if the step has to wait for the grill to be running.
+        """
+        mode = self.mode
+        if step.mode is not None:
+            target = ModeName[step.mode]
+            if target != ModeName.STANDBY:
+                raise HomeAssistantError(f"Cook programs cannot switch to {step.mode}")
+            if getattr(mode, "mode", None) != target:
+                await self.async_set_mode(target)
+            return True
+        if step.set_temp is None and step.smoke_level is None:
+            return True
+        if getattr(self.data.mode if self.data else None, "mode", None) != ModeName.RUN:
+            return False
+        set_temp = step.set_temp
+        if set_temp is not None and getattr(mode, "set_temp_f", None) == set_temp:
+            set_temp = None
+        smoke_level = step.smoke_level
+        if smoke_level is not None and getattr(mode, "smoke_level", None) == smoke_level:
+            smoke_level = None
+        if set_temp is not None or smoke_level is not None:
+            await self.async_set_temp_smoke(set_temp_f=set_temp, smoke_level=smoke_level)
+        return True
+
+    @callback
+    def _async_program_changed(self) -> None:
+        self._async_schedule_save()
+        self._async_notify({FIELD_PROGRAM_STEP})
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Only notify entities whose context overlaps the changed fields.
+
+        Entities register a frozenset of field keys as their coordinator
+        context; a context of None subscribes to every update. While the
+        listeners run, ``changed_fields`` holds the set being dispatched.
+        """
+        changed = self.changed_fields
+        success_changed = self.last_update_success != self._published_success
+        self._published_success = self.last_update_success
+        try:
+            if changed is None or success_changed:
+                self.changed_fields = None
+                super().async_update_listeners()
+                return
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or not context.isdisjoint(changed):
+                    update_callback()
+        finally:
+            self.changed_fields = None
+
+    def create_temperature_throttle(self) -> TemperatureThrottle:
+        """Return a publish throttle configured from the entry options."""
+        return TemperatureThrottle(
+            self.options.get(CONF_TEMP_DEADBAND, DEFAULT_TEMP_DEADBAND),
+            self.options.get(CONF_TEMP_MIN_INTERVAL, DEFAULT_TEMP_MIN_INTERVAL),
+            self.options.get(CONF_TEMP_MAX_INTERVAL, DEFAULT_TEMP_MAX_INTERVAL),
+        )
+
+    def _update_device_info(self) -> None:
+        """Rebuild the DeviceInfo shared by all entities of this grill.
+
+        Entities hand the registry their device info only when they are
+        added, so a firmware change is pushed to the registry directly.
+        """
+        sw_version = self._fields.get(FIELD_MODEL_FW)
+        hw_version = self._fields.get(FIELD_ESP_FW)
+        previous = self.device_info
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self._address)},
+            connections={(CONNECTION_BLUETOOTH, self._address)},
+            name=self._name,
+            manufacturer=self._vendor.name,
+            sw_version=sw_version,
+            hw_version=hw_version,
+        )
+        if previous is None or (
+            previous.get("sw_version"),
+            previous.get("hw_version"),
+        ) == (sw_version, hw_version):
+            return
+        registry = dr.async_get(self.hass)
+        device = registry.async_get_device(identifiers={(DOMAIN, self._address)})
+        if device is not None:
+            registry.async_update_device(
+                device.id, sw_version=sw_version, hw_version=hw_version
+            )
+
+    @property
+    def fields(self) -> Mapping[str, Any]:
+        """The latest reported value of every field, without the overlay."""
+        return self._fields
+
+    def value(self, field: str) -> Any:
+        """Current value of a field, with unconfirmed writes applied."""
+        if self.overlay:
+            return self.overlay.get(field, self._fields.get(field))
+        return self._fields.get(field)
 
     @property
     def vendor(self):
         return self._vendor
 
+    @property
+    def mode(self) -> GrillMode | None:
+        """The reported mode with any unconfirmed written values applied."""
+        reported = self.data.mode if self.data else None
+        if not self.overlay:
+            return reported
+        return GrillMode(
+            mode=self.overlay.get(FIELD_MODE, getattr(reported, "mode", None)),
+            set_temp_f=self.overlay.get(
+                FIELD_SET_TEMP, getattr(reported, "set_temp_f", None)
+            ),
+            smoke_level=self.overlay.get(
+                FIELD_SMOKE_LEVEL, getattr(reported, "smoke_level", None)
+            ),
+            fan_level=self.overlay.get(
+                FIELD_FAN_LEVEL, getattr(reported, "fan_level", None)
+            ),
+        )
+
+    async def async_set_mode(self, mode: ModeName) -> bool:
+        """Queue a mode change; False if a later mode change replaced it."""
+        return await self._async_submit_write(
+            "set_mode", {FIELD_MODE: mode}, {"mode": mode}, self._async_write_mode
+        )
+
+    async def async_set_temp_smoke(
+        self, set_temp_f: int | None = None, smoke_level: int | None = None
+    ) -> bool:
+        """Queue a target temperature and/or smoke level write.
+
+        Pending writes are merged, so a temperature change and a smoke change
+        made in quick succession go out as a single pair. A missing half is
+        filled from the grill's current mode when the write is sent.
+        """
+        targets: dict[str, Any] = {}
+        if set_temp_f is not None:
+            targets[FIELD_SET_TEMP] = int(set_temp_f)
+        if smoke_level is not None:
+            targets[FIELD_SMOKE_LEVEL] = int(smoke_level)
+        return await self._async_submit_write(
+            "set_temp_smoke",
+            targets,
+            {"set_temp_f": set_temp_f, "smoke_level": smoke_level},
+            self._async_write_temp_smoke,
+        )
+
+    async def _async_submit_write(
+        self,
+        kind: str,
+        targets: dict[str, Any],
+        args: dict[str, Any],
+        execute: Any,
+    ) -> bool:
+        """Show ``targets`` through the overlay while the write is queued."""
+        self.history.record(time.monotonic(), SOURCE_WRITE, targets, targets)
+        if self.capture is not None:
+            self.capture.record(SOURCE_WRITE, targets, targets)
+            self.capture.record_command(kind, args)
+        token = self.overlay.async_set(targets)
+        try:
+            sent = await self.commands.async_submit(kind, args, execute)
+        except BaseException:
+            self.overlay.async_discard(token)
+            raise
+        # A superseded write was merged into a later one, so its values are
+        # still on their way and get the same confirmation window.
+        self.overlay.async_arm(token)
+        self._async_poll_soon()
+        return sent
+
+    @callback
+    def _async_poll_soon(self) -> None:
+        """Bring the next poll forward so a pending write gets confirmed."""
+        if self.passive:
+            # Read the result back while still connected, then let go.
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        if self.client is None or self.client.is_notifying:
+            return
+        if self.update_interval is not None and self.update_interval > POLL_INTERVAL_FAST:
+            self.update_interval = POLL_INTERVAL_FAST
+            if self._listeners:
+                self._schedule_refresh()
+
+    async def async_read_mode(self) -> GrillMode:
+        """Read the mode characteristic, ordered with pending writes."""
+        if self.capture is not None:
+            self.capture.record_command("read_mode", {})
+        return await self.commands.async_submit(
+            "read_mode", {}, self._async_read_mode, coalesce=False
+        )
+
+    async def _async_write_mode(self, args: dict[str, Any]) -> bool:
+        await self._async_connect()
+        await self.client.commands.set_mode(args["mode"])
+        return True
+
+    async def _async_write_temp_smoke(self, args: dict[str, Any]) -> bool:
+        await self._async_connect()
+        mode = self.mode
+        set_temp_f = args["set_temp_f"]
+        if set_temp_f is None:
+            set_temp_f = mode.set_temp_f if mode else None
+        smoke_level = args["smoke_level"]
+        if smoke_level is None:
+            smoke_level = mode.smoke_level if mode else None
+        if smoke_level is None:
+            smoke_level = (await self.client.commands.read_mode()).smoke_level
+        if set_temp_f is None or smoke_level is None:
+            raise HomeAssistantError("Target temperature or smoke level unknown")
+        await self.client.commands.set_temp_smoke(int(set_temp_f), int(smoke_level))
+        return True
+
+    async def _async_read_mode(self, args: dict[str, Any]) -> GrillMode:
+        await self._async_connect()
+        return await self.client.commands.read_mode()
+
+    @callback
+    def _async_handle_advertisement(
+        self, service_info: BluetoothServiceInfoBleak, change: BluetoothChange
+    ) -> None:
+        """Track presence and signal strength without a GATT connection."""
+        self.last_seen = time.monotonic()
+        if self.entry_loaded and not self.passive and self.breaker.rearm(self.last_seen):
+            # The grill is advertising again; try it now rather than waiting
+            # out the backoff. Only the entry's live coordinator may connect.
+            self.hass.async_create_task(self.async_request_refresh())
+        changed: set[str] = set()
+        if self.rssi is None or abs(service_info.rssi - self.rssi) >= RSSI_DEADBAND:
+            self.rssi = service_info.rssi
+            changed.add(FIELD_BLE_RSSI)
+        if not self.present:
+            self.present = True
+            changed.add(FIELD_BLE_PRESENT)
+        if changed:
+            self._async_notify(changed)
+
+    @callback
+    def _async_handle_unavailable(self, service_info: BluetoothServiceInfoBleak) -> None:
+        self.present = False
+        self._async_notify({FIELD_BLE_PRESENT})
+        if self._slot_source is not None and not (self.client and self.client.is_notifying):
+            # No scanner hears the grill and no live link is left, so the slot
+            # only blocks other grills. Letting go also means the next connect
+            # picks a source afresh instead of retrying the one it lost.
+            _LOGGER.debug("%s: gone, releasing slot on %s", self._name, self._slot_source)
+            self.hass.async_create_task(self._async_disconnect())
+
+    @callback
+    def _record_command(self, kind: str, latency: float, success: bool) -> None:
+        self.metrics.command.observe(latency)
+        if not success:
+            self.metrics.command_failures += 1
+
+    @callback
+    def _async_publish_metrics(self, _now: Any) -> None:
+        self._async_notify(METRIC_FIELDS)
+
+    @callback
+    def _async_commands_changed(self) -> None:
+        self._async_notify({FIELD_COMMAND_QUEUE, FIELD_COMMAND_LATENCY})
+
+    @callback
+    def _async_notify(self, fields: set[str]) -> None:
+        """Re-render the entities showing ``fields`` without touching data."""
+        self.changed_fields = frozenset(fields)
+        self.async_update_listeners()
+
     async def _handle_telemetry(self, state: GrillState) -> None:
-        self.data = state
-        self._update_device_info()
+        start = time.perf_counter()
+        self.metrics.notifications.hit(time.monotonic())
+        try:
+            self._async_handle_telemetry(state)
+        finally:
+            self.metrics.telemetry.observe(time.perf_counter() - start)
+
+    @callback
+    def _async_handle_telemetry(self, state: GrillState) -> None:
+        changed = self._track_fields(state, SOURCE_NOTIFICATION)
+        if not changed and self.last_update_success:
+            return
+        if (
+            self._coalesce_window
+            and self.last_update_success
+            and changed.isdisjoint(URGENT_FIELDS)
+        ):
+            # Hold the change back; the flush publishes whatever is latest.
+            self._coalesced_fields |= changed
+            if self._unsub_coalesce is None:
+                self._unsub_coalesce = async_call_later(
+                    self.hass, self._coalesce_window, self._async_flush_coalesced
+                )
+            return
+        self._async_publish(changed)
+
+    @callback
+    def _async_publish(self, changed: set[str]) -> None:
+        """Push the current state to the entities owning the changed fields."""
+        changed |= self._coalesced_fields
+        self._cancel_coalesce()
+        self.changed_fields = frozenset(changed)
         self.async_set_updated_data(self.data)
+
+    @callback
+    def _async_flush_coalesced(self, _now: Any) -> None:
+        self._unsub_coalesce = None
+        self._async_publish(set())
+
+    def _cancel_coalesce(self) -> None:
+        self._coalesced_fields = set()
+        if self._unsub_coalesce is not None:
+            self._unsub_coalesce()
+            self._unsub_coalesce = None
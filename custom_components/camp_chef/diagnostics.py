@@ -0,0 +1,74 @@
+"""Diagnostics support for Camp Chef."""
+from __future__ import annotations
+
+import re
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_TOKEN, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ADDRESS, CONF_NAME, DATA_CONNECTIONS, DOMAIN
+from .coordinator import CampChefCoordinator
+from .state import FIELD_WIFI_SSID
+
+# The grill's address identifies it, the default title and name embed the
+# address, and the SSID names the owner's network.
+TO_REDACT = {
+    CONF_ADDRESS,
+    CONF_NAME,
+    "title",
+    FIELD_WIFI_SSID,
+    "ssid",
+    CONF_PASSWORD,
+    CONF_TOKEN,
+    CONF_USERNAME,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: CampChefCoordinator = hass.data[DOMAIN][entry.entry_id]
+    now = time.monotonic()
+    reconnect = coordinator.breaker.as_dict(now)
+    if reconnect["last_error"]:
+        # Connect errors from the Bluetooth stack often quote the address.
+        reconnect["last_error"] = re.sub(
+            re.escape(entry.data[CONF_ADDRESS]), REDACTED, reconnect["last_error"], flags=re.I
+        )
+    return {
+        "entry": async_redact_data(
+            {
+                "title": entry.title,
+                "data": dict(entry.data),
+                "options": dict(entry.options),
+            },
+            TO_REDACT,
+        ),
+        "connection": async_redact_data(
+            {
+                "passive": coordinator.passive,
+                "present": coordinator.present,
+                "rssi": coordinator.rssi,
+                "sources": coordinator.sources.as_dict(),
+                "slots": hass.data[DOMAIN][DATA_CONNECTIONS].as_dict(),
+                "reconnect": reconnect,
+            },
+            TO_REDACT,
+        ),
+        # Deltas carry every field the grill reports, the SSID included.
+        "metrics": async_redact_data(coordinator.metrics.as_dict(now), TO_REDACT),
+        "history": async_redact_data(coordinator.history.as_dict(now), TO_REDACT),
+        "subscribers": coordinator.stream.as_dict(),
+        "probe_estimators": {
+            index: estimator.as_dict()
+            for index, estimator in coordinator.estimators.items()
+        },
+        "alarms": coordinator.alarms.as_dict(now),
+        "pellets": coordinator.pellets.as_dict(),
+        "program": coordinator.program.as_dict(),
+    }
@@ -0,0 +1,54 @@
+"""Base entity for Camp Chef."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import CONF_ADDRESS
+from .coordinator import CampChefCoordinator
+
+
+class CampChefEntity(CoordinatorEntity[CampChefCoordinator]):
+    """Entity bound to one grill's coordinator.
+
+    ``fields`` is registered as the coordinator context, so the entity is
+    only rewritten when one of those fields changes.
+    """
+
+    def __init__(
+        self,
+        coordinator: CampChefCoordinator,
+        entry,
+        name: str,
+        fields: frozenset[str] | None = None,
+    ) -> None:
+        super().__init__(coordinator, context=fields)
+        self._entry = entry
+        self._base_name = name
+        self._address: str = entry.data[CONF_ADDRESS]
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        return self.coordinator.device_info
+
+
+def enum_name(value: Any) -> str | None:
+    if value is None:
+        return None
+    return value.name if hasattr(value, "name") else str(value)
+
+
+def field_value(
+    field: str, convert: Callable[[Any], Any] | None = None
+) -> Callable[[CampChefCoordinator], Any]:
+    """Build an accessor reading one coordinator field, None-safe."""
+    if convert is None:
+        return lambda coordinator: coordinator.value(field)
+
+    def _value(coordinator: CampChefCoordinator) -> Any:
+        value = coordinator.value(field)
+        return None if value is None else convert(value)
+
+    return _value
@@ -0,0 +1,93 @@
+"""Incremental time-to-target estimate for a probe."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# The rate of rise is measured over at least this many seconds ...
+RATE_SAMPLE_INTERVAL = 60.0
+# ... and smoothed with an exponential time constant of this many seconds.
+RATE_TIME_CONSTANT = 600.0
+# A probe rising slower than this (°F per minute) ...
+STALL_RATE = 0.05
+# ... for this long, above this temperature, is in a stall.
+STALL_DURATION = 1200.0
+STALL_MIN_TEMP = 130.0
+# Below this rate (°F per minute) no ETA is given.
+MIN_RATE = 0.01
+
+
+class ProbeEstimator:
+    """Smoothed rate of rise, stall detection and ETA for one probe.
+
+    Each sample is O(1): the rate is only re-measured against an anchor
+    sample at least ``RATE_SAMPLE_INTERVAL`` old and folded into a
+    time-weighted moving average, so no history is kept or rescanned.
+    """
+
+    __slots__ = ("target", "temp", "rate", "stalled", "_anchor", "_slow_since")
+
+    def __init__(self, target: float | None = None) -> None:
+        self.target = target
+        self.temp: float | None = None
+        # Smoothed rate of rise in °F per minute.
+        self.rate: float | None = None
+        self.stalled = False
+        self._anchor: tuple[float, float] | None = None
+        self._slow_since: float | None = None
+
+    def reset(self) -> None:
+        self.temp = self.rate = None
+        self.stalled = False
+        self._anchor = self._slow_since = None
+
+    def add(self, now: float, temp: float | None) -> None:
+        if temp is None:
+            # Probe unplugged; start over when it comes back.
+            self.reset()
+            return
+        self.temp = temp
+        if self._anchor is None:
+            self._anchor = (now, temp)
+            return
+        anchor_at, anchor_temp = self._anchor
+        elapsed = now - anchor_at
+        if elapsed < RATE_SAMPLE_INTERVAL:
+            return
+        rate = (temp - anchor_temp) / elapsed * 60
+        if self.rate is None:
+            self.rate = rate
+        else:
+            weight = 1 - math.exp(-elapsed / RATE_TIME_CONSTANT)
+            self.rate += weight * (rate - self.rate)
+        self._anchor = (now, temp)
+        if self.rate < STALL_RATE and temp >= STALL_MIN_TEMP:
+            if self._slow_since is None:
+                self._slow_since = now
+            self.stalled = now - self._slow_since >= STALL_DURATION
+        else:
+            self._slow_since = None
+            self.stalled = False
+
+    def remaining(self) -> float | None:
+        """Seconds until the target is reached, 0 while it is, else None.
+
+        0 means the probe is at its target now, not when it got there; the
+        caller keeps that time.
+        """
+        if self.target is None or self.temp is None:
+            return None
+        if self.temp >= self.target:
+            return 0.0
+        if self.stalled or self.rate is None or self.rate < MIN_RATE:
+            return None
+        return (self.target - self.temp) / self.rate * 60
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "target": self.target,
+            "temp": self.temp,
+            "rate_per_hour": None if self.rate is None else round(self.rate * 60, 1),
+            "stalled": self.stalled,
+            "remaining": self.remaining(),
+        }
@@ -0,0 +1,51 @@
+"""Bounded in-memory history of recent grill updates."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable
+
+from .state import encode_value
+
+SOURCE_NOTIFICATION = "notification"
+SOURCE_POLL = "poll"
+SOURCE_WRITE = "write"
+HISTORY_LENGTH = 500
+
+
+class TelemetryHistory:
+    """Ring buffer of the fields each update changed.
+
+    Entries are ``(monotonic time, source, {field: encoded value})`` holding
+    only the delta, never a copy of the state. ``base`` is the state just
+    before the oldest entry: an evicted delta is folded into it, so the full
+    state at any retained entry can be rebuilt from the download.
+    """
+
+    def __init__(self, maxlen: int = HISTORY_LENGTH) -> None:
+        self._entries: deque[tuple[float, str, dict[str, Any]]] = deque()
+        self._maxlen = maxlen
+        self.base: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(
+        self, now: float, source: str, fields: dict[str, Any], changed: Iterable[str]
+    ) -> None:
+        delta = {key: encode_value(fields.get(key)) for key in changed}
+        if not delta:
+            return
+        if len(self._entries) >= self._maxlen:
+            self.base.update(self._entries.popleft()[2])
+        self._entries.append((now, source, delta))
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "capacity": self._maxlen,
+            "length": len(self._entries),
+            "base": dict(self.base),
+            "entries": [
+                {"age": round(now - at, 3), "source": source, "fields": delta}
+                for at, source, delta in self._entries
+            ],
+        }
@@ -0,0 +1,122 @@
+"""Fixed-size latency histograms and counters kept per grill."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+# Upper bucket bounds in milliseconds; the last bucket is open-ended.
+LOOP_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100)
+BLE_BOUNDS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+RATE_WINDOW = 60
+
+
+class Histogram:
+    """Count observations into fixed buckets; memory never grows."""
+
+    __slots__ = ("bounds", "buckets", "count", "total", "max")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        value = seconds * 1000
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percent: float) -> float | None:
+        """Upper bound of the bucket holding the percentile, in ms."""
+        if not self.count:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return self.bounds[index] if index < len(self.bounds) else self.max
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}" for bound in self.bounds] + [f">{self.bounds[-1]}"]
+        mean = self.mean
+        return {
+            "count": self.count,
+            "mean_ms": None if mean is None else round(mean, 3),
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max, 3),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class RateCounter:
+    """Events over the last ``RATE_WINDOW`` seconds, in one-second slots."""
+
+    __slots__ = ("_slots", "_second", "total")
+
+    def __init__(self) -> None:
+        self._slots = [0] * RATE_WINDOW
+        self._second = 0
+        self.total = 0
+
+    def _advance(self, now: float) -> None:
+        second = int(now)
+        gap = second - self._second
+        if gap <= 0:
+            return
+        if gap >= RATE_WINDOW:
+            self._slots = [0] * RATE_WINDOW
+        else:
+            for step in range(1, gap + 1):
+                self._slots[(self._second + step) % RATE_WINDOW] = 0
+        self._second = second
+
+    def hit(self, now: float) -> None:
+        self._advance(now)
+        self._slots[self._second % RATE_WINDOW] += 1
+        self.total += 1
+
+    def per_minute(self, now: float) -> int:
+        self._advance(now)
+        return sum(self._slots)
+
+
+class GrillMetrics:
+    """Hot-path timings for one grill.
+
+    ``telemetry`` is event-loop time spent handling one notification;
+    ``snapshot``, ``command`` and ``connect`` are BLE round trips, through
+    whichever adapter or proxy the grill is on.
+    """
+
+    def __init__(self) -> None:
+        self.telemetry = Histogram(LOOP_BOUNDS_MS)
+        self.snapshot = Histogram(BLE_BOUNDS_MS)
+        self.command = Histogram(BLE_BOUNDS_MS)
+        self.connect = Histogram(BLE_BOUNDS_MS)
+        self.notifications = RateCounter()
+        self.snapshot_failures = 0
+        self.command_failures = 0
+        self.connect_failures = 0
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        return {
+            "notifications": {
+                "total": self.notifications.total,
+                "per_minute": self.notifications.per_minute(now),
+            },
+            "telemetry": self.telemetry.as_dict(),
+            "snapshot": {**self.snapshot.as_dict(), "failures": self.snapshot_failures},
+            "command": {**self.command.as_dict(), "failures": self.command_failures},
+            "connect": {**self.connect.as_dict(), "failures": self.connect_failures},
+        }
@@ -2,43 +2,43 @@ from __future__ import annotations
 
 from typing import Optional
 
-from homeassistant.components.number import NumberEntity, NumberMode
-from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
+from homeassistant.const import UnitOfTemperature
+from homeassistant.helpers.entity import EntityCategory
 
-from pycampchef.const import VENDOR_CONFIGS, ModeName
+from pycampchef.const import ModeName
 
 from .const import (
-    CONF_ADDRESS,
     CONF_NAME,
-    CONF_VENDOR,
     DOMAIN,
+    PROBE_TARGET_MAX_F,
     SMOKE_MAX_DEFAULT,
     SMOKE_MIN_DEFAULT,
 )
 from .coordinator import CampChefCoordinator
+from .entity import CampChefEntity
+from .state import MODE_FIELDS, probe_target_field
 
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     coordinator: CampChefCoordinator = hass.data[DOMAIN][entry.entry_id]
     name = entry.data.get(CONF_NAME, entry.title)
-    async_add_entities([CampChefSmokeLevelNumber(coordinator, entry, name)])
+    entities: list[NumberEntity] = [CampChefSmokeLevelNumber(coordinator, entry, name)]
+    for index in range(coordinator.probe_count):
+        entities.append(CampChefProbeTargetNumber(coordinator, entry, name, index))
+    async_add_entities(entities)
 
 
-class CampChefSmokeLevelNumber(CoordinatorEntity[CampChefCoordinator], NumberEntity):
+class CampChefSmokeLevelNumber(CampChefEntity, NumberEntity):
     _attr_name = "Smoke level"
     _attr_mode = NumberMode.SLIDER
     _attr_native_step = 1
     _attr_icon = "mdi:smoke"
 
     def __init__(self, coordinator: CampChefCoordinator, entry, base_name: str) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self._base_name = base_name
-        self._attr_unique_id = f"{entry.data[CONF_ADDRESS]}_smoke_level"
-        vendor_key = entry.data.get(CONF_VENDOR, "campchef")
-        vendor_cfg = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"])
+        super().__init__(coordinator, entry, base_name, MODE_FIELDS)
+        self._attr_unique_id = f"{self._address}_smoke_level"
+        vendor_cfg = coordinator.vendor
         self._attr_native_min_value = getattr(
             vendor_cfg, "smoke_level_min", SMOKE_MIN_DEFAULT
         )
@@ -46,23 +46,9 @@ class CampChefSmokeLevelNumber(CoordinatorEntity[CampChefCoordinator], NumberEnt
             vendor_cfg, "smoke_level_max", SMOKE_MAX_DEFAULT
         )
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        vendor_key = self._entry.data.get(CONF_VENDOR, "campchef")
-        vendor = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"]).name
-        address = self._entry.data[CONF_ADDRESS]
-        return DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            connections={(CONNECTION_BLUETOOTH, address)},
-            name=self._base_name,
-            manufacturer=vendor,
-            sw_version=self.coordinator._device_info.get("sw_version"),
-            hw_version=self.coordinator._device_info.get("hw_version"),
-        )
-
     @property
     def native_value(self) -> Optional[int]:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         if not mode:
             return None
         if mode.mode != ModeName.RUN:
@@ -71,24 +57,51 @@ class CampChefSmokeLevelNumber(CoordinatorEntity[CampChefCoordinator], NumberEnt
 
     @property
     def available(self) -> bool:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         return bool(mode and mode.mode == ModeName.RUN and mode.set_temp_f is not None)
 
     async def async_set_native_value(self, value: float) -> None:
         target = int(value)
         if self.coordinator.client is None:
             return
-        mode = self.coordinator.data.mode if self.coordinator.data else None
+        mode = self.coordinator.mode
         if mode is None or mode.mode != ModeName.RUN or mode.set_temp_f is None:
             return
-        await self.coordinator.client.commands.set_temp_smoke(
-            mode.set_temp_f, target
-        )
-        new_mode = mode.__class__(
-            mode=mode.mode,
-            set_temp_f=mode.set_temp_f,
-            smoke_level=target,
-            fan_level=mode.fan_level,
+        # Slider drags are collapsed by the command queue; only the last value
+        # still pending when the previous write finishes goes out.
+        await self.coordinator.async_set_temp_smoke(smoke_level=target)
+
+
+class CampChefProbeTargetNumber(CampChefEntity, NumberEntity):
+    """Temperature a probe is cooking to; 0 clears it."""
+
+    _attr_mode = NumberMode.BOX
+    _attr_device_class = NumberDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
+    _attr_native_min_value = 0
+    _attr_native_max_value = PROBE_TARGET_MAX_F
+    _attr_native_step = 1
+    _attr_entity_category = EntityCategory.CONFIG
+    _attr_icon = "mdi:thermometer-check"
+
+    def __init__(
+        self, coordinator: CampChefCoordinator, entry, base_name: str, index: int
+    ) -> None:
+        super().__init__(
+            coordinator, entry, base_name, frozenset({probe_target_field(index)})
         )
-        self.coordinator.data.mode = new_mode
-        self.coordinator.async_set_updated_data(self.coordinator.data)
+        self._index = index
+        self._attr_name = f"Probe {index + 1} target"
+        self._attr_unique_id = f"{self._address}_probe_{index + 1}_target"
+
+    @property
+    def available(self) -> bool:
+        # Stored locally, so it can be set while the grill is away.
+        return True
+
+    @property
+    def native_value(self) -> Optional[float]:
+        return self.coordinator.probe_target(self._index)
+
+    async def async_set_native_value(self, value: float) -> None:
+        self.coordinator.async_set_probe_target(self._index, value)
@@ -0,0 +1,109 @@
+"""Pending command values layered over the reported grill state."""
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_MISSING = object()
+
+
+@dataclass
+class _Pending:
+    value: Any
+    token: int
+    unsub_expire: CALLBACK_TYPE | None = None
+
+
+class PendingOverlay:
+    """Track values written to the grill that it has not reported back yet.
+
+    Entities read through the overlay, so a notification carrying the old
+    value while a write is in flight cannot undo the user's change. An entry
+    is dropped when the grill reports the target value, when the write fails,
+    or once ``timeout`` seconds pass after the write without confirmation.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        timeout: float,
+        on_change: Callable[[set[str]], None],
+    ) -> None:
+        self._hass = hass
+        self._timeout = timeout
+        self._on_change = on_change
+        self._pending: dict[str, _Pending] = {}
+        self._tokens = itertools.count(1)
+
+    def __bool__(self) -> bool:
+        return bool(self._pending)
+
+    def get(self, field: str, default: Any = None) -> Any:
+        pending = self._pending.get(field)
+        return default if pending is None else pending.value
+
+    def as_dict(self) -> dict[str, Any]:
+        return {field: pending.value for field, pending in self._pending.items()}
+
+    @callback
+    def async_set(self, values: dict[str, Any]) -> int:
+        """Layer new target values; returns a token identifying this write."""
+        token = next(self._tokens)
+        for field, value in values.items():
+            self._drop(field)
+            self._pending[field] = _Pending(value, token)
+        self._on_change(set(values))
+        return token
+
+    @callback
+    def async_arm(self, token: int) -> None:
+        """Start the confirmation timeout once the write reached the grill."""
+        for field, pending in self._pending.items():
+            if pending.token == token and pending.unsub_expire is None:
+                pending.unsub_expire = async_call_later(
+                    self._hass, self._timeout, partial(self._async_expire, field, token)
+                )
+
+    @callback
+    def async_discard(self, token: int) -> None:
+        """Roll back the values of a write that failed or was abandoned."""
+        fields = {field for field, pending in self._pending.items() if pending.token == token}
+        for field in fields:
+            self._drop(field)
+        if fields:
+            self._on_change(fields)
+
+    def confirm(self, reported: dict[str, Any]) -> set[str]:
+        """Drop entries the grill now reports; returns the confirmed fields."""
+        confirmed = {
+            field
+            for field, pending in self._pending.items()
+            if reported.get(field, _MISSING) == pending.value
+        }
+        for field in confirmed:
+            self._drop(field)
+        return confirmed
+
+    @callback
+    def async_clear(self) -> None:
+        for field in list(self._pending):
+            self._drop(field)
+
+    @callback
+    def _async_expire(self, field: str, token: int, _now: Any) -> None:
+        pending = self._pending.get(field)
+        if pending is None or pending.token != token:
+            return
+        pending.unsub_expire = None
+        self._drop(field)
+        self._on_change({field})
+
+    def _drop(self, field: str) -> None:
+        pending = self._pending.pop(field, None)
+        if pending is not None and pending.unsub_expire is not None:
+            pending.unsub_expire()
@@ -0,0 +1,169 @@
+"""Online pellet burn-rate model."""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+from pycampchef.const import ModeName
+
+from .state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_FAN_LEVEL,
+    FIELD_MODE,
+    FIELD_PELLET_LEVEL,
+    FIELD_SET_TEMP,
+)
+
+PELLET_FIELDS = frozenset(
+    {FIELD_PELLET_LEVEL, FIELD_CHAMBER_TEMP, FIELD_SET_TEMP, FIELD_FAN_LEVEL, FIELD_MODE}
+)
+
+# A burn-rate measurement closes on the first level drop after this many
+# seconds. A window with no drop after the longer interval is dropped
+# unlearned: the level reading is stuck or too coarse, not a zero rate.
+MIN_WINDOW = 600.0
+MAX_WINDOW = 7200.0
+# A level rise larger than this is a refill and restarts the measurement.
+REFILL_RISE = 5
+# Weight kept by past measurements on each new one.
+FORGETTING = 0.97
+INITIAL_COVARIANCE = 100.0
+# Forgetting grows the covariance along directions the measurements do not
+# excite (a long cook at one set point); its trace is scaled back to this so
+# the next unusual window cannot swing the weights.
+MAX_COVARIANCE_TRACE = INITIAL_COVARIANCE * 4
+# No estimate is given before this many measurements.
+MIN_OBSERVATIONS = 3
+# Published values are rounded to these steps, so the sensors only change
+# when the estimate does.
+RATE_STEP = 0.5
+HOURS_STEP = 0.25
+
+
+def _features(fields: Mapping[str, Any]) -> list[float] | None:
+    set_temp = fields.get(FIELD_SET_TEMP)
+    chamber = fields.get(FIELD_CHAMBER_TEMP)
+    if set_temp is None or chamber is None:
+        return None
+    # Scaled to similar magnitudes so one learning rate suits them all.
+    return [
+        1.0,
+        set_temp / 100,
+        max(set_temp - chamber, 0) / 100,
+        (fields.get(FIELD_FAN_LEVEL) or 0) / 10,
+    ]
+
+
+class PelletEstimator:
+    """Burn rate learned by recursive least squares.
+
+    The rate (level units per hour, normally percent) is modelled as a
+    linear function of the set temperature, how far the chamber is below
+    it and the fan level. Each level drop closes a measurement window
+    whose time-averaged features update the model in O(1), so memory is
+    fixed and no history is read back. The model is persisted so it keeps
+    improving across cooks.
+    """
+
+    def __init__(self) -> None:
+        size = 4
+        self.weights = [0.0] * size
+        self.covariance = [
+            [INITIAL_COVARIANCE if row == col else 0.0 for col in range(size)]
+            for row in range(size)
+        ]
+        self.observations = 0
+        self.rate: float | None = None
+        self.hours: float | None = None
+        self._anchor: tuple[float, int] | None = None
+        self._sums = [0.0] * size
+        self._last: tuple[float, list[float]] | None = None
+
+    def load(self, data: Mapping[str, Any]) -> None:
+        self.weights = [float(value) for value in data["weights"]]
+        self.covariance = [[float(value) for value in row] for row in data["covariance"]]
+        self.observations = int(data["observations"])
+
+    def as_store(self) -> dict[str, Any]:
+        return {
+            "weights": self.weights,
+            "covariance": self.covariance,
+            "observations": self.observations,
+        }
+
+    def add(self, now: float, fields: Mapping[str, Any]) -> bool:
+        """Feed one update; True if the published estimate moved."""
+        level = fields.get(FIELD_PELLET_LEVEL)
+        features = _features(fields)
+        if fields.get(FIELD_MODE) != ModeName.RUN or level is None or features is None:
+            self._anchor = self._last = None
+            return self._publish(None, None)
+        if self._last is not None:
+            last_at, last_features = self._last
+            elapsed = now - last_at
+            for index, value in enumerate(last_features):
+                self._sums[index] += value * elapsed
+        self._last = (now, features)
+        if self._anchor is None or level > self._anchor[1] + REFILL_RISE:
+            self._start_window(now, level)
+        else:
+            self._maybe_learn(now, level)
+        return self._publish(self._predict(features), level)
+
+    def _start_window(self, now: float, level: int) -> None:
+        self._anchor = (now, level)
+        self._sums = [0.0] * len(self._sums)
+
+    def _maybe_learn(self, now: float, level: int) -> None:
+        anchor_at, anchor_level = self._anchor
+        elapsed = now - anchor_at
+        drop = anchor_level - level
+        if drop <= 0:
+            if elapsed >= MAX_WINDOW:
+                self._start_window(now, level)
+            return
+        if elapsed < MIN_WINDOW:
+            return
+        self._learn([value / elapsed for value in self._sums], drop / elapsed * 3600)
+        self._start_window(now, level)
+
+    def _learn(self, x: list[float], rate: float) -> None:
+        p = self.covariance
+        px = [sum(row[col] * x[col] for col in range(len(x))) for row in p]
+        gain_den = FORGETTING + sum(x[index] * px[index] for index in range(len(x)))
+        gain = [value / gain_den for value in px]
+        error = rate - sum(w * v for w, v in zip(self.weights, x))
+        self.weights = [w + k * error for w, k in zip(self.weights, gain)]
+        covariance = [
+            [(p[row][col] - gain[row] * px[col]) / FORGETTING for col in range(len(x))]
+            for row in range(len(x))
+        ]
+        trace = sum(covariance[index][index] for index in range(len(x)))
+        if trace > MAX_COVARIANCE_TRACE:
+            scale = MAX_COVARIANCE_TRACE / trace
+            covariance = [[value * scale for value in row] for row in covariance]
+        self.covariance = covariance
+        self.observations += 1
+
+    def _predict(self, features: list[float]) -> float | None:
+        if self.observations < MIN_OBSERVATIONS:
+            return None
+        return max(sum(w * v for w, v in zip(self.weights, features)), 0.0)
+
+    def _publish(self, rate: float | None, level: int | None) -> bool:
+        hours = None
+        if rate is not None:
+            rate = round(rate / RATE_STEP) * RATE_STEP
+            if rate > 0 and level is not None:
+                hours = round(level / rate / HOURS_STEP) * HOURS_STEP
+        if (rate, hours) == (self.rate, self.hours):
+            return False
+        self.rate, self.hours = rate, hours
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rate_per_hour": self.rate,
+            "hours_remaining": self.hours,
+            "observations": self.observations,
+            "weights": [round(w, 3) for w in self.weights],
+        }
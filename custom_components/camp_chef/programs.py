@@ -0,0 +1,278 @@
+"""Multi-step cook programs run by the coordinator."""
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Mapping
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .state import FIELD_CHAMBER_TEMP, FIELD_MODE, FIELD_SET_TEMP, probe_temp_field
+
+_LOGGER = logging.getLogger(__name__)
+
+STATUS_IDLE = "idle"
+STATUS_RUNNING = "running"
+STATUS_FINISHED = "finished"
+
+# The value a trigger field has to reach, and whether it gets there rising.
+Trigger = tuple[float, bool]
+
+
+@dataclass(frozen=True)
+class ProgramStep:
+    """Settings applied when a step starts, and when to move on.
+
+    ``mode`` can only be ``STANDBY``, to end a cook; programs never light
+    the grill. ``set_temp`` and ``smoke_level`` wait until the grill is
+    running. The step ends on whichever trigger is met first: ``minutes`` in the
+    step, the chamber reaching ``chamber_temp`` or probe ``probe`` (1-based)
+    reaching ``probe_temp``. The chamber can reach its temperature from
+    either side, so a cool-down works too; probes only rise. A step
+    without triggers holds until the program is stopped.
+    """
+
+    name: str | None = None
+    mode: str | None = None
+    set_temp: int | None = None
+    smoke_level: int | None = None
+    minutes: float | None = None
+    chamber_temp: float | None = None
+    probe: int | None = None
+    probe_temp: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ProgramStep:
+        return cls(**{key: data.get(key) for key in cls.__dataclass_fields__})
+
+    def as_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+    def triggers(self, fields: Mapping[str, Any]) -> dict[str, Trigger]:
+        """Fields that end the step, given the grill's state as it starts."""
+        triggers: dict[str, Trigger] = {}
+        if self.chamber_temp is not None:
+            target = self.chamber_temp
+            # The chamber heads for the set temperature, so a trigger below
+            # it is reached rising and one above it falling. Without a set
+            # temperature to go by, the chamber's current side decides.
+            set_temp = self.set_temp if self.set_temp is not None else fields.get(FIELD_SET_TEMP)
+            chamber = fields.get(FIELD_CHAMBER_TEMP)
+            if set_temp is not None and set_temp != target:
+                rising = set_temp > target
+            elif chamber is not None:
+                rising = chamber < target
+            else:
+                rising = True
+            triggers[FIELD_CHAMBER_TEMP] = (target, rising)
+        if self.probe is not None and self.probe_temp is not None:
+            triggers[probe_temp_field(self.probe - 1)] = (self.probe_temp, True)
+        return triggers
+
+
+class CookProgram:
+    """Step through a list of ``ProgramStep`` for one grill.
+
+    Temperature triggers are checked when a step starts and then from the
+    coordinator's update path against the fields that changed; time
+    triggers are timers, so steps change on time without polling.
+    ``apply`` is called with each step as it starts and is expected to
+    write only the settings that differ; if it returns False the grill is
+    not running yet, and the step is applied again on the next mode change.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        apply: Callable[[ProgramStep], Awaitable[bool]],
+        on_change: Callable[[], None],
+        fields: Callable[[], Mapping[str, Any]],
+    ) -> None:
+        self._hass = hass
+        self._name = name
+        self._apply = apply
+        self._fields = fields
+        self._on_change = on_change
+        self.steps: tuple[ProgramStep, ...] = ()
+        self.index = 0
+        self.status = STATUS_IDLE
+        # Wall-clock start of the current step, so timing survives a restart.
+        self.step_started: float | None = None
+        self._triggers: dict[str, Trigger] = {}
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        # A resumed step is applied once live grill data has arrived, and a
+        # step the grill was not ready for on its next mode change.
+        self._live = True
+        self._apply_due = False
+        self._waiting_for_mode = False
+
+    @property
+    def running(self) -> bool:
+        return self.status == STATUS_RUNNING
+
+    @property
+    def step(self) -> ProgramStep | None:
+        return self.steps[self.index] if self.running else None
+
+    @callback
+    def async_start(self, steps: list[ProgramStep]) -> None:
+        self._cancel_timer()
+        self.steps = tuple(steps)
+        self.status = STATUS_RUNNING
+        self._enter(0, time.time())
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the program, leaving the grill as it is."""
+        self._cancel_timer()
+        self.status = STATUS_IDLE
+        self.steps = ()
+        self.step_started = None
+        self._triggers = {}
+        self._apply_due = self._waiting_for_mode = False
+        self._on_change()
+
+    @callback
+    def async_skip(self) -> None:
+        if self.running:
+            self._advance()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Drop timers on unload; the persisted program resumes on setup."""
+        self._cancel_timer()
+
+    def load(self, data: Mapping[str, Any]) -> None:
+        """Restore a program saved by ``as_store``; ``async_resume`` runs it."""
+        if data.get("status") != STATUS_RUNNING:
+            return
+        self.steps = tuple(ProgramStep.from_dict(step) for step in data["steps"])
+        self.index = data["index"]
+        self.status = STATUS_RUNNING
+        self.step_started = data["step_started"]
+        # Re-applied once the grill reports, in case it was changed meanwhile.
+        self._live = False
+        self._apply_due = True
+
+    @callback
+    def async_resume(self) -> None:
+        """Restart the current step's timer, counting time already spent."""
+        if self.running and self._unsub_timer is None:
+            self._start_step(self.step_started)
+
+    def as_store(self) -> dict[str, Any] | None:
+        if not self.running:
+            return None
+        return {
+            "status": self.status,
+            "steps": [step.as_dict() for step in self.steps],
+            "index": self.index,
+            "step_started": self.step_started,
+        }
+
+    @callback
+    def observe(self, fields: Mapping[str, Any], changed: set[str]) -> None:
+        """Check the current step's temperature triggers against an update."""
+        if not self._live:
+            # A resumed step may have been met while Home Assistant was down.
+            self._live = True
+            if self._triggered(fields):
+                self._advance()
+            elif self._apply_due:
+                self._request_apply()
+            return
+        if self._waiting_for_mode and FIELD_MODE in changed:
+            self._request_apply()
+        if self._triggers and not changed.isdisjoint(self._triggers) and self._triggered(fields):
+            self._advance()
+
+    def _triggered(self, fields: Mapping[str, Any]) -> bool:
+        for field, (target, rising) in self._triggers.items():
+            value = fields.get(field)
+            if value is not None and (value >= target if rising else value <= target):
+                return True
+        return False
+
+    def _enter(self, index: int, started: float) -> None:
+        # Steps whose triggers are already met are passed over unapplied.
+        while True:
+            self.index = index
+            self._start_step(started)
+            if not self._live or not self._triggered(self._fields()):
+                break
+            if index + 1 >= len(self.steps):
+                self._finish()
+                return
+            index += 1
+        self._request_apply()
+        self._on_change()
+
+    def _start_step(self, started: float) -> None:
+        step = self.steps[self.index]
+        self.step_started = started
+        self._triggers = step.triggers(self._fields())
+        self._cancel_timer()
+        if step.minutes is not None:
+            delay = max(started + step.minutes * 60 - time.time(), 0.0)
+            self._unsub_timer = async_call_later(self._hass, delay, self._async_timer)
+
+    @callback
+    def _async_timer(self, _now: Any) -> None:
+        self._unsub_timer = None
+        self._advance()
+
+    def _advance(self) -> None:
+        self._cancel_timer()
+        if self.index + 1 >= len(self.steps):
+            self._finish()
+            return
+        self._enter(self.index + 1, time.time())
+
+    def _finish(self) -> None:
+        _LOGGER.debug("%s: cook program finished", self._name)
+        self._cancel_timer()
+        self.status = STATUS_FINISHED
+        self.step_started = None
+        self._triggers = {}
+        self._apply_due = self._waiting_for_mode = False
+        self._on_change()
+
+    def _request_apply(self) -> None:
+        if not self._live:
+            self._apply_due = True
+            return
+        self._apply_due = self._waiting_for_mode = False
+        step = self.steps[self.index]
+        _LOGGER.debug("%s: cook program step %s: %s", self._name, self.index + 1, step)
+        self._hass.async_create_task(self._async_apply(step))
+
+    async def _async_apply(self, step: ProgramStep) -> None:
+        try:
+            applied = await self._apply(step)
+        except Exception as exc:  # noqa: BLE001 - logged, the program carries on
+            _LOGGER.warning(
+                "%s: could not apply cook program step %s: %s",
+                self._name,
+                step.name or self.index + 1,
+                exc,
+            )
+            return
+        if not applied and self.step is step:
+            _LOGGER.debug("%s: grill not running, step waits for it", self._name)
+            self._waiting_for_mode = True
+
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "step": self.index + 1 if self.running else None,
+            "steps": [step.as_dict() for step in self.steps],
+            "step_started": self.step_started,
+        }
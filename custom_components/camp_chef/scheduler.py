@@ -0,0 +1,90 @@
+"""Pick the polling interval from the grill's mode and temperature trends."""
+from __future__ import annotations
+
+import math
+from datetime import timedelta
+from typing import Any
+
+from pycampchef.const import ModeName
+
+from .state import FIELD_CHAMBER_TEMP, FIELD_MODE, FIELD_SET_TEMP, FIELD_TRANSITIONING
+
+POLL_INTERVAL_FAST = timedelta(seconds=5)
+POLL_INTERVAL_ACTIVE = timedelta(seconds=20)
+POLL_INTERVAL_STEADY = timedelta(seconds=60)
+POLL_INTERVAL_STANDBY = timedelta(seconds=300)
+
+# Chamber this far below the set point counts as preheating or recovering.
+PREHEAT_MARGIN_F = 20
+# Rates of change (°F per minute) that count as ramping.
+CHAMBER_RAMP_RATE = 3.0
+PROBE_RAMP_RATE = 1.0
+# Time constant of the rate smoothing, in seconds.
+RATE_TAU = 120.0
+
+
+class AdaptivePollScheduler:
+    """Track temperature rates and map the grill's situation to an interval.
+
+    ``observe`` is called with every flattened state, polled or notified, and
+    keeps an exponentially smoothed rate for the chamber and each probe.
+    """
+
+    def __init__(self) -> None:
+        self._last: dict[str, tuple[float, float]] = {}
+        self._rates: dict[str, float] = {}
+        self.reason = "startup"
+
+    def observe(self, fields: dict[str, Any], now: float) -> None:
+        for key, value in fields.items():
+            if not key.endswith("temp_f") or key == FIELD_SET_TEMP:
+                continue
+            if value is None:
+                self._last.pop(key, None)
+                self._rates.pop(key, None)
+                continue
+            last = self._last.get(key)
+            self._last[key] = (now, value)
+            if last is None or now <= last[0]:
+                continue
+            elapsed = now - last[0]
+            rate = (value - last[1]) * 60 / elapsed
+            weight = 1 - math.exp(-elapsed / RATE_TAU)
+            previous = self._rates.get(key, rate)
+            self._rates[key] = previous + weight * (rate - previous)
+
+    def rate(self, key: str) -> float | None:
+        """Smoothed rate of change in °F per minute."""
+        return self._rates.get(key)
+
+    def interval(self, fields: dict[str, Any], *, pending_write: bool = False) -> timedelta:
+        """Return the polling interval for the current situation."""
+        interval, self.reason = self._select(fields, pending_write)
+        return interval
+
+    def _select(self, fields: dict[str, Any], pending_write: bool) -> tuple[timedelta, str]:
+        if pending_write:
+            return POLL_INTERVAL_FAST, "pending_write"
+        if fields.get(FIELD_TRANSITIONING):
+            return POLL_INTERVAL_FAST, "transitioning"
+        mode = fields.get(FIELD_MODE)
+        if mode is None:
+            return POLL_INTERVAL_ACTIVE, "unknown_mode"
+        if mode == ModeName.STANDBY:
+            return POLL_INTERVAL_STANDBY, "standby"
+        if mode != ModeName.RUN:
+            # Startup, shutdown and similar phases are short and eventful.
+            return POLL_INTERVAL_FAST, "mode_change"
+        chamber = fields.get(FIELD_CHAMBER_TEMP)
+        set_temp = fields.get(FIELD_SET_TEMP)
+        if chamber is not None and set_temp is not None and set_temp - chamber > PREHEAT_MARGIN_F:
+            return POLL_INTERVAL_FAST, "preheat"
+        if abs(self._rates.get(FIELD_CHAMBER_TEMP, 0.0)) >= CHAMBER_RAMP_RATE:
+            return POLL_INTERVAL_FAST, "chamber_ramp"
+        if any(
+            rate >= PROBE_RAMP_RATE
+            for key, rate in self._rates.items()
+            if key.startswith("probes.")
+        ):
+            return POLL_INTERVAL_ACTIVE, "probe_rising"
+        return POLL_INTERVAL_STEADY, "steady"
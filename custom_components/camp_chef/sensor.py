@@ -1,277 +1,430 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Optional
+from datetime import datetime
+from typing import Any, Callable, Optional
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTemperature
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.device_registry import CONNECTION_BLUETOOTH
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from pycampchef.const import VENDOR_CONFIGS
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfTemperature,
+    UnitOfTime,
+)
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_ADDRESS, CONF_NAME, CONF_VENDOR, DOMAIN
+from .const import CONF_NAME, DOMAIN
 from .coordinator import CampChefCoordinator
+from .entity import CampChefEntity, enum_name, field_value
+from .state import (
+    FIELD_BLE_RSSI,
+    FIELD_COMMAND_LATENCY,
+    FIELD_COMMAND_QUEUE,
+    FIELD_CONNECT_LATENCY,
+    FIELD_CONNECT_SUCCESS,
+    FIELD_FAN_LEVEL,
+    FIELD_FAULT,
+    FIELD_METRIC_NOTIFY_RATE,
+    FIELD_METRIC_SNAPSHOT,
+    FIELD_METRIC_TELEMETRY,
+    FIELD_MODE,
+    FIELD_OTA_PROGRESS,
+    FIELD_OTA_STATE,
+    FIELD_PELLET_HOURS,
+    FIELD_PELLET_LEVEL,
+    FIELD_PELLET_RATE,
+    FIELD_PROGRAM_STEP,
+    FIELD_TRANSITIONING,
+    FIELD_WIFI_RSSI,
+    FIELD_WIFI_SSID,
+    probe_connected_field,
+    probe_eta_field,
+    probe_fields,
+    probe_target_field,
+    probe_temp_field,
+)
 
 
-@dataclass(frozen=True)
-class CampChefSensorDescription:
-    key: str
-    name: str
+@dataclass(frozen=True, kw_only=True)
+class CampChefSensorEntityDescription(SensorEntityDescription):
+    fields: frozenset[str]
+    value_fn: Callable[[CampChefCoordinator], Any]
+
+
+def _milliseconds(seconds: float) -> int:
+    return round(seconds * 1000)
+
+
+SENSORS: tuple[CampChefSensorEntityDescription, ...] = (
+    CampChefSensorEntityDescription(
+        key="mode",
+        name="Mode",
+        icon="mdi:grill",
+        fields=frozenset({FIELD_MODE}),
+        value_fn=field_value(FIELD_MODE, enum_name),
+    ),
+    CampChefSensorEntityDescription(
+        key="fan",
+        name="Fan level",
+        icon="mdi:fan",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_FAN_LEVEL}),
+        value_fn=field_value(FIELD_FAN_LEVEL, int),
+    ),
+    CampChefSensorEntityDescription(
+        key="wifi_rssi",
+        name="Wi-Fi RSSI",
+        icon="mdi:wifi-strength-2",
+        native_unit_of_measurement="dBm",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_WIFI_RSSI}),
+        value_fn=field_value(FIELD_WIFI_RSSI),
+    ),
+    CampChefSensorEntityDescription(
+        key="wifi_ssid",
+        name="Wi-Fi SSID",
+        icon="mdi:wifi",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_WIFI_SSID}),
+        value_fn=lambda coordinator: coordinator.value(FIELD_WIFI_SSID) or None,
+    ),
+    CampChefSensorEntityDescription(
+        key="ota_state",
+        name="OTA state",
+        icon="mdi:progress-clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_OTA_STATE}),
+        value_fn=field_value(FIELD_OTA_STATE, enum_name),
+    ),
+    CampChefSensorEntityDescription(
+        key="ota_progress",
+        name="OTA progress",
+        icon="mdi:progress-clock",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_OTA_PROGRESS}),
+        value_fn=field_value(FIELD_OTA_PROGRESS, int),
+    ),
+    CampChefSensorEntityDescription(
+        key="pellet_level",
+        name="Pellet level",
+        icon="mdi:silo",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_PELLET_LEVEL}),
+        value_fn=field_value(FIELD_PELLET_LEVEL, int),
+    ),
+    CampChefSensorEntityDescription(
+        key="pellet_burn_rate",
+        name="Pellet burn rate",
+        icon="mdi:fire",
+        native_unit_of_measurement="%/h",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_PELLET_RATE}),
+        value_fn=lambda coordinator: coordinator.pellets.rate,
+    ),
+    CampChefSensorEntityDescription(
+        key="pellet_hours_remaining",
+        name="Pellets remaining",
+        icon="mdi:timer-sand",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.HOURS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_PELLET_HOURS}),
+        value_fn=lambda coordinator: coordinator.pellets.hours,
+    ),
+    CampChefSensorEntityDescription(
+        key="transitioning",
+        name="Transitioning",
+        icon="mdi:progress-clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_TRANSITIONING}),
+        value_fn=field_value(FIELD_TRANSITIONING, bool),
+    ),
+    CampChefSensorEntityDescription(
+        key="fault",
+        name="Fault present",
+        icon="mdi:alert",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_FAULT}),
+        value_fn=field_value(FIELD_FAULT, bool),
+    ),
+    CampChefSensorEntityDescription(
+        key="command_queue",
+        name="Command queue depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_COMMAND_QUEUE}),
+        value_fn=lambda coordinator: coordinator.commands.depth,
+    ),
+    CampChefSensorEntityDescription(
+        key="command_latency",
+        name="Command latency",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_COMMAND_LATENCY}),
+        value_fn=lambda coordinator: (
+            None
+            if coordinator.commands.last_latency is None
+            else _milliseconds(coordinator.commands.last_latency)
+        ),
+    ),
+    CampChefSensorEntityDescription(
+        key="connect_latency",
+        name="Connect latency",
+        icon="mdi:bluetooth-connect",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_CONNECT_LATENCY}),
+        value_fn=lambda coordinator: (
+            None
+            if coordinator.connect_stats.last_latency is None
+            else _milliseconds(coordinator.connect_stats.last_latency)
+        ),
+    ),
+    CampChefSensorEntityDescription(
+        key="connect_success",
+        name="Connect success rate",
+        icon="mdi:bluetooth-connect",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_CONNECT_SUCCESS}),
+        value_fn=lambda coordinator: (
+            None
+            if coordinator.connect_stats.success_rate is None
+            else round(coordinator.connect_stats.success_rate * 100, 1)
+        ),
+    ),
+    CampChefSensorEntityDescription(
+        key="ble_rssi",
+        name="Bluetooth signal",
+        device_class=SensorDeviceClass.SIGNAL_STRENGTH,
+        native_unit_of_measurement=SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_BLE_RSSI}),
+        value_fn=lambda coordinator: coordinator.rssi,
+    ),
+    CampChefSensorEntityDescription(
+        key="telemetry_time",
+        name="Notification handling time",
+        icon="mdi:timer-cog-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_METRIC_TELEMETRY}),
+        value_fn=lambda coordinator: coordinator.metrics.telemetry.percentile(95),
+    ),
+    CampChefSensorEntityDescription(
+        key="snapshot_time",
+        name="Snapshot time",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_METRIC_SNAPSHOT}),
+        value_fn=lambda coordinator: coordinator.metrics.snapshot.percentile(95),
+    ),
+    CampChefSensorEntityDescription(
+        key="notification_rate",
+        name="Notifications per minute",
+        icon="mdi:bell-ring-outline",
+        native_unit_of_measurement="notifications/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        fields=frozenset({FIELD_METRIC_NOTIFY_RATE}),
+        value_fn=lambda coordinator: coordinator.metrics.notifications.per_minute(
+            time.monotonic()
+        ),
+    ),
+)
 
 
 async def async_setup_entry(hass, entry, async_add_entities) -> None:
     coordinator: CampChefCoordinator = hass.data[DOMAIN][entry.entry_id]
     name = entry.data.get(CONF_NAME, entry.title)
-    caps = getattr(getattr(coordinator.data, "device", None), "capabilities", None)
-    probe_count = caps.probe_count if caps and caps.probe_count else 0
     entities: list[SensorEntity] = [
-        CampChefModeSensor(coordinator, entry, name),
-        CampChefFanSensor(coordinator, entry, name),
-        CampChefWifiRssiSensor(coordinator, entry, name),
-        CampChefWifiSsidSensor(coordinator, entry, name),
-        CampChefOtaStateSensor(coordinator, entry, name),
-        CampChefOtaProgressSensor(coordinator, entry, name),
-        CampChefPelletLevelSensor(coordinator, entry, name),
-        CampChefTransitioningSensor(coordinator, entry, name),
-        CampChefFaultSensor(coordinator, entry, name),
+        CampChefSensor(coordinator, entry, name, description) for description in SENSORS
     ]
-    for index in range(probe_count):
+    for index in range(coordinator.probe_count):
         entities.append(CampChefProbeSensor(coordinator, entry, name, index))
+        entities.append(CampChefProbeEtaSensor(coordinator, entry, name, index))
+    entities.append(CampChefProgramSensor(coordinator, entry, name))
     async_add_entities(entities)
 
 
-class CampChefBaseSensor(CoordinatorEntity[CampChefCoordinator], SensorEntity):
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = None
-    _attr_state_class = None
-
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator)
-        self._entry = entry
-        self._base_name = name
-
+class CampChefBaseSensor(CampChefEntity, SensorEntity):
     async def async_added_to_hass(self) -> None:
         """Handle entity added to hass."""
         await super().async_added_to_hass()
         # Ensure an initial state is written so history shows unavailable entries
         self.async_write_ha_state()
 
-    @property
-    def device_info(self):
-        vendor_key = self._entry.data.get(CONF_VENDOR, "campchef")
-        vendor = VENDOR_CONFIGS.get(vendor_key, VENDOR_CONFIGS["campchef"]).name
-        address = self._entry.data[CONF_ADDRESS]
-        return DeviceInfo(
-            identifiers={(DOMAIN, address)},
-            connections={(CONNECTION_BLUETOOTH, address)},
-            name=self._base_name,
-            manufacturer=vendor,
-            sw_version=self.coordinator._device_info.get("sw_version"),
-            hw_version=self.coordinator._device_info.get("hw_version"),
-        )
-
-
-class CampChefModeSensor(CampChefBaseSensor):
-    _attr_name = "Mode"
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = None
-    _attr_state_class = None
-    _attr_icon = "mdi:grill"
-
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data[CONF_ADDRESS]}_mode"
-
-    @property
-    def native_value(self) -> Optional[str]:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
-        if not mode or mode.mode is None:
-            return None
-        return mode.mode.name if hasattr(mode.mode, "name") else str(mode.mode)
-
 
-class CampChefFanSensor(CampChefBaseSensor):
-    _attr_name = "Fan level"
-    _attr_device_class = None
-    _attr_native_unit_of_measurement = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:fan"
-    _attr_entity_registry_enabled_default = False
+class CampChefSensor(CampChefBaseSensor):
+    entity_description: CampChefSensorEntityDescription
 
-    @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data[CONF_ADDRESS]}_fan"
+    def __init__(
+        self,
+        coordinator: CampChefCoordinator,
+        entry,
+        name: str,
+        description: CampChefSensorEntityDescription,
+    ) -> None:
+        super().__init__(coordinator, entry, name, description.fields)
+        self.entity_description = description
+        self._attr_unique_id = f"{self._address}_{description.key}"
 
     @property
-    def native_value(self) -> Optional[int]:
-        mode = self.coordinator.data.mode if self.coordinator.data else None
-        if not mode or mode.fan_level is None:
-            return None
-        return int(mode.fan_level)
+    def native_value(self) -> Any:
+        return self.entity_description.value_fn(self.coordinator)
 
 
-class CampChefWifiRssiSensor(CampChefBaseSensor):
-    _attr_name = "Wi-Fi RSSI"
-    _attr_device_class = None
+class CampChefProbeSensor(CampChefBaseSensor):
+    _attr_device_class = SensorDeviceClass.TEMPERATURE
+    _attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:wifi-strength-2"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_wifi_rssi"
-        # Use dBm unit
-        self._attr_native_unit_of_measurement = "dBm"
 
-    @property
-    def native_value(self) -> Optional[int]:
-        wifi = self.coordinator.data.wifi if self.coordinator.data else None
-        return wifi.rssi_dbm if wifi and getattr(wifi, "rssi_dbm", None) is not None else None
+    def __init__(self, coordinator: CampChefCoordinator, entry, name: str, index: int) -> None:
+        super().__init__(coordinator, entry, name, probe_fields(index))
+        self._index = index
+        self._temp_field = probe_temp_field(index)
+        self._connected_field = probe_connected_field(index)
+        self._attr_name = f"Probe {index + 1}"
+        self._attr_unique_id = f"{self._address}_probe_{index + 1}"
+        self._throttle = coordinator.create_temperature_throttle()
+        self._throttle.offer(self._raw_value())
 
+    async def async_added_to_hass(self) -> None:
+        self.async_on_remove(
+            self._throttle.async_attach(self.hass, self.async_write_ha_state)
+        )
+        await super().async_added_to_hass()
 
-class CampChefWifiSsidSensor(CampChefBaseSensor):
-    _attr_name = "Wi-Fi SSID"
-    _attr_device_class = None
-    _attr_state_class = None
-    _attr_icon = "mdi:wifi"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        published = self._throttle.offer(self._raw_value())
+        if published or self.coordinator.changed_fields is None:
+            self.async_write_ha_state()
 
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_wifi_ssid"
+    def _raw_value(self) -> Optional[float]:
+        if not self.coordinator.value(self._connected_field):
+            return None
+        return self.coordinator.value(self._temp_field)
 
     @property
-    def native_value(self) -> Optional[str]:
-        wifi = self.coordinator.data.wifi if self.coordinator.data else None
-        ssid = getattr(wifi, "ssid", None)
-        return ssid if ssid else None
-
-
-class CampChefOtaStateSensor(CampChefBaseSensor):
-    _attr_name = "OTA state"
-    _attr_device_class = None
-    _attr_state_class = None
-    _attr_icon = "mdi:progress-clock"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_ota_state"
+    def native_value(self) -> Optional[float]:
+        return self._throttle.value
 
-    @property
-    def native_value(self) -> Optional[str]:
-        ota = self.coordinator.data.ota if self.coordinator.data else None
-        state = getattr(ota, "state", None)
-        if state is None:
-            return None
-        return state.name if hasattr(state, "name") else str(state)
 
+class CampChefProbeEtaSensor(CampChefBaseSensor):
+    """When the probe is expected to reach its target temperature."""
 
-class CampChefOtaProgressSensor(CampChefBaseSensor):
-    _attr_name = "OTA progress"
-    _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:progress-clock"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_icon = "mdi:timer-sand"
 
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_ota_progress"
+    def __init__(self, coordinator: CampChefCoordinator, entry, name: str, index: int) -> None:
+        super().__init__(
+            coordinator,
+            entry,
+            name,
+            # Not the probe's temperature: the coordinator flags the ETA
+            # field when the minute-rounded ETA or the stall flag moves, and
+            # the rate attribute is refreshed along with them.
+            frozenset({probe_eta_field(index), probe_target_field(index)}),
+        )
+        self._index = index
+        self._attr_name = f"Probe {index + 1} done"
+        self._attr_unique_id = f"{self._address}_probe_{index + 1}_eta"
 
     @property
-    def native_value(self) -> Optional[int]:
-        ota = self.coordinator.data.ota if self.coordinator.data else None
-        progress = getattr(ota, "progress_percent", None)
-        return int(progress) if progress is not None else None
-
-
-class CampChefPelletLevelSensor(CampChefBaseSensor):
-    _attr_name = "Pellet level"
-    _attr_device_class = None
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:silo"
-    _attr_entity_category = None
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_pellet_level"
+    def native_value(self) -> Optional[datetime]:
+        eta, _stalled = self.coordinator.probe_eta.get(self._index, (None, False))
+        return eta
 
     @property
-    def native_value(self) -> Optional[int]:
-        status = self.coordinator.data.status if self.coordinator.data else None
-        pellet = getattr(status, "pellet_level", None)
-        return int(pellet) if pellet is not None else None
-
-
-class CampChefTransitioningSensor(CampChefBaseSensor):
-    _attr_name = "Transitioning"
-    _attr_device_class = None
-    _attr_state_class = None
-    _attr_icon = "mdi:progress-clock"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
-
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_transitioning"
+    def extra_state_attributes(self) -> dict[str, Any]:
+        estimator = self.coordinator.estimators.get(self._index)
+        return {
+            "target": self.coordinator.probe_target(self._index),
+            "stalled": bool(estimator and estimator.stalled),
+            "rate_per_hour": (
+                None
+                if estimator is None or estimator.rate is None
+                else round(estimator.rate * 60, 1)
+            ),
+        }
 
-    @property
-    def native_value(self) -> Optional[bool]:
-        status = self.coordinator.data.status if self.coordinator.data else None
-        return bool(status.transitioning) if status and status.transitioning is not None else None
 
+class CampChefProgramSensor(CampChefBaseSensor):
+    """The running cook program's current step, or why none is running."""
 
-class CampChefFaultSensor(CampChefBaseSensor):
-    _attr_name = "Fault present"
-    _attr_device_class = None
-    _attr_state_class = None
-    _attr_icon = "mdi:alert"
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:format-list-numbered"
+    _attr_name = "Cook program"
 
     def __init__(self, coordinator: CampChefCoordinator, entry, name: str) -> None:
-        super().__init__(coordinator, entry, name)
-        self._attr_unique_id = f"{self._entry.data[CONF_ADDRESS]}_fault"
+        super().__init__(coordinator, entry, name, frozenset({FIELD_PROGRAM_STEP}))
+        self._attr_unique_id = f"{self._address}_cook_program"
 
     @property
-    def native_value(self) -> Optional[bool]:
-        status = self.coordinator.data.status if self.coordinator.data else None
-        return bool(status.has_fault) if status and status.has_fault is not None else None
-
-
-class CampChefProbeSensor(CampChefBaseSensor):
-    def __init__(self, coordinator: CampChefCoordinator, entry, name: str, index: int) -> None:
-        super().__init__(coordinator, entry, name)
-        self._index = index
-        self._attr_name = f"Probe {index + 1}"
-        self._attr_device_class = SensorDeviceClass.TEMPERATURE
-        self._attr_native_unit_of_measurement = UnitOfTemperature.FAHRENHEIT
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    def available(self) -> bool:
+        # The program runs in the coordinator, whether or not the grill is in range.
+        return True
 
     @property
-    def unique_id(self) -> str:
-        return f"{self._entry.data[CONF_ADDRESS]}_probe_{self._index + 1}"
+    def native_value(self) -> str:
+        program = self.coordinator.program
+        if (step := program.step) is None:
+            return program.status
+        return step.name or f"Step {program.index + 1}"
 
     @property
-    def native_value(self) -> Optional[float]:
-        probes = self.coordinator.data.probes if self.coordinator.data else {}
-        probe = probes.get(self._index)
-        if not probe or not probe.connected:
-            return None
-        if probe.temp_f is None:
-            return None
-        return probe.temp_f
+    def extra_state_attributes(self) -> dict[str, Any]:
+        program = self.coordinator.program
+        step = program.step
+        started = program.step_started
+        ends = None
+        if step is not None and step.minutes is not None and started is not None:
+            ends = dt_util.utc_from_timestamp(started + step.minutes * 60)
+        return {
+            "status": program.status,
+            "step": program.index + 1 if step is not None else None,
+            "steps": len(program.steps),
+            "step_started": None if started is None else dt_util.utc_from_timestamp(started),
+            "step_ends": ends,
+        }
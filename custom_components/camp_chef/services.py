@@ -0,0 +1,163 @@
+"""Services for Camp Chef."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import voluptuous as vol
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+from pycampchef.const import ModeName
+
+from .const import (
+    CAPTURE_DIR,
+    DEFAULT_MAX_TEMP_F,
+    DEFAULT_MIN_TEMP_F,
+    DOMAIN,
+    SMOKE_MAX_DEFAULT,
+    SMOKE_MIN_DEFAULT,
+)
+from .coordinator import CampChefCoordinator
+from .programs import ProgramStep
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_FILENAME = "filename"
+ATTR_STEPS = "steps"
+
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_START_PROGRAM = "start_program"
+SERVICE_STOP_PROGRAM = "stop_program"
+SERVICE_SKIP_PROGRAM_STEP = "skip_program_step"
+
+START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_FILENAME): cv.string,
+    }
+)
+STOP_CAPTURE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+PROGRAM_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Optional("name"): cv.string,
+        # Programs may end a cook but never light the grill.
+        vol.Optional("mode"): vol.All(cv.string, vol.Upper, vol.In([ModeName.STANDBY.name])),
+        vol.Optional("set_temp"): vol.Coerce(int),
+        vol.Optional("smoke_level"): vol.Coerce(int),
+        vol.Optional("minutes"): vol.All(vol.Coerce(float), vol.Range(min=0)),
+        vol.Optional("chamber_temp"): vol.Coerce(float),
+        vol.Inclusive("probe", "probe_trigger"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Inclusive("probe_temp", "probe_trigger"): vol.Coerce(float),
+    }
+)
+START_PROGRAM_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_STEPS): vol.All(
+            cv.ensure_list, [PROGRAM_STEP_SCHEMA], vol.Length(min=1)
+        ),
+    }
+)
+PROGRAM_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _coordinator(hass: HomeAssistant, call: ServiceCall) -> CampChefCoordinator:
+    coordinator = hass.data.get(DOMAIN, {}).get(call.data[ATTR_CONFIG_ENTRY_ID])
+    if not isinstance(coordinator, CampChefCoordinator):
+        raise ServiceValidationError(
+            f"No loaded Camp Chef grill for entry {call.data[ATTR_CONFIG_ENTRY_ID]}"
+        )
+    return coordinator
+
+
+def _validate_step(coordinator: CampChefCoordinator, step: ProgramStep) -> None:
+    vendor = coordinator.vendor
+    min_temp = getattr(vendor, "min_temp_f", DEFAULT_MIN_TEMP_F)
+    max_temp = getattr(vendor, "max_temp_f", DEFAULT_MAX_TEMP_F)
+    if step.set_temp is not None and not min_temp <= step.set_temp <= max_temp:
+        raise ServiceValidationError(
+            f"Set temperature {step.set_temp} is outside {min_temp}-{max_temp} °F"
+        )
+    smoke_min = getattr(vendor, "smoke_level_min", SMOKE_MIN_DEFAULT)
+    smoke_max = getattr(vendor, "smoke_level_max", SMOKE_MAX_DEFAULT)
+    if step.smoke_level is not None and not smoke_min <= step.smoke_level <= smoke_max:
+        raise ServiceValidationError(
+            f"Smoke level {step.smoke_level} is outside {smoke_min}-{smoke_max}"
+        )
+    probe_count = coordinator.probe_count
+    if step.probe is not None and not 1 <= step.probe <= probe_count:
+        raise ServiceValidationError(
+            f"Probe {step.probe} is outside 1-{probe_count}"
+            if probe_count
+            else f"Probe {step.probe} cannot be used; the grill has not reported its probes"
+        )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def _async_start_capture(call: ServiceCall) -> ServiceResponse:
+        coordinator = _coordinator(hass, call)
+        filename = call.data.get(ATTR_FILENAME)
+        if filename:
+            # Only a file name; captures always go to the capture directory.
+            filename = Path(filename).name
+            if not filename.endswith(".jsonl.gz"):
+                filename = f"{filename}.jsonl.gz"
+        else:
+            stamp = dt_util.utcnow().strftime("%Y%m%dT%H%M%SZ")
+            filename = f"{call.data[ATTR_CONFIG_ENTRY_ID]}_{stamp}.jsonl.gz"
+        path = Path(hass.config.path(CAPTURE_DIR)) / filename
+        await coordinator.async_start_capture(path)
+        return {"path": str(path)}
+
+    async def _async_stop_capture(call: ServiceCall) -> ServiceResponse:
+        path = await _coordinator(hass, call).async_stop_capture()
+        return {"path": str(path) if path else None}
+
+    @callback
+    def _async_start_program(call: ServiceCall) -> None:
+        coordinator = _coordinator(hass, call)
+        steps = [ProgramStep.from_dict(step) for step in call.data[ATTR_STEPS]]
+        for step in steps:
+            _validate_step(coordinator, step)
+        coordinator.program.async_start(steps)
+
+    @callback
+    def _async_stop_program(call: ServiceCall) -> None:
+        _coordinator(hass, call).program.async_stop()
+
+    @callback
+    def _async_skip_program_step(call: ServiceCall) -> None:
+        _coordinator(hass, call).program.async_skip()
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        _async_start_capture,
+        schema=START_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        _async_stop_capture,
+        schema=STOP_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_PROGRAM, _async_start_program, schema=START_PROGRAM_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_STOP_PROGRAM, _async_stop_program, schema=PROGRAM_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SKIP_PROGRAM_STEP, _async_skip_program_step, schema=PROGRAM_SCHEMA
+    )
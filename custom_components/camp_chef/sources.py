@@ -0,0 +1,66 @@
+"""Choose which adapter or proxy to connect through."""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# A candidate must beat the current source by this many dB ...
+SOURCE_SWITCH_MARGIN = 8
+# ... in each of this many consecutive samples before we move to it.
+SOURCE_SWITCH_SAMPLES = 3
+RSSI_HISTORY_LENGTH = 20
+
+
+class SourceSelector:
+    """Pick the connectable source with the best signal, with hysteresis.
+
+    ``select`` is called before every reconnect with the RSSI each source
+    currently hears the grill at. The current source is kept unless it lost
+    the grill or another one has been better by ``margin`` for ``samples``
+    reconnects in a row, so two similar proxies do not flap.
+    """
+
+    def __init__(
+        self,
+        margin: int = SOURCE_SWITCH_MARGIN,
+        samples: int = SOURCE_SWITCH_SAMPLES,
+    ) -> None:
+        self._margin = margin
+        self._samples = samples
+        self.current: str | None = None
+        self.history: dict[str, deque[int]] = {}
+        self.switches = 0
+
+    def select(self, candidates: dict[str, int]) -> str | None:
+        """Record a round of RSSI samples and return the source to use."""
+        for source, rssi in candidates.items():
+            history = self.history.get(source)
+            if history is None:
+                history = self.history[source] = deque(maxlen=RSSI_HISTORY_LENGTH)
+            history.append(rssi)
+        if not candidates:
+            return self.current
+        best = max(candidates, key=candidates.__getitem__)
+        if self.current not in candidates or (
+            best != self.current and self._consistently_better(best, self.current)
+        ):
+            if self.current is not None:
+                self.switches += 1
+            self.current = best
+        return self.current
+
+    def _consistently_better(self, candidate: str, current: str) -> bool:
+        ours = self.history[current]
+        theirs = self.history[candidate]
+        if len(ours) < self._samples or len(theirs) < self._samples:
+            return False
+        return all(
+            theirs[-i] - ours[-i] >= self._margin for i in range(1, self._samples + 1)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "current": self.current,
+            "switches": self.switches,
+            "rssi_history": {source: list(history) for source, history in self.history.items()},
+        }
@@ -0,0 +1,193 @@
+"""Flat field view of a GrillState used for change detection."""
+from __future__ import annotations
+
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any, Iterable
+
+from pycampchef.const import ModeName
+from pycampchef.models import GrillMode, GrillState
+
+FIELD_MODE = "mode.mode"
+FIELD_SET_TEMP = "mode.set_temp_f"
+FIELD_SMOKE_LEVEL = "mode.smoke_level"
+FIELD_FAN_LEVEL = "mode.fan_level"
+FIELD_PELLET_LEVEL = "status.pellet_level"
+FIELD_TRANSITIONING = "status.transitioning"
+FIELD_FAULT = "status.has_fault"
+FIELD_CHAMBER_TEMP = "chamber.temp_f"
+FIELD_WIFI_RSSI = "wifi.rssi_dbm"
+FIELD_WIFI_SSID = "wifi.ssid"
+FIELD_WIFI_STATUS = "wifi.status"
+FIELD_OTA_STATE = "ota.state"
+FIELD_OTA_PROGRESS = "ota.progress_percent"
+FIELD_MODEL_FW = "device.model_fw"
+FIELD_ESP_FW = "device.esp_fw"
+FIELD_MODEL_ID = "device.model_id"
+FIELD_PROBE_COUNT = "device.probe_count"
+
+# Coordinator-side values that are not part of GrillState.
+FIELD_COMMAND_QUEUE = "commands.queue_depth"
+FIELD_COMMAND_LATENCY = "commands.latency"
+FIELD_CONNECT_LATENCY = "connection.latency"
+FIELD_CONNECT_SUCCESS = "connection.success_rate"
+FIELD_BLE_RSSI = "ble.rssi"
+FIELD_BLE_PRESENT = "ble.present"
+FIELD_METRIC_TELEMETRY = "metrics.telemetry_p95"
+FIELD_METRIC_SNAPSHOT = "metrics.snapshot_p95"
+FIELD_METRIC_NOTIFY_RATE = "metrics.notifications_per_minute"
+FIELD_PELLET_RATE = "pellets.burn_rate"
+FIELD_PELLET_HOURS = "pellets.hours_remaining"
+FIELD_PROGRAM_STEP = "program.step"
+
+MODE_FIELDS = frozenset({FIELD_MODE, FIELD_SET_TEMP, FIELD_SMOKE_LEVEL, FIELD_FAN_LEVEL})
+METRIC_FIELDS = frozenset(
+    {FIELD_METRIC_TELEMETRY, FIELD_METRIC_SNAPSHOT, FIELD_METRIC_NOTIFY_RATE}
+)
+PELLET_ESTIMATE_FIELDS = frozenset({FIELD_PELLET_RATE, FIELD_PELLET_HOURS})
+DEVICE_FIELDS = frozenset({FIELD_MODEL_FW, FIELD_ESP_FW, FIELD_MODEL_ID, FIELD_PROBE_COUNT})
+# GrillState groups a snapshot is made of; a field's group is its first part.
+SNAPSHOT_GROUPS = frozenset({"mode", "status", "chamber", "probes", "wifi", "ota", "device"})
+# Groups that rarely change and are refreshed on a slow cadence.
+SLOW_GROUPS = frozenset({"wifi", "ota", "device"})
+
+# Not worth restoring after a restart; an OTA is never still running.
+TRANSIENT_FIELDS = frozenset({FIELD_OTA_STATE, FIELD_OTA_PROGRESS})
+
+_GROUP_FIELDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("mode", ("mode", "set_temp_f", "smoke_level", "fan_level")),
+    ("status", ("pellet_level", "transitioning", "has_fault")),
+    ("chamber", ("temp_f",)),
+    ("wifi", ("rssi_dbm", "ssid", "status")),
+    ("ota", ("state", "progress_percent")),
+    ("device", ("model_fw", "esp_fw")),
+)
+
+
+def field_group(field: str) -> str:
+    return field.split(".", 1)[0]
+
+
+def prefix_groups(prefixes: Iterable[str]) -> frozenset[str]:
+    """Snapshot groups holding fields that start with one of ``prefixes``."""
+    prefixes = tuple(prefixes)
+    if not prefixes:
+        return SNAPSHOT_GROUPS
+    return frozenset(
+        group
+        for group in SNAPSHOT_GROUPS
+        for prefix in prefixes
+        if group.startswith(prefix) or prefix.startswith(f"{group}.")
+    )
+
+
+def probe_temp_field(index: int) -> str:
+    return f"probes.{index}.temp_f"
+
+
+def probe_connected_field(index: int) -> str:
+    return f"probes.{index}.connected"
+
+
+def probe_target_field(index: int) -> str:
+    return f"targets.{index}"
+
+
+def probe_eta_field(index: int) -> str:
+    return f"eta.{index}"
+
+
+def probe_fields(index: int) -> frozenset[str]:
+    return frozenset({probe_temp_field(index), probe_connected_field(index)})
+
+
+def flatten_state(state: GrillState | None) -> dict[str, Any]:
+    """Return the value of every tracked field keyed by its dotted path.
+
+    The client may mutate its GrillState in place, so change detection has to
+    compare copied values rather than object identity.
+    """
+    fields: dict[str, Any] = {}
+    if state is None:
+        return fields
+    for group, attrs in _GROUP_FIELDS:
+        obj = getattr(state, group, None)
+        for attr in attrs:
+            fields[f"{group}.{attr}"] = getattr(obj, attr, None)
+    device = getattr(state, "device", None)
+    fields[FIELD_MODEL_ID] = getattr(getattr(device, "info", None), "model_id", None)
+    fields[FIELD_PROBE_COUNT] = getattr(
+        getattr(device, "capabilities", None), "probe_count", None
+    )
+    for index, probe in (getattr(state, "probes", None) or {}).items():
+        fields[probe_connected_field(index)] = getattr(probe, "connected", None)
+        fields[probe_temp_field(index)] = getattr(probe, "temp_f", None)
+    return fields
+
+
+def diff_fields(old: dict[str, Any], new: dict[str, Any]) -> set[str]:
+    """Return the keys whose value differs between two flattened states."""
+    changed = {key for key, value in new.items() if key not in old or old[key] != value}
+    changed.update(key for key in old if key not in new)
+    return changed
+
+
+def encode_value(value: Any) -> Any:
+    """Return a JSON-friendly form of a field value."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def encode_fields(fields: dict[str, Any]) -> dict[str, Any]:
+    """Return the persistable subset of a flattened state."""
+    return {
+        key: encode_value(value)
+        for key, value in fields.items()
+        if key not in TRANSIENT_FIELDS
+    }
+
+
+def restore_state(fields: dict[str, Any]) -> GrillState:
+    """Rebuild a GrillState from encoded fields.
+
+    Only the mode is rebuilt as a real model; the other groups are plain
+    namespaces carrying the attributes entities and ``flatten_state`` read.
+    The first live update replaces the whole object.
+    """
+    state = GrillState()
+    groups: dict[str, dict[str, Any]] = {}
+    probes: dict[int, dict[str, Any]] = {}
+    for key, value in fields.items():
+        parts = key.split(".")
+        if parts[0] == "probes":
+            probes.setdefault(int(parts[1]), {})[parts[2]] = value
+        else:
+            groups.setdefault(parts[0], {})[parts[1]] = value
+
+    mode = groups.pop("mode", {})
+    if mode.get("mode") is not None:
+        try:
+            mode["mode"] = ModeName(mode["mode"])
+        except ValueError:
+            mode["mode"] = None
+    state.mode = GrillMode(
+        mode=mode.get("mode"),
+        set_temp_f=mode.get("set_temp_f"),
+        smoke_level=mode.get("smoke_level"),
+        fan_level=mode.get("fan_level"),
+    )
+    device = groups.pop("device", {})
+    state.device = SimpleNamespace(
+        model_fw=device.get("model_fw"),
+        esp_fw=device.get("esp_fw"),
+        info=SimpleNamespace(model_id=device.get("model_id")),
+        capabilities=SimpleNamespace(probe_count=device.get("probe_count")),
+    )
+    for group, attrs in _GROUP_FIELDS:
+        if group in groups:
+            values = {attr: groups[group].get(attr) for attr in attrs}
+            setattr(state, group, SimpleNamespace(**values))
+    state.probes = {
+        index: SimpleNamespace(connected=probe.get("connected"), temp_f=probe.get("temp_f"))
+        for index, probe in probes.items()
+    }
+    return state
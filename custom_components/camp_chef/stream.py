@@ -0,0 +1,138 @@
+"""Push raw telemetry deltas to live subscribers, bypassing entity state."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable, Iterable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .state import encode_value
+
+# Shortest time between messages to one subscriber: at most 20 per second.
+MIN_SEND_INTERVAL = 0.05
+
+
+class _Subscriber:
+    """Latest-value buffer for one subscriber.
+
+    Deltas are merged into ``pending`` until the next send, so a slow
+    subscriber costs at most one value per field however far behind it is.
+    """
+
+    __slots__ = (
+        "send",
+        "prefixes",
+        "interval",
+        "pending",
+        "handle",
+        "last_sent",
+        "sent",
+        "merged",
+    )
+
+    def __init__(
+        self,
+        send: Callable[[dict[str, Any]], None],
+        prefixes: tuple[str, ...],
+        interval: float,
+    ) -> None:
+        self.send = send
+        self.prefixes = prefixes
+        self.interval = interval
+        self.pending: dict[str, Any] = {}
+        self.handle: asyncio.TimerHandle | asyncio.Handle | None = None
+        self.last_sent = 0.0
+        self.sent = 0
+        self.merged = 0
+
+    def wants(self, key: str) -> bool:
+        return not self.prefixes or key.startswith(self.prefixes)
+
+
+class TelemetryStream:
+    """Fan telemetry deltas out to websocket subscribers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._subscribers: list[_Subscriber] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    @callback
+    def async_subscribe(
+        self,
+        send: Callable[[dict[str, Any]], None],
+        fields: dict[str, Any],
+        prefixes: Iterable[str] = (),
+        interval: float = 0.0,
+    ) -> CALLBACK_TYPE:
+        """Send the current state, then every change; returns the unsubscribe."""
+        subscriber = _Subscriber(send, tuple(prefixes), max(interval, MIN_SEND_INTERVAL))
+        self._subscribers.append(subscriber)
+        subscriber.pending = {
+            key: encode_value(value)
+            for key, value in fields.items()
+            if subscriber.wants(key)
+        }
+        self._async_flush(subscriber)
+
+        @callback
+        def _unsubscribe() -> None:
+            if subscriber.handle is not None:
+                subscriber.handle.cancel()
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+        return _unsubscribe
+
+    @callback
+    def publish(self, fields: dict[str, Any], changed: Iterable[str]) -> None:
+        for subscriber in self._subscribers:
+            pending = subscriber.pending
+            for key in changed:
+                if subscriber.wants(key):
+                    if key in pending:
+                        subscriber.merged += 1
+                    pending[key] = encode_value(fields.get(key))
+            if pending and subscriber.handle is None:
+                delay = subscriber.last_sent + subscriber.interval - time.monotonic()
+                subscriber.handle = self._hass.loop.call_later(
+                    max(delay, 0.0), self._async_flush, subscriber
+                )
+
+    @callback
+    def _async_flush(self, subscriber: _Subscriber) -> None:
+        subscriber.handle = None
+        if not subscriber.pending:
+            return
+        fields, subscriber.pending = subscriber.pending, {}
+        subscriber.last_sent = time.monotonic()
+        subscriber.sent += 1
+        subscriber.send({"t": round(time.time(), 3), "fields": fields})
+
+    @callback
+    def async_close(self) -> None:
+        """Flush every subscriber and tell it the stream has ended.
+
+        The coordinator is going away (unload or reload), so subscribers
+        have to subscribe again to follow the grill.
+        """
+        subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            if subscriber.handle is not None:
+                subscriber.handle.cancel()
+            self._async_flush(subscriber)
+            subscriber.send({"t": round(time.time(), 3), "end": True})
+
+    def as_dict(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "prefixes": list(subscriber.prefixes),
+                "interval": subscriber.interval,
+                "sent": subscriber.sent,
+                "merged": subscriber.merged,
+            }
+            for subscriber in self._subscribers
+        ]
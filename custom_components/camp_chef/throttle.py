@@ -0,0 +1,86 @@
+"""Deadband and interval limits for publishing temperature readings."""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+
+class TemperatureThrottle:
+    """Decide which raw readings of one temperature entity get published.
+
+    A reading is published when it moves at least ``deadband`` degrees from the
+    last published value, or when ``max_interval`` seconds have passed since
+    then and the value differs at all. Nothing is published more often than
+    every ``min_interval`` seconds, except transitions to or from unknown.
+    Suppressed readings are re-checked on a timer so the final value of a
+    burst is never lost. A zero setting disables that limit.
+    """
+
+    def __init__(self, deadband: float, min_interval: float, max_interval: float) -> None:
+        self._deadband = deadband
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self.value: float | None = None
+        self._raw: float | None = None
+        self._published_at = 0.0
+        self._hass: HomeAssistant | None = None
+        self._write: Callable[[], None] | None = None
+        self._unsub_retry: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_attach(self, hass: HomeAssistant, write: Callable[[], None]) -> CALLBACK_TYPE:
+        """Start scheduling trailing publishes; returns a detach callback."""
+        self._hass = hass
+        self._write = write
+        return self._async_detach
+
+    @callback
+    def _async_detach(self) -> None:
+        self._cancel_retry()
+        self._hass = None
+        self._write = None
+
+    @callback
+    def offer(self, raw: float | None) -> bool:
+        """Record a raw reading; return True if it became the published value."""
+        self._raw = raw
+        now = time.monotonic()
+        delay = self._delay(raw, now)
+        if delay is None:
+            self._cancel_retry()
+            return False
+        if delay <= 0:
+            self._cancel_retry()
+            self.value = raw
+            self._published_at = now
+            return True
+        if self._unsub_retry is None and self._hass is not None:
+            self._unsub_retry = async_call_later(self._hass, delay, self._async_retry)
+        return False
+
+    def _delay(self, raw: float | None, now: float) -> float | None:
+        """Seconds until ``raw`` may be published, or None if nothing to do."""
+        if raw == self.value:
+            return None
+        if raw is None or self.value is None:
+            return 0
+        elapsed = now - self._published_at
+        if abs(raw - self.value) >= self._deadband:
+            return max(0.0, self._min_interval - elapsed)
+        if self._max_interval:
+            return max(0.0, self._max_interval - elapsed, self._min_interval - elapsed)
+        return None
+
+    @callback
+    def _async_retry(self, _now: Any) -> None:
+        self._unsub_retry = None
+        if self.offer(self._raw) and self._write is not None:
+            self._write()
+
+    def _cancel_retry(self) -> None:
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
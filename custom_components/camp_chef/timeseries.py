@@ -0,0 +1,161 @@
+"""Downsampling in-memory temperature history of the current cook."""
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+from pycampchef.const import ModeName
+
+from .state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_MODE,
+    FIELD_PROBE_COUNT,
+    FIELD_SET_TEMP,
+    probe_temp_field,
+)
+
+# Points per resolution tier; each tier is half the resolution of the last.
+TIER_CAPACITY = 360
+TIER_COUNT = 4
+# Readings closer together than this replace the previous point.
+SAMPLE_INTERVAL = 5.0
+
+
+class _Tier:
+    """Fixed-capacity ring of (time, value) float32 pairs."""
+
+    __slots__ = ("times", "values", "start", "size")
+
+    def __init__(self, capacity: int) -> None:
+        self.times = array("f", bytes(4 * capacity))
+        self.values = array("f", bytes(4 * capacity))
+        self.start = 0
+        self.size = 0
+
+    def _index(self, offset: int) -> int:
+        return (self.start + offset) % len(self.times)
+
+    def full(self) -> bool:
+        return self.size == len(self.times)
+
+    def append(self, at: float, value: float) -> None:
+        index = self._index(self.size)
+        self.times[index] = at
+        self.values[index] = value
+        self.size += 1
+
+    def pop_pair(self) -> tuple[float, float]:
+        """Remove the two oldest points and return them merged."""
+        merged = self._pair(0)
+        self.start = self._index(2)
+        self.size -= 2
+        return merged
+
+    def halve(self) -> None:
+        """Merge neighbouring points in place, freeing half the tier."""
+        merged = [self._pair(offset) for offset in range(0, self.size - 1, 2)]
+        if self.size % 2:
+            last = self._index(self.size - 1)
+            merged.append((self.times[last], self.values[last]))
+        self.start = 0
+        self.size = 0
+        for at, value in merged:
+            self.append(at, value)
+
+    def _pair(self, offset: int) -> tuple[float, float]:
+        # A merged point keeps the earlier time, so the series stays
+        # anchored at the start of the cook however often it is merged.
+        first, second = self._index(offset), self._index(offset + 1)
+        return self.times[first], (self.values[first] + self.values[second]) / 2
+
+    def points(self) -> tuple[list[float], list[float]]:
+        indexes = [self._index(offset) for offset in range(self.size)]
+        return [self.times[i] for i in indexes], [self.values[i] for i in indexes]
+
+
+class TieredSeries:
+    """One channel at full resolution recently, coarser further back.
+
+    When the newest tier fills up its two oldest points are averaged into
+    one point in the next tier; the oldest tier halves itself in place instead, so the
+    whole cook is always kept and memory never grows.
+    """
+
+    def __init__(self, capacity: int = TIER_CAPACITY, tiers: int = TIER_COUNT) -> None:
+        self._tiers = [_Tier(capacity) for _ in range(tiers)]
+        self.last_at: float | None = None
+
+    def add(self, at: float, value: float) -> None:
+        newest = self._tiers[0]
+        if self.last_at is not None and at - self.last_at < SAMPLE_INTERVAL:
+            newest.values[newest._index(newest.size - 1)] = value
+            return
+        self.last_at = at
+        self._make_room(0)
+        newest.append(at, value)
+
+    def _make_room(self, level: int) -> None:
+        tier = self._tiers[level]
+        if not tier.full():
+            return
+        if level == len(self._tiers) - 1:
+            tier.halve()
+            return
+        self._make_room(level + 1)
+        self._tiers[level + 1].append(*tier.pop_pair())
+
+    def as_dict(self) -> dict[str, list[float]]:
+        times: list[float] = []
+        values: list[float] = []
+        for tier in reversed(self._tiers):
+            tier_times, tier_values = tier.points()
+            times.extend(round(at, 1) for at in tier_times)
+            values.extend(round(value, 1) for value in tier_values)
+        return {"t": times, "v": values}
+
+
+class CookSeries:
+    """Chamber, set and probe temperatures since the grill entered RUN.
+
+    Times are seconds since the cook started; ``started`` is the wall-clock
+    start as a Unix timestamp.
+    """
+
+    def __init__(self) -> None:
+        self.started: float | None = None
+        self._start_monotonic = 0.0
+        self._running = False
+        self._channels: dict[str, str] = {}
+        self._series: dict[str, TieredSeries] = {}
+
+    def observe(
+        self, now: float, wall_time: float, fields: dict[str, Any], changed: set[str]
+    ) -> None:
+        running = fields.get(FIELD_MODE) == ModeName.RUN
+        if running and not self._running:
+            self._start(now, wall_time, fields)
+            changed = set(self._channels.values())
+        self._running = running
+        if self.started is None:
+            return
+        at = now - self._start_monotonic
+        for channel, field in self._channels.items():
+            if field in changed and (value := fields.get(field)) is not None:
+                self._series[channel].add(at, float(value))
+
+    def _start(self, now: float, wall_time: float, fields: dict[str, Any]) -> None:
+        self.started = wall_time
+        self._start_monotonic = now
+        self._channels = {"chamber": FIELD_CHAMBER_TEMP, "set_temp": FIELD_SET_TEMP}
+        for index in range(fields.get(FIELD_PROBE_COUNT) or 0):
+            self._channels[f"probe_{index + 1}"] = probe_temp_field(index)
+        self._series = {channel: TieredSeries() for channel in self._channels}
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "started": self.started,
+            "running": self._running,
+            "channels": {
+                channel: series.as_dict() for channel, series in self._series.items()
+            },
+        }
@@ -0,0 +1,62 @@
+"""Map advertisements and library configs to vendor keys."""
+from __future__ import annotations
+
+from typing import Any, Iterable
+
+from pycampchef.const import VENDOR_CONFIGS
+
+DEFAULT_VENDOR = "campchef"
+
+
+class VendorIndex:
+    """Lookup tables built once from ``VENDOR_CONFIGS``.
+
+    Service UUIDs resolve with a dict hit. Name
+    prefixes are grouped by length, so a name is matched with one slice
+    and dict lookup per distinct prefix length instead of a scan over
+    every vendor.
+    """
+
+    def __init__(self, configs: dict[str, Any]) -> None:
+        self.configs = configs
+        self._by_uuid: dict[str, str] = {}
+        self._by_prefix: dict[int, dict[str, str]] = {}
+        for key, cfg in configs.items():
+            uuid = getattr(cfg, "service_uuid", None)
+            if uuid:
+                self._by_uuid.setdefault(uuid.lower(), key)
+            prefix = getattr(cfg, "adv_name_prefix", None)
+            if prefix:
+                self._by_prefix.setdefault(len(prefix), {}).setdefault(prefix, key)
+        # Longest prefix wins when vendors share a stem.
+        self._prefix_lengths = sorted(self._by_prefix, reverse=True)
+
+    def match(self, service_uuids: Iterable[str] | None, name: str | None) -> str | None:
+        """Return the vendor key for an advertisement, or None."""
+        for uuid in service_uuids or ():
+            key = self._by_uuid.get(uuid.lower())
+            if key is not None:
+                return key
+        if name:
+            for length in self._prefix_lengths:
+                key = self._by_prefix[length].get(name[:length])
+                if key is not None:
+                    return key
+        return None
+
+    def key_for(self, cfg: Any) -> str:
+        """Return the key of a config object handed back by the library.
+
+        Compared by value: discovery may hand back a copy rather than the
+        object in ``VENDOR_CONFIGS``. This only runs in the config flow.
+        """
+        for key, known in self.configs.items():
+            if known == cfg:
+                return key
+        return DEFAULT_VENDOR
+
+    def config(self, key: str) -> Any:
+        return self.configs.get(key, self.configs[DEFAULT_VENDOR])
+
+
+VENDORS = VendorIndex(VENDOR_CONFIGS)
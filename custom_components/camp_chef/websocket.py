@@ -0,0 +1,90 @@
+"""Websocket commands for Camp Chef."""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+from .coordinator import CampChefCoordinator
+from .state import prefix_groups
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, ws_cook_series)
+    websocket_api.async_register_command(hass, ws_subscribe_telemetry)
+
+
+def _coordinator(hass: HomeAssistant, entry_id: str) -> CampChefCoordinator | None:
+    coordinator = hass.data.get(DOMAIN, {}).get(entry_id)
+    return coordinator if isinstance(coordinator, CampChefCoordinator) else None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/cook_series",
+        vol.Required("entry_id"): str,
+    }
+)
+@callback
+def ws_cook_series(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the current cook's temperature series in one message."""
+    coordinator = _coordinator(hass, msg["entry_id"])
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Grill not found")
+        return
+    connection.send_result(msg["id"], coordinator.cook.as_dict())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_telemetry",
+        vol.Required("entry_id"): str,
+        vol.Optional("fields", default=[]): [str],
+        vol.Optional("interval", default=0): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=60)
+        ),
+    }
+)
+@callback
+def ws_subscribe_telemetry(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream field deltas as the grill reports them.
+
+    ``fields`` limits the stream to keys starting with one of the given
+    prefixes (for example ``probes.``); ``interval`` is the minimum time
+    between messages, with changes in between merged into the next one.
+    When the grill is unloaded or reloaded, a last message with ``end`` set
+    closes the subscription; subscribe again to keep following the grill.
+    """
+    coordinator = _coordinator(hass, msg["entry_id"])
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Grill not found")
+        return
+
+    @callback
+    def _send(event: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], event))
+        if event.get("end"):
+            connection.subscriptions.pop(msg["id"], None)
+
+    connection.send_result(msg["id"])
+    unsub_stream = coordinator.stream.async_subscribe(
+        _send, coordinator.fields, msg["fields"], msg["interval"]
+    )
+    # Polled grills only read the groups somebody needs; this is one.
+    release_groups = coordinator.async_register_groups(prefix_groups(msg["fields"]))
+
+    @callback
+    def _unsubscribe() -> None:
+        unsub_stream()
+        release_groups()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
@@ -0,0 +1,71 @@
+"""Fixtures that set the integration up against a simulated grill."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.simulator import GrillScript, SimulatedBluetooth, simulated_bluetooth
+from custom_components.camp_chef.const import CONF_ADDRESS, CONF_NAME, CONF_VENDOR, DOMAIN
+from custom_components.camp_chef.coordinator import CampChefCoordinator
+
+ADDRESS = "AA:BB:CC:00:00:01"
+# Set up by Home Assistant in a real install; the simulator stands in for
+# what the integration uses of them.
+PROVIDED_DEPENDENCIES = ("bluetooth", "websocket_api")
+
+
+@pytest.fixture
+def script() -> GrillScript:
+    """The simulated grill; tests push its notifications themselves."""
+    return GrillScript(
+        notify_interval=3600, connect_latency=0, command_latency=0, read_latency=0
+    )
+
+
+@pytest.fixture
+def bluetooth(script: GrillScript) -> Iterator[SimulatedBluetooth]:
+    with simulated_bluetooth({ADDRESS: script}) as bluetooth:
+        yield bluetooth
+
+
+@pytest.fixture
+def options() -> dict[str, Any]:
+    return {}
+
+
+@pytest.fixture
+def entry(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    bluetooth: SimulatedBluetooth,
+    options: dict[str, Any],
+) -> MockConfigEntry:
+    """A config entry for the simulated grill, added but not set up."""
+    hass.config.components.update(PROVIDED_DEPENDENCIES)
+    # Grills report Fahrenheit; keep states in it.
+    hass.config.units = US_CUSTOMARY_SYSTEM
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Grill",
+        data={CONF_ADDRESS: ADDRESS, CONF_NAME: "Grill", CONF_VENDOR: "campchef"},
+        options=options,
+        unique_id=ADDRESS,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> AsyncIterator[CampChefCoordinator]:
+    """The coordinator of the set-up entry; unloaded afterwards."""
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield hass.data[DOMAIN][entry.entry_id]
+    await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,197 @@
+"""Tests for the alarm and transition rules."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pycampchef.const import ModeName
+
+from custom_components.camp_chef.alarms import (
+    CHAMBER_HYSTERESIS,
+    EVENT_CHAMBER_IN_BAND,
+    EVENT_CHAMBER_OUT_OF_BAND,
+    EVENT_FAULT,
+    EVENT_FAULT_CLEARED,
+    EVENT_PROBE_TARGET_REACHED,
+    PROBE_HYSTERESIS,
+    TRANSITION_EVENTS,
+    AlarmEngine,
+)
+from custom_components.camp_chef.state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_FAULT,
+    FIELD_MODE,
+    FIELD_SET_TEMP,
+    probe_connected_field,
+    probe_temp_field,
+)
+
+BAND = 20
+MINUTES = 10
+
+
+class Feed:
+    """Drive an engine with field updates, as the coordinator does."""
+
+    def __init__(self, engine: AlarmEngine, fields: dict[str, Any], probe_count: int = 0) -> None:
+        self.engine = engine
+        self.fields = fields
+        self.probe_count = probe_count
+        self.now = 0.0
+        engine.evaluate(self.now, fields, set(fields), probe_count)
+
+    def update(self, after: float = 1.0, **values: Any) -> list[str]:
+        self.now += after
+        self.fields = {**self.fields, **values}
+        alarms = self.engine.evaluate(self.now, self.fields, set(values), self.probe_count)
+        return self.events(alarms)
+
+    @staticmethod
+    def events(alarms: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        # Transition events are covered separately.
+        return [event for event, _ in alarms if event not in TRANSITION_EVENTS.values()]
+
+
+def _probe(temp: float | None, connected: bool = True) -> dict[str, Any]:
+    return {probe_temp_field(0): temp, probe_connected_field(0): connected}
+
+
+def _probe_feed(targets: dict[int, float], temp: float) -> Feed:
+    return Feed(AlarmEngine(targets, 0, MINUTES), _probe(temp), probe_count=1)
+
+
+def test_probe_alarms_once_when_it_reaches_its_target() -> None:
+    feed = _probe_feed({0: 165}, 150)
+    assert feed.update(**_probe(164)) == []
+    assert feed.update(**_probe(165)) == [EVENT_PROBE_TARGET_REACHED]
+    assert feed.update(**_probe(170)) == []
+
+
+def test_probe_rearms_after_dropping_below_the_hysteresis() -> None:
+    feed = _probe_feed({0: 165}, 166)
+    assert feed.update(**_probe(165 - PROBE_HYSTERESIS / 2)) == []
+    assert feed.update(**_probe(166)) == []
+    assert feed.update(**_probe(165 - PROBE_HYSTERESIS - 1)) == []
+    assert feed.update(**_probe(166)) == [EVENT_PROBE_TARGET_REACHED]
+
+
+def test_probe_already_past_its_target_does_not_alarm() -> None:
+    feed = _probe_feed({0: 165}, 180)
+    assert feed.update(**_probe(181)) == []
+
+
+def test_disconnected_probe_does_not_alarm() -> None:
+    feed = _probe_feed({0: 165}, 150)
+    assert feed.update(**_probe(170, connected=False)) == []
+
+
+def test_new_target_rearms_the_probe() -> None:
+    targets = {0: 165.0}
+    feed = _probe_feed(targets, 150)
+    assert feed.update(**_probe(166)) == [EVENT_PROBE_TARGET_REACHED]
+    targets[0] = 170.0
+    feed.engine.rearm_probe(0)
+    assert feed.update(**_probe(167)) == []
+    assert feed.update(**_probe(171)) == [EVENT_PROBE_TARGET_REACHED]
+
+
+def _band_feed() -> Feed:
+    return Feed(
+        AlarmEngine({}, BAND, MINUTES),
+        {FIELD_MODE: ModeName.RUN, FIELD_SET_TEMP: 225, FIELD_CHAMBER_TEMP: 225},
+    )
+
+
+def test_chamber_out_of_band_after_the_duration_and_back_in() -> None:
+    feed = _band_feed()
+    assert feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND + 5}) == []
+    assert feed.engine.due == feed.now + MINUTES * 60
+    assert feed.update(MINUTES * 60, **{FIELD_CHAMBER_TEMP: 225 + BAND + 6}) == [
+        EVENT_CHAMBER_OUT_OF_BAND
+    ]
+    assert feed.engine.due is None
+    # Just inside the band is not back in band yet.
+    assert feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND - 1}) == []
+    assert feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND - CHAMBER_HYSTERESIS}) == [
+        EVENT_CHAMBER_IN_BAND
+    ]
+
+
+def test_chamber_band_fires_on_time_without_an_update() -> None:
+    feed = _band_feed()
+    feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND + 5})
+    due = feed.engine.due
+    assert feed.engine.evaluate_due(due - 1, feed.fields) == []
+    alarms = feed.engine.evaluate_due(due, feed.fields)
+    assert [event for event, _ in alarms] == [EVENT_CHAMBER_OUT_OF_BAND]
+    assert alarms[0][1]["minutes"] == MINUTES
+
+
+def test_chamber_back_in_band_cancels_the_pending_alarm() -> None:
+    feed = _band_feed()
+    feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND + 5})
+    feed.update(**{FIELD_CHAMBER_TEMP: 225})
+    assert feed.engine.due is None
+
+
+def test_preheat_and_set_point_changes_do_not_alarm() -> None:
+    feed = Feed(
+        AlarmEngine({}, BAND, MINUTES),
+        {FIELD_MODE: ModeName.RUN, FIELD_SET_TEMP: 225, FIELD_CHAMBER_TEMP: 80},
+    )
+    assert feed.update(MINUTES * 60 + 1, **{FIELD_CHAMBER_TEMP: 150}) == []
+    assert feed.engine.due is None
+    feed.update(**{FIELD_CHAMBER_TEMP: 225})
+    assert feed.update(**{FIELD_SET_TEMP: 350}) == []
+    assert feed.update(MINUTES * 60 + 1, **{FIELD_CHAMBER_TEMP: 260}) == []
+
+
+def test_leaving_run_clears_an_alarm() -> None:
+    feed = _band_feed()
+    feed.update(**{FIELD_CHAMBER_TEMP: 225 + BAND + 5})
+    feed.update(MINUTES * 60, **{FIELD_CHAMBER_TEMP: 225 + BAND + 5.5})
+    assert feed.update(**{FIELD_MODE: ModeName.STANDBY}) == [EVENT_CHAMBER_IN_BAND]
+
+
+def test_fault_raised_and_cleared() -> None:
+    feed = Feed(AlarmEngine({}, 0, MINUTES), {FIELD_FAULT: False})
+    assert feed.update(**{FIELD_FAULT: True}) == [EVENT_FAULT]
+    assert feed.update(**{FIELD_FAULT: False}) == [EVENT_FAULT_CLEARED]
+
+
+def test_fault_fires_one_event_per_edge() -> None:
+    engine = AlarmEngine({}, 0, MINUTES)
+    engine.seed({FIELD_FAULT: False})
+    alarms = engine.evaluate(0, {FIELD_FAULT: True}, {FIELD_FAULT}, 0)
+    assert [event for event, _ in alarms] == [EVENT_FAULT]
+
+
+def test_restored_fault_does_not_fire_again() -> None:
+    engine = AlarmEngine({}, 0, MINUTES)
+    engine.seed({FIELD_FAULT: True})
+    assert engine.evaluate(0, {FIELD_FAULT: True}, {FIELD_FAULT}, 0) == []
+
+
+@pytest.mark.parametrize("field", sorted(TRANSITION_EVENTS))
+def test_transition_events_carry_old_and_new_values(field: str) -> None:
+    engine = AlarmEngine({}, 0, MINUTES)
+    engine.seed({field: "a"})
+    alarms = engine.evaluate(0, {field: "b"}, {field}, 0)
+    data = dict(alarms)[TRANSITION_EVENTS[field]]
+    assert (data["old_value"], data["new_value"]) == ("a", "b")
+
+
+def test_mode_transitions_are_reported_by_name() -> None:
+    engine = AlarmEngine({}, 0, MINUTES)
+    engine.seed({FIELD_MODE: ModeName.STANDBY})
+    alarms = engine.evaluate(0, {FIELD_MODE: ModeName.RUN}, {FIELD_MODE}, 0)
+    data = dict(alarms)[TRANSITION_EVENTS[FIELD_MODE]]
+    assert (data["old_value"], data["new_value"]) == ("STANDBY", "RUN")
+
+
+def test_only_rules_for_changed_fields_run() -> None:
+    engine = AlarmEngine({0: 165}, BAND, MINUTES)
+    fields = {**_probe(170), FIELD_FAULT: True}
+    assert engine.evaluate(0, fields, {"wifi.rssi_dbm"}, 1) == []
+    probe_rules = [rule for rule in engine.as_dict(0) if rule["rule"] == "probe_target"]
+    assert [rule["reached"] for rule in probe_rules] == [None]
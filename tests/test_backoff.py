@@ -0,0 +1,97 @@
+"""Tests for the reconnect backoff and circuit breaker."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.camp_chef import backoff
+from custom_components.camp_chef.backoff import (
+    BACKOFF_BASE,
+    BACKOFF_MAX,
+    BREAKER_PROBE_INTERVAL,
+    BREAKER_THRESHOLD,
+    REARM_MIN_INTERVAL,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    ReconnectBreaker,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(backoff.random, "uniform", lambda low, high: 1.0)
+
+
+def test_closed_breaker_allows_attempts() -> None:
+    breaker = ReconnectBreaker()
+    assert breaker.allow(0.0)
+    assert breaker.retry_in(0.0) == 0.0
+
+
+def test_failures_back_off_exponentially_up_to_the_cap() -> None:
+    breaker = ReconnectBreaker()
+    delays = []
+    for _ in range(BREAKER_THRESHOLD - 1):
+        breaker.record_failure(0.0, "boom")
+        delays.append(breaker.retry_in(0.0))
+    assert delays == [
+        min(BACKOFF_MAX, BACKOFF_BASE * 2**index) for index in range(BREAKER_THRESHOLD - 1)
+    ]
+    assert not breaker.allow(delays[-1] - 1)
+    assert breaker.allow(delays[-1])
+    assert breaker.state == STATE_CLOSED
+
+
+def test_jitter_stays_within_bounds(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(backoff.random, "uniform", lambda low, high: high)
+    breaker = ReconnectBreaker()
+    breaker.record_failure(0.0, "boom")
+    assert breaker.retry_in(0.0) == pytest.approx(BACKOFF_BASE * (1 + backoff.BACKOFF_JITTER))
+
+
+def test_breaker_opens_then_half_opens_for_one_probe() -> None:
+    breaker = ReconnectBreaker()
+    for _ in range(BREAKER_THRESHOLD):
+        breaker.record_failure(0.0, "boom")
+    assert breaker.state == STATE_OPEN
+    assert breaker.retry_in(0.0) == BREAKER_PROBE_INTERVAL
+    assert not breaker.allow(BREAKER_PROBE_INTERVAL - 1)
+    assert breaker.allow(BREAKER_PROBE_INTERVAL)
+    assert breaker.state == STATE_HALF_OPEN
+
+
+def test_success_closes_and_resets() -> None:
+    breaker = ReconnectBreaker()
+    for _ in range(BREAKER_THRESHOLD):
+        breaker.record_failure(0.0, "boom")
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.failures == 0
+    assert breaker.last_error is None
+    assert breaker.allow(0.0)
+
+
+def test_rearm_allows_an_immediate_attempt_once_per_interval() -> None:
+    breaker = ReconnectBreaker()
+    breaker.record_failure(0.0, "boom")
+    assert breaker.rearm(1.0)
+    assert breaker.allow(1.0)
+    breaker.record_failure(2.0, "boom")
+    assert not breaker.rearm(3.0)
+    breaker.record_failure(REARM_MIN_INTERVAL, "boom")
+    assert breaker.rearm(1.0 + REARM_MIN_INTERVAL)
+
+
+def test_rearm_is_a_no_op_when_nothing_is_waiting() -> None:
+    assert not ReconnectBreaker().rearm(100.0)
+
+
+def test_as_dict() -> None:
+    breaker = ReconnectBreaker()
+    breaker.record_failure(0.0, "boom")
+    assert breaker.as_dict(1.0) == {
+        "state": STATE_CLOSED,
+        "failures": 1,
+        "retry_in": BACKOFF_BASE - 1,
+        "last_error": "boom",
+    }
@@ -0,0 +1,129 @@
+"""Tests for the per-grill command queue."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.camp_chef.commands import CommandQueue
+
+
+class Grill:
+    """Executor that records what was written and can be held mid-write."""
+
+    def __init__(self) -> None:
+        self.written: list[tuple[str, dict[str, Any]]] = []
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    def executor(self, kind: str):
+        async def _execute(args: dict[str, Any]) -> str:
+            await self.gate.wait()
+            self.written.append((kind, args))
+            return kind
+
+        return _execute
+
+
+@pytest.fixture
+def grill() -> Grill:
+    return Grill()
+
+
+@pytest.fixture
+def queue(hass: HomeAssistant) -> CommandQueue:
+    return CommandQueue(hass, "Grill", lambda: None)
+
+
+async def test_commands_run_in_submission_order(
+    hass: HomeAssistant, queue: CommandQueue, grill: Grill
+) -> None:
+    results = await asyncio.gather(
+        queue.async_submit("mode", {"mode": "run"}, grill.executor("mode")),
+        queue.async_submit("temp", {"set_temp": 225}, grill.executor("temp")),
+    )
+    assert results == ["mode", "temp"]
+    assert [kind for kind, _ in grill.written] == ["mode", "temp"]
+    assert queue.sent == 2
+    assert queue.depth == 0
+
+
+async def test_waiting_command_is_merged_in_place(
+    hass: HomeAssistant, queue: CommandQueue, grill: Grill
+) -> None:
+    grill.gate.clear()
+    in_flight = hass.async_create_task(
+        queue.async_submit("probe", {}, grill.executor("probe"), coalesce=False)
+    )
+    first = hass.async_create_task(
+        queue.async_submit("temp", {"set_temp": 225, "smoke": 3}, grill.executor("temp"))
+    )
+    mode = hass.async_create_task(
+        queue.async_submit("mode", {"mode": "run"}, grill.executor("mode"))
+    )
+    second = hass.async_create_task(
+        queue.async_submit("temp", {"set_temp": 250, "smoke": None}, grill.executor("temp"))
+    )
+    await asyncio.sleep(0)
+    assert queue.depth == 3
+
+    grill.gate.set()
+    assert await first is False
+    assert await second == "temp"
+    await asyncio.gather(in_flight, mode)
+    # The merged write keeps the first one's place ahead of the mode change.
+    assert grill.written == [
+        ("probe", {}),
+        ("temp", {"set_temp": 250, "smoke": 3}),
+        ("mode", {"mode": "run"}),
+    ]
+    assert queue.superseded == 1
+
+
+async def test_non_coalescing_commands_are_all_sent(
+    hass: HomeAssistant, queue: CommandQueue, grill: Grill
+) -> None:
+    await asyncio.gather(
+        *(
+            queue.async_submit("raw", {"n": n}, grill.executor("raw"), coalesce=False)
+            for n in range(3)
+        )
+    )
+    assert [args["n"] for _, args in grill.written] == [0, 1, 2]
+
+
+async def test_failure_reaches_the_caller_and_the_queue_continues(
+    hass: HomeAssistant, grill: Grill
+) -> None:
+    completed = []
+    queue = CommandQueue(
+        hass, "Grill", lambda: None, lambda kind, latency, ok: completed.append((kind, ok))
+    )
+
+    async def _fail(args: dict[str, Any]) -> None:
+        raise RuntimeError("write failed")
+
+    failing = hass.async_create_task(queue.async_submit("bad", {}, _fail))
+    good = hass.async_create_task(queue.async_submit("temp", {}, grill.executor("temp")))
+    with pytest.raises(RuntimeError):
+        await failing
+    assert await good == "temp"
+    assert completed == [("bad", False), ("temp", True)]
+    assert queue.failed == 1
+
+
+async def test_stop_cancels_waiting_and_in_flight_commands(
+    hass: HomeAssistant, queue: CommandQueue, grill: Grill
+) -> None:
+    grill.gate.clear()
+    in_flight = hass.async_create_task(queue.async_submit("a", {}, grill.executor("a")))
+    waiting = hass.async_create_task(queue.async_submit("b", {}, grill.executor("b")))
+    await asyncio.sleep(0)
+    await queue.async_stop()
+    for task in (in_flight, waiting):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert queue.depth == 0
+    assert grill.written == []
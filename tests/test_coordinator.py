@@ -0,0 +1,236 @@
+"""Tests for the coordinator, against a simulated grill."""
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from homeassistant.components.bluetooth import BluetoothChange
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_component import DATA_INSTANCES
+from homeassistant.util import dt as dt_util
+from pycampchef.const import ModeName
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from benchmarks.simulator import (
+    GrillScript,
+    SimulatedBluetooth,
+    SimulatedCampChefClient,
+    SimulatedGrillError,
+)
+from custom_components.camp_chef.const import CONF_COALESCE_WINDOW, DOMAIN
+from custom_components.camp_chef.coordinator import STORAGE_VERSION, CampChefCoordinator
+from custom_components.camp_chef.state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_MODE,
+    FIELD_SET_TEMP,
+    FIELD_SMOKE_LEVEL,
+    encode_fields,
+    probe_temp_field,
+)
+
+from .conftest import ADDRESS
+
+
+def _entity(hass: HomeAssistant, platform: str, key: str) -> Entity:
+    entity_id = er.async_get(hass).async_get_entity_id(platform, DOMAIN, f"{ADDRESS}_{key}")
+    assert entity_id is not None
+    return hass.data[DATA_INSTANCES][platform].get_entity(entity_id)
+
+
+def _count_writes(monkeypatch: pytest.MonkeyPatch, entity: Entity) -> list[Any]:
+    """Record every state write of ``entity``, changed or not."""
+    writes: list[Any] = []
+    write = entity.async_write_ha_state
+
+    def _write() -> None:
+        writes.append(entity.state)
+        write()
+
+    monkeypatch.setattr(entity, "async_write_ha_state", _write)
+    return writes
+
+
+async def _fail_reconnect(
+    coordinator: CampChefCoordinator, bluetooth: SimulatedBluetooth
+) -> None:
+    """Drop the link and fail a reconnect, so the breaker holds the next one."""
+    client = bluetooth.clients[ADDRESS]
+    client.script.connect_failure_rate = 1.0
+    await coordinator._async_disconnect()
+    await coordinator.async_refresh()
+    client.script.connect_failure_rate = 0.0
+    assert coordinator.breaker.retry_in(time.monotonic()) > 0
+
+
+async def test_advertisement_reconnects_without_waiting_out_the_backoff(
+    hass: HomeAssistant, coordinator: CampChefCoordinator, bluetooth: SimulatedBluetooth
+) -> None:
+    await _fail_reconnect(coordinator, bluetooth)
+    assert not bluetooth.clients[ADDRESS].is_connected
+
+    bluetooth.advertise(ADDRESS)
+    await hass.async_block_till_done()
+    assert bluetooth.clients[ADDRESS].is_connected
+
+
+async def test_unloaded_entry_does_not_reconnect_on_advertisements(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    coordinator: CampChefCoordinator,
+    bluetooth: SimulatedBluetooth,
+) -> None:
+    await _fail_reconnect(coordinator, bluetooth)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert bluetooth.registered == 0
+
+    # A callback that outlived the entry.
+    coordinator._async_handle_advertisement(
+        bluetooth.service_info(ADDRESS), BluetoothChange.ADVERTISEMENT
+    )
+    await hass.async_block_till_done()
+    assert not bluetooth.clients[ADDRESS].is_connected
+    assert coordinator.breaker.retry_in(time.monotonic()) > 0
+
+
+async def test_probe_readings_do_not_rewrite_an_unchanged_eta(
+    hass: HomeAssistant,
+    coordinator: CampChefCoordinator,
+    bluetooth: SimulatedBluetooth,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probe = _count_writes(monkeypatch, _entity(hass, "sensor", "probe_1"))
+    eta = _count_writes(monkeypatch, _entity(hass, "sensor", "probe_1_eta"))
+    client = bluetooth.clients[ADDRESS]
+    for _ in range(5):
+        client.fields[probe_temp_field(0)] += 2
+        await client.async_notify()
+    await hass.async_block_till_done()
+    # No target, so no ETA to move.
+    assert coordinator.probe_eta.get(0, (None, False)) == (None, False)
+    assert probe
+    assert eta == []
+
+
+async def test_entities_only_update_for_their_own_fields(
+    hass: HomeAssistant,
+    coordinator: CampChefCoordinator,
+    bluetooth: SimulatedBluetooth,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probe = _count_writes(monkeypatch, _entity(hass, "sensor", "probe_1"))
+    mode = _count_writes(monkeypatch, _entity(hass, "sensor", "mode"))
+    smoke = _count_writes(monkeypatch, _entity(hass, "number", "smoke_level"))
+    client = bluetooth.clients[ADDRESS]
+
+    client.fields[probe_temp_field(0)] += 10
+    await client.async_notify()
+    assert (len(probe), len(mode), len(smoke)) == (1, 0, 0)
+
+    client.fields[FIELD_SMOKE_LEVEL] = 8
+    await client.async_notify()
+    assert (len(probe), len(mode), smoke) == (1, 0, [8])
+
+    # Nothing changed, nothing is written.
+    await client.async_notify()
+    assert (len(probe), len(mode), len(smoke)) == (1, 0, 1)
+
+
+@pytest.mark.parametrize("options", [{CONF_COALESCE_WINDOW: 1.0}])
+async def test_bursts_coalesce_into_one_write(
+    hass: HomeAssistant,
+    coordinator: CampChefCoordinator,
+    bluetooth: SimulatedBluetooth,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    smoke = _count_writes(monkeypatch, _entity(hass, "number", "smoke_level"))
+    mode = _count_writes(monkeypatch, _entity(hass, "sensor", "mode"))
+    client = bluetooth.clients[ADDRESS]
+    for level in (6, 7, 8):
+        client.fields[FIELD_SMOKE_LEVEL] = level
+        await client.async_notify()
+    assert smoke == []
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1.1))
+    await hass.async_block_till_done()
+    assert smoke == [8]
+
+    # Mode changes are not held back.
+    client.fields[FIELD_MODE] = ModeName.STANDBY
+    await client.async_notify()
+    assert mode == ["STANDBY"]
+
+
+def _target_temperatures(hass: HomeAssistant) -> list[Any]:
+    """Record the climate entity's target temperature as it changes."""
+    entity_id = _entity(hass, "climate", "climate").entity_id
+    targets: list[Any] = []
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if event.data["entity_id"] == entity_id and event.data["new_state"] is not None:
+            targets.append(event.data["new_state"].attributes.get("temperature"))
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    return targets
+
+
+async def test_failed_write_reverts_the_optimistic_value(
+    hass: HomeAssistant, coordinator: CampChefCoordinator, bluetooth: SimulatedBluetooth
+) -> None:
+    targets = _target_temperatures(hass)
+    bluetooth.clients[ADDRESS].script.command_failure_rate = 1.0
+    with pytest.raises(SimulatedGrillError):
+        await coordinator.async_set_temp_smoke(set_temp_f=250)
+    await hass.async_block_till_done()
+    assert targets == [250, 225]
+    assert not coordinator.overlay
+
+
+async def test_confirmed_write_keeps_the_value(
+    hass: HomeAssistant, coordinator: CampChefCoordinator, bluetooth: SimulatedBluetooth
+) -> None:
+    targets = _target_temperatures(hass)
+    assert await coordinator.async_set_temp_smoke(set_temp_f=250)
+    await hass.async_block_till_done()
+    # The grill reported the new value, so nothing is left pending.
+    assert targets == [250]
+    assert not coordinator.overlay
+    assert coordinator.value(FIELD_SET_TEMP) == 250
+
+
+async def test_setup_from_cache_publishes_before_the_first_poll(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    entry: MockConfigEntry,
+    bluetooth: SimulatedBluetooth,
+    script: GrillScript,
+) -> None:
+    fields = SimulatedCampChefClient(SimpleNamespace(address=ADDRESS), script=script).fields
+    fields[FIELD_CHAMBER_TEMP] = 180.0
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": STORAGE_VERSION,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": {"fields": encode_fields(fields)},
+    }
+    # The first poll is still connecting, so only the cache can provide a state.
+    script.connect_latency = 3600
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: CampChefCoordinator = hass.data[DOMAIN][entry.entry_id]
+    assert coordinator.restored
+    assert not bluetooth.clients[ADDRESS].is_connected
+    state = hass.states.get(_entity(hass, "climate", "climate").entity_id)
+    assert state.attributes["current_temperature"] == 180
+    assert state.attributes["temperature"] == 225
+    await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,81 @@
+"""Tests for the probe time-to-target estimator."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.camp_chef.eta import (
+    RATE_SAMPLE_INTERVAL,
+    STALL_DURATION,
+    STALL_MIN_TEMP,
+    ProbeEstimator,
+)
+
+
+def _rise(
+    estimator: ProbeEstimator, start: float, temp: float, per_minute: float, minutes: int
+) -> tuple[float, float]:
+    """Feed one reading every 10 s; return the end time and temperature."""
+    now = start
+    for _ in range(minutes * 6):
+        now += 10
+        temp += per_minute / 6
+        estimator.add(now, temp)
+    return now, temp
+
+
+def test_no_eta_without_a_target_or_a_rate() -> None:
+    estimator = ProbeEstimator()
+    _rise(estimator, 0, 100, 1, 10)
+    assert estimator.remaining() is None
+
+    estimator = ProbeEstimator(target=200)
+    estimator.add(0, 100)
+    assert estimator.rate is None
+    assert estimator.remaining() is None
+
+
+def test_rate_is_only_measured_over_the_sample_interval() -> None:
+    estimator = ProbeEstimator(target=200)
+    estimator.add(0, 100)
+    estimator.add(RATE_SAMPLE_INTERVAL - 1, 110)
+    assert estimator.rate is None
+    estimator.add(RATE_SAMPLE_INTERVAL, 101)
+    assert estimator.rate == pytest.approx(1)
+
+
+def test_eta_from_a_steady_rise() -> None:
+    estimator = ProbeEstimator(target=203)
+    _now, temp = _rise(estimator, 0, 100, 1, 30)
+    assert estimator.rate == pytest.approx(1, rel=0.01)
+    assert estimator.remaining() == pytest.approx((203 - temp) * 60, rel=0.01)
+
+
+def test_reached_target_reports_zero() -> None:
+    estimator = ProbeEstimator(target=120)
+    _rise(estimator, 0, 100, 1, 30)
+    assert estimator.remaining() == 0
+
+
+def test_stall_is_detected_and_suppresses_the_eta() -> None:
+    estimator = ProbeEstimator(target=203)
+    now, temp = _rise(estimator, 0, STALL_MIN_TEMP + 20, 1, 10)
+    assert not estimator.stalled
+    # The smoothed rate takes a while to decay before the stall clock starts.
+    now, _ = _rise(estimator, now, temp, 0, int(STALL_DURATION / 60) + 60)
+    assert estimator.stalled
+    assert estimator.remaining() is None
+
+
+def test_no_stall_below_the_stall_temperature() -> None:
+    estimator = ProbeEstimator(target=203)
+    _rise(estimator, 0, STALL_MIN_TEMP - 30, 0, int(STALL_DURATION / 60) + 30)
+    assert not estimator.stalled
+
+
+def test_unplugged_probe_starts_over() -> None:
+    estimator = ProbeEstimator(target=203)
+    _rise(estimator, 0, 100, 1, 10)
+    estimator.add(1000, None)
+    assert estimator.temp is None
+    assert estimator.rate is None
+    assert estimator.remaining() is None
@@ -0,0 +1,41 @@
+"""Tests for setting up and unloading config entries."""
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from benchmarks.simulator import GrillScript, SimulatedBluetooth
+from custom_components.camp_chef.const import DATA_CONNECTIONS, DOMAIN
+
+from .conftest import ADDRESS
+
+
+async def test_setup_and_unload(
+    hass: HomeAssistant, entry: MockConfigEntry, bluetooth: SimulatedBluetooth
+) -> None:
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.LOADED
+    assert bluetooth.clients[ADDRESS].is_connected
+    assert bluetooth.registered
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not bluetooth.clients[ADDRESS].is_connected
+    assert bluetooth.registered == 0
+
+
+async def test_failed_first_refresh_leaves_nothing_behind(
+    hass: HomeAssistant,
+    entry: MockConfigEntry,
+    bluetooth: SimulatedBluetooth,
+    script: GrillScript,
+) -> None:
+    script.fail_first_connects = 1000
+    assert not await hass.config_entries.async_setup(entry.entry_id)
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+    assert entry.entry_id not in hass.data[DOMAIN]
+    assert bluetooth.registered == 0
+    slots = hass.data[DOMAIN][DATA_CONNECTIONS].as_dict()
+    assert all(adapter["in_use"] == 0 for adapter in slots.values())
+    # Cancels the scheduled setup retry.
+    await hass.config_entries.async_unload(entry.entry_id)
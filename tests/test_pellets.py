@@ -0,0 +1,116 @@
+"""Tests for the pellet burn-rate model."""
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pycampchef.const import ModeName
+
+from custom_components.camp_chef.pellets import (
+    MAX_COVARIANCE_TRACE,
+    MAX_WINDOW,
+    MIN_OBSERVATIONS,
+    RATE_STEP,
+    PelletEstimator,
+)
+from custom_components.camp_chef.state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_FAN_LEVEL,
+    FIELD_MODE,
+    FIELD_PELLET_LEVEL,
+    FIELD_SET_TEMP,
+)
+
+
+def _fields(level: float, set_temp: int = 225, mode: ModeName = ModeName.RUN) -> dict[str, Any]:
+    return {
+        FIELD_MODE: mode,
+        FIELD_SET_TEMP: set_temp,
+        FIELD_CHAMBER_TEMP: set_temp,
+        FIELD_FAN_LEVEL: 3,
+        FIELD_PELLET_LEVEL: int(level),
+    }
+
+
+def _burn(
+    estimator: PelletEstimator,
+    hours: float,
+    rate: float,
+    set_temp: int = 225,
+    start: float = 0.0,
+    level: float = 100.0,
+) -> tuple[float, float]:
+    """Feed a reading every 30 s of a steady burn; return the end time and level."""
+    now = start
+    for _ in range(int(hours * 120)):
+        now += 30
+        level -= rate / 120
+        estimator.add(now, _fields(level, set_temp))
+    return now, level
+
+
+def test_no_estimate_outside_run() -> None:
+    estimator = PelletEstimator()
+    assert not estimator.add(0, _fields(80, mode=ModeName.STANDBY))
+    assert estimator.rate is None
+    assert estimator.hours is None
+
+
+def test_no_estimate_before_enough_measurements() -> None:
+    estimator = PelletEstimator()
+    _burn(estimator, hours=0.5, rate=4)
+    assert estimator.observations < MIN_OBSERVATIONS
+    assert estimator.rate is None
+
+
+def test_learns_a_steady_burn_rate() -> None:
+    estimator = PelletEstimator()
+    _burn(estimator, hours=12, rate=4, level=100)
+    assert estimator.observations >= MIN_OBSERVATIONS
+    assert estimator.rate == pytest.approx(4, abs=RATE_STEP)
+    assert estimator.hours is not None
+
+
+def test_learns_how_the_rate_depends_on_the_set_temperature() -> None:
+    estimator = PelletEstimator()
+    now = 0.0
+    for _ in range(3):
+        now, _ = _burn(estimator, hours=4, rate=3, set_temp=225, start=now, level=100)
+        now, level = _burn(estimator, hours=4, rate=6, set_temp=350, start=now, level=100)
+    assert estimator.rate == pytest.approx(6, abs=RATE_STEP)
+    estimator.add(now + 30, _fields(level, 225))
+    assert estimator.rate == pytest.approx(3, abs=RATE_STEP)
+
+
+def test_window_without_a_drop_is_not_learned() -> None:
+    estimator = PelletEstimator()
+    estimator.add(0, _fields(80))
+    estimator.add(MAX_WINDOW + 1, _fields(80))
+    assert estimator.observations == 0
+
+
+def test_refill_restarts_the_measurement() -> None:
+    estimator = PelletEstimator()
+    estimator.add(0, _fields(20))
+    estimator.add(900, _fields(90))
+    assert estimator.observations == 0
+    estimator.add(1800, _fields(89))
+    assert estimator.observations == 1
+    assert estimator.weights[0] > 0
+
+
+def test_covariance_stays_bounded_at_one_set_point() -> None:
+    estimator = PelletEstimator()
+    _burn(estimator, hours=48, rate=4, level=1000)
+    trace = sum(estimator.covariance[index][index] for index in range(4))
+    assert trace <= MAX_COVARIANCE_TRACE + 1e-6
+
+
+def test_store_round_trip() -> None:
+    estimator = PelletEstimator()
+    _burn(estimator, hours=12, rate=4)
+    restored = PelletEstimator()
+    restored.load(estimator.as_store())
+    assert restored.weights == estimator.weights
+    assert restored.covariance == estimator.covariance
+    assert restored.observations == estimator.observations
@@ -0,0 +1,246 @@
+"""Tests for multi-step cook programs."""
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pycampchef.const import ModeName
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.camp_chef import programs
+from custom_components.camp_chef.programs import (
+    STATUS_FINISHED,
+    STATUS_IDLE,
+    STATUS_RUNNING,
+    CookProgram,
+    ProgramStep,
+)
+from custom_components.camp_chef.state import (
+    FIELD_CHAMBER_TEMP,
+    FIELD_MODE,
+    FIELD_SET_TEMP,
+    probe_temp_field,
+)
+
+
+class Grill:
+    """Fields the program reads and the steps it applied."""
+
+    def __init__(self) -> None:
+        self.fields: dict[str, Any] = {
+            FIELD_MODE: ModeName.RUN,
+            FIELD_SET_TEMP: 225,
+            FIELD_CHAMBER_TEMP: 225,
+        }
+        self.applied: list[str | None] = []
+        self.running = True
+        self.changes = 0
+
+    async def apply(self, step: ProgramStep) -> bool:
+        if (step.set_temp is not None or step.smoke_level is not None) and not self.running:
+            return False
+        self.applied.append(step.name)
+        return True
+
+    def on_change(self) -> None:
+        self.changes += 1
+
+
+@pytest.fixture
+def grill() -> Grill:
+    return Grill()
+
+
+@pytest.fixture
+def program(hass: HomeAssistant, grill: Grill) -> CookProgram:
+    return CookProgram(hass, "Grill", grill.apply, grill.on_change, lambda: grill.fields)
+
+
+async def _update(
+    hass: HomeAssistant, program: CookProgram, grill: Grill, values: dict[str, Any]
+) -> None:
+    grill.fields.update(values)
+    program.observe(grill.fields, set(values))
+    await hass.async_block_till_done()
+
+
+def test_step_round_trip() -> None:
+    step = ProgramStep(name="smoke", set_temp=180, smoke_level=8, minutes=90)
+    assert step.as_dict() == {"name": "smoke", "set_temp": 180, "smoke_level": 8, "minutes": 90}
+    assert ProgramStep.from_dict(step.as_dict()) == step
+
+
+@pytest.mark.parametrize(
+    ("step", "fields", "expected"),
+    [
+        # Heading up to a set temperature above the trigger.
+        (ProgramStep(set_temp=250, chamber_temp=240), {FIELD_CHAMBER_TEMP: 180}, (240, True)),
+        # A cool-down: the set temperature is below the trigger.
+        (ProgramStep(set_temp=180, chamber_temp=190), {FIELD_CHAMBER_TEMP: 250}, (190, False)),
+        # No set temperature in the step: the grill's own one decides.
+        (
+            ProgramStep(chamber_temp=190),
+            {FIELD_SET_TEMP: 160, FIELD_CHAMBER_TEMP: 250},
+            (190, False),
+        ),
+        # Nothing to go by but the chamber.
+        (ProgramStep(chamber_temp=190), {FIELD_CHAMBER_TEMP: 250}, (190, False)),
+        (ProgramStep(chamber_temp=190), {}, (190, True)),
+    ],
+)
+def test_chamber_trigger_direction(
+    step: ProgramStep, fields: dict[str, Any], expected: tuple[float, bool]
+) -> None:
+    assert step.triggers(fields) == {FIELD_CHAMBER_TEMP: expected}
+
+
+def test_probe_triggers_rise() -> None:
+    step = ProgramStep(probe=2, probe_temp=165)
+    assert step.triggers({}) == {probe_temp_field(1): (165, True)}
+
+
+async def test_steps_advance_on_temperature_in_either_direction(
+    hass: HomeAssistant, program: CookProgram, grill: Grill
+) -> None:
+    program.async_start(
+        [
+            ProgramStep(name="cool", set_temp=180, chamber_temp=190),
+            ProgramStep(name="ramp", set_temp=250, chamber_temp=240),
+            ProgramStep(name="probe", probe=1, probe_temp=165),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert program.index == 0
+    assert grill.applied == ["cool"]
+
+    await _update(hass, program, grill, {FIELD_SET_TEMP: 180, FIELD_CHAMBER_TEMP: 200})
+    assert program.index == 0
+    await _update(hass, program, grill, {FIELD_CHAMBER_TEMP: 190})
+    assert program.index == 1
+
+    await _update(hass, program, grill, {FIELD_SET_TEMP: 250, FIELD_CHAMBER_TEMP: 239})
+    assert program.index == 1
+    await _update(hass, program, grill, {FIELD_CHAMBER_TEMP: 241})
+    assert program.index == 2
+
+    await _update(hass, program, grill, {probe_temp_field(0): 166})
+    assert program.status == STATUS_FINISHED
+    assert grill.applied == ["cool", "ramp", "probe"]
+
+
+async def test_step_already_met_is_skipped_without_applying(
+    hass: HomeAssistant, program: CookProgram, grill: Grill
+) -> None:
+    grill.fields[FIELD_CHAMBER_TEMP] = 260
+    program.async_start(
+        [
+            ProgramStep(name="ramp", set_temp=250, chamber_temp=240),
+            ProgramStep(name="hold", minutes=30),
+        ]
+    )
+    await hass.async_block_till_done()
+    assert program.index == 1
+    assert grill.applied == ["hold"]
+    program.async_stop()
+
+
+async def test_last_step_already_met_finishes(
+    hass: HomeAssistant, program: CookProgram, grill: Grill
+) -> None:
+    grill.fields[FIELD_CHAMBER_TEMP] = 260
+    program.async_start([ProgramStep(name="ramp", set_temp=250, chamber_temp=240)])
+    await hass.async_block_till_done()
+    assert program.status == STATUS_FINISHED
+    assert grill.applied == []
+
+
+async def test_timed_step_advances_on_its_timer(
+    hass: HomeAssistant, program: CookProgram, grill: Grill
+) -> None:
+    program.async_start([ProgramStep(name="smoke", minutes=1), ProgramStep(name="hold")])
+    await hass.async_block_till_done()
+    assert program.index == 0
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=1, seconds=1))
+    await hass.async_block_till_done()
+    assert program.index == 1
+    assert grill.applied == ["smoke", "hold"]
+
+
+async def test_step_waits_for_the_grill_to_run(
+    hass: HomeAssistant, program: CookProgram, grill: Grill
+) -> None:
+    grill.running = False
+    grill.fields[FIELD_MODE] = ModeName.STANDBY
+    program.async_start([ProgramStep(name="smoke", set_temp=180)])
+    await hass.async_block_till_done()
+    assert grill.applied == []
+
+    grill.running = True
+    await _update(hass, program, grill, {FIELD_MODE: ModeName.RUN})
+    assert grill.applied == ["smoke"]
+
+
+async def test_stop_and_skip(hass: HomeAssistant, program: CookProgram, grill: Grill) -> None:
+    program.async_start([ProgramStep(name="a"), ProgramStep(name="b")])
+    program.async_skip()
+    assert program.index == 1
+    program.async_stop()
+    assert program.status == STATUS_IDLE
+    assert program.step is None
+    program.async_skip()
+    assert program.status == STATUS_IDLE
+
+
+async def test_resume_keeps_elapsed_time_and_reapplies_once_live(
+    hass: HomeAssistant,
+    grill: Grill,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    saved = CookProgram(hass, "Grill", grill.apply, grill.on_change, lambda: grill.fields)
+    saved.async_start([ProgramStep(name="smoke", minutes=10), ProgramStep(name="hold")])
+    await hass.async_block_till_done()
+    store = saved.as_store()
+    saved.async_shutdown()
+
+    # Restarted eight minutes later.
+    started = store["step_started"]
+    monkeypatch.setattr(programs, "time", SimpleNamespace(time=lambda: started + 480))
+    grill.applied.clear()
+    restored = CookProgram(hass, "Grill", grill.apply, grill.on_change, lambda: grill.fields)
+    restored.load(store)
+    restored.async_resume()
+    assert restored.status == STATUS_RUNNING
+    assert grill.applied == []
+
+    await _update(hass, restored, grill, {FIELD_CHAMBER_TEMP: 226})
+    assert grill.applied == ["smoke"]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=2, seconds=1))
+    await hass.async_block_till_done()
+    assert restored.index == 1
+    restored.async_stop()
+
+
+async def test_resumed_step_met_while_down_is_skipped(
+    hass: HomeAssistant, grill: Grill
+) -> None:
+    saved = CookProgram(hass, "Grill", grill.apply, grill.on_change, lambda: grill.fields)
+    saved.async_start(
+        [ProgramStep(name="ramp", set_temp=250, chamber_temp=240), ProgramStep(name="hold")]
+    )
+    await hass.async_block_till_done()
+    store = saved.as_store()
+    saved.async_shutdown()
+
+    grill.applied.clear()
+    restored = CookProgram(hass, "Grill", grill.apply, grill.on_change, lambda: grill.fields)
+    restored.load(store)
+    restored.async_resume()
+    await _update(hass, restored, grill, {FIELD_SET_TEMP: 250, FIELD_CHAMBER_TEMP: 245})
+    assert restored.index == 1
+    assert grill.applied == ["hold"]
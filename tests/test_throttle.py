@@ -0,0 +1,98 @@
+"""Tests for the temperature publish throttle."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.camp_chef import throttle
+from custom_components.camp_chef.throttle import TemperatureThrottle
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(throttle.time, "monotonic", clock)
+    return clock
+
+
+def test_first_reading_and_unknown_transitions_publish(clock: Clock) -> None:
+    gate = TemperatureThrottle(deadband=2, min_interval=10, max_interval=60)
+    assert gate.offer(200.0)
+    assert gate.offer(None)
+    assert gate.value is None
+    assert gate.offer(201.0)
+    assert not gate.offer(201.0)
+
+
+def test_small_moves_wait_for_max_interval(clock: Clock) -> None:
+    gate = TemperatureThrottle(deadband=2, min_interval=10, max_interval=60)
+    gate.offer(200.0)
+    clock.now += 30
+    assert not gate.offer(201.0)
+    clock.now += 30
+    assert gate.offer(201.0)
+    assert gate.value == 201.0
+
+
+def test_large_moves_wait_for_min_interval(clock: Clock) -> None:
+    gate = TemperatureThrottle(deadband=2, min_interval=10, max_interval=60)
+    gate.offer(200.0)
+    clock.now += 5
+    assert not gate.offer(205.0)
+    clock.now += 5
+    assert gate.offer(205.0)
+
+
+def test_zero_max_interval_holds_small_moves(clock: Clock) -> None:
+    gate = TemperatureThrottle(deadband=2, min_interval=0, max_interval=0)
+    gate.offer(200.0)
+    clock.now += 3600
+    assert not gate.offer(201.0)
+    assert gate.offer(202.0)
+
+
+async def test_suppressed_reading_is_published_on_a_timer(
+    hass: HomeAssistant, clock: Clock
+) -> None:
+    writes = []
+    gate = TemperatureThrottle(deadband=2, min_interval=10, max_interval=60)
+    detach = gate.async_attach(hass, lambda: writes.append(gate.value))
+    gate.offer(200.0)
+    clock.now += 1
+    assert not gate.offer(205.0)
+    # A burst only keeps its last value.
+    assert not gate.offer(207.0)
+
+    clock.now += 9
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert writes == [207.0]
+    detach()
+
+
+async def test_detach_cancels_the_pending_publish(
+    hass: HomeAssistant, clock: Clock
+) -> None:
+    writes = []
+    gate = TemperatureThrottle(deadband=2, min_interval=10, max_interval=60)
+    detach = gate.async_attach(hass, lambda: writes.append(gate.value))
+    gate.offer(200.0)
+    gate.offer(205.0)
+    detach()
+
+    clock.now += 10
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert writes == []